@@ -0,0 +1,35 @@
+"""
+Compares validating a large array of floats element by element (`safe_validate_many`)
+and with vectorized operations (`validate_array`). Requires NumPy.
+"""
+
+import time
+
+import numpy as np
+
+import zon
+
+SIZE = 1_000_000
+
+validator = zon.number().gte(0).lt(1000).finite()
+
+
+def main():
+    rng = np.random.default_rng(0)
+    array = rng.uniform(-10, 1010, SIZE)
+    values = array.tolist()
+
+    start = time.perf_counter()
+    validator.safe_validate_many(values)
+    per_element = time.perf_counter() - start
+
+    start = time.perf_counter()
+    validator.validate_array(array)
+    vectorized = time.perf_counter() - start
+
+    print(f"safe_validate_many {per_element * 1000:>10.1f} ms")
+    print(f"validate_array     {vectorized * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
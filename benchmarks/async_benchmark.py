@@ -0,0 +1,34 @@
+"""
+Measures `async_validate` on a list whose elements have an async refinement
+that waits for 1ms (e.g. a lookup in a local service), for an increasing concurrency limit.
+"""
+
+import asyncio
+import time
+
+import zon
+
+SIZE = 1000
+
+
+async def lookup(value):
+    await asyncio.sleep(0.001)
+    return True
+
+
+schema = zon.element_list(zon.number().int().refine_async(lookup))
+
+
+async def main():
+    data = list(range(SIZE))
+
+    for concurrency in [1, 16, 64, 256]:
+        start = time.perf_counter()
+        await schema.async_validate(data, concurrency=concurrency)
+        elapsed = time.perf_counter() - start
+
+        print(f"concurrency {concurrency:<4} {elapsed * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+"""
+Compares validating a batch of records with `safe_validate` in a loop and with `safe_validate_many`.
+"""
+
+import timeit
+
+import zon
+
+NUMBER = 5
+SIZE = 10_000
+
+schema = zon.record(
+    {
+        "id": zon.number().int().positive(),
+        "name": zon.string().min(1),
+        "tags": zon.element_list(zon.string()),
+    }
+)
+
+batch = [{"id": i + 1, "name": f"name {i}", "tags": ["a", "b"]} for i in range(SIZE)]
+
+
+def loop():
+    return [schema.safe_validate(data) for data in batch]
+
+
+def many():
+    return schema.safe_validate_many(batch)
+
+
+def main():
+    for label, fn in (("safe_validate loop", loop), ("safe_validate_many", many)):
+        timing = min(timeit.repeat(fn, number=NUMBER, repeat=3))
+
+        print(f"{label:<20} {timing * 1e6 / NUMBER / SIZE:>8.2f} us per record")
+
+
+if __name__ == "__main__":
+    main()
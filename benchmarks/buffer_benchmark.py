@@ -0,0 +1,46 @@
+"""
+Compares validating a typed buffer of numbers by converting it to a list (`element_list`)
+and in place (`zon.buffer`), from an `array.array` and from a memory-mapped file.
+"""
+
+import array
+import mmap
+import tempfile
+import time
+
+import zon
+
+SIZE = 1_000_000
+
+element = zon.number().gte(0).lt(1).finite()
+as_list = zon.element_list(element)
+as_buffer = zon.buffer("d", element=element)
+
+
+def timed(name, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<28} {elapsed * 1000:>8.1f} ms")
+
+
+def main():
+    data = array.array("d", ((i % 1000) / 1000 for i in range(SIZE)))
+
+    # NumPy, if installed, is imported on first use
+    as_buffer.validate(array.array("d"))
+
+    timed("element_list(list(data))", lambda: as_list.validate(list(data)))
+    timed("buffer (array)", lambda: as_buffer.validate(data))
+
+    with tempfile.TemporaryFile() as file:
+        data.tofile(file)
+        file.flush()
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            timed("buffer (mmap)", lambda: as_buffer.validate(mapped))
+
+
+if __name__ == "__main__":
+    main()
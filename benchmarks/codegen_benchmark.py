@@ -0,0 +1,72 @@
+"""
+Compares the interpreted validation tree (`safe_validate`) against the closure-based
+(`compile`) and source-generated (`codegen`) backends.
+
+The schemas are the same ones used throughout the test-suite.
+"""
+
+import timeit
+
+import zon
+
+NUMBER = 20_000
+
+person = zon.record(
+    {
+        "name": zon.string().min(1),
+        "age": zon.number().int().positive(),
+    }
+)
+
+schemas = {
+    "string": (zon.string().min(2).max(5), "abcd"),
+    "number": (zon.number().int().positive().lte(150), 42),
+    "record": (person, {"name": "John", "age": 1}),
+    "list": (zon.element_list(zon.string()).max(10), ["a", "b", "c", "d", "e"]),
+    "tuple": (zon.element_tuple([zon.number(), zon.string()]), (1, "a")),
+    "union": (zon.union([zon.string(), zon.number()]), 1),
+    "nested": (
+        zon.record(
+            {
+                "owner": person,
+                "members": zon.element_list(person),
+                "tags": zon.element_list(zon.string().max(10)),
+            }
+        ),
+        {
+            "owner": {"name": "John", "age": 1},
+            "members": [{"name": f"user{i}", "age": i + 1} for i in range(20)],
+            "tags": ["a", "b", "c"],
+        },
+    ),
+}
+
+
+def main():
+    print(
+        f"{'schema':<10}{'safe_validate':>16}{'compile':>12}{'codegen':>12}{'speedup':>10}"
+    )
+
+    for name, (schema, data) in schemas.items():
+        compiled = schema.compile()
+        generated = schema.codegen()
+
+        assert compiled(data) == generated(data) == schema.safe_validate(data)
+
+        interpreted_time = timeit.timeit(
+            lambda: schema.safe_validate(data), number=NUMBER
+        )
+        compiled_time = timeit.timeit(lambda: compiled(data), number=NUMBER)
+        generated_time = timeit.timeit(lambda: generated(data), number=NUMBER)
+
+        print(
+            f"{name:<10}"
+            f"{interpreted_time * 1e6 / NUMBER:>13.2f} us"
+            f"{compiled_time * 1e6 / NUMBER:>9.2f} us"
+            f"{generated_time * 1e6 / NUMBER:>9.2f} us"
+            f"{interpreted_time / generated_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compares validating a batch of records row by row (`safe_validate_many`) and column by column
+(`safe_validate_columns`), from rows and from NumPy columns.
+"""
+
+import time
+
+import zon
+
+SIZE = 200_000
+
+schema = zon.record(
+    {
+        "id": zon.number().int().positive(),
+        "reading": zon.number().gte(0).lt(1000).finite(),
+        "unit": zon.enum(["c", "f", "k"]),
+        "ok": zon.boolean(),
+    }
+)
+
+
+def timed(name, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<28} {elapsed * 1000:>8.1f} ms")
+
+
+def main():
+    rows = [
+        {
+            "id": i + 1,
+            "reading": (i % 1000) * 0.5,
+            "unit": "cfk"[i % 3],
+            "ok": i % 2 == 0,
+        }
+        for i in range(SIZE)
+    ]
+
+    timed("safe_validate_many", lambda: schema.safe_validate_many(rows))
+    timed("safe_validate_columns (rows)", lambda: schema.safe_validate_columns(rows))
+
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return
+
+    columns = {
+        "id": np.arange(1, SIZE + 1),
+        "reading": np.array([row["reading"] for row in rows]),
+        "unit": np.array([row["unit"] for row in rows]),
+        "ok": np.array([row["ok"] for row in rows]),
+    }
+
+    timed(
+        "safe_validate_columns (numpy)", lambda: schema.safe_validate_columns(columns)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Measures the cost of copying the data under validation on deeply nested records,
+for each of the available copy strategies.
+"""
+
+import sys
+import timeit
+
+import zon
+
+NUMBER = 200
+
+
+def nested_schema(depth: int) -> zon.ZonRecord:
+    schema = zon.record({"value": zon.number(), "tags": zon.element_list(zon.string())})
+
+    for _ in range(depth - 1):
+        schema = schema.extend({"child": schema})
+
+    return schema
+
+
+def nested_data(depth: int) -> dict:
+    data = {"value": depth, "tags": ["a", "b", "c"]}
+
+    for i in range(depth - 1):
+        data = {"value": i, "tags": ["a", "b", "c"], "child": data}
+
+    return data
+
+
+def main():
+    sys.setrecursionlimit(10_000)
+
+    strategies = ("deep", "on_write", "none")
+
+    print(f"{'depth':<8}" + "".join(f"{strategy:>14}" for strategy in strategies))
+
+    for depth in (10, 50, 100, 200):
+        schema = nested_schema(depth)
+        data = nested_data(depth)
+
+        timings = [
+            timeit.timeit(
+                lambda strategy=strategy: schema.safe_validate(data, copy=strategy),
+                number=NUMBER,
+            )
+            for strategy in strategies
+        ]
+
+        print(
+            f"{depth:<8}"
+            + "".join(f"{timing * 1e6 / NUMBER:>11.1f} us" for timing in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Compares validating a pandas DataFrame by converting it to records (`safe_validate_many`)
+and column by column (`validate_frame`).
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+import zon
+
+SIZE = 500_000
+
+schema = zon.record(
+    {
+        "id": zon.number().int().positive(),
+        "reading": zon.number().gte(0).lt(1000).finite(),
+        "unit": zon.enum(["c", "f", "k"]),
+        "ok": zon.boolean(),
+    }
+)
+
+
+def timed(name, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<32} {elapsed * 1000:>8.1f} ms")
+
+
+def main():
+    index = np.arange(SIZE)
+    frame = pd.DataFrame(
+        {
+            "id": index + 1,
+            "reading": (index % 1000) * 0.5,
+            "unit": np.array(["c", "f", "k"], dtype=object)[index % 3],
+            "ok": index % 2 == 0,
+        }
+    )
+
+    timed(
+        "to_dict + safe_validate_many",
+        lambda: schema.safe_validate_many(frame.to_dict("records")),
+    )
+    timed("validate_frame (pandas)", lambda: schema.validate_frame(frame))
+
+    try:
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return
+
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+
+    timed("validate_frame (pyarrow)", lambda: schema.validate_frame(table))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Compares `safe_validate` with the boolean-only `is_valid`, on valid and on invalid data.
+"""
+
+import timeit
+
+import zon
+
+NUMBER = 2_000
+
+schema = zon.record(
+    {
+        "id": zon.number().int().positive(),
+        "name": zon.string().min(1).max(64),
+        "email": zon.string().email(),
+        "tags": zon.element_list(zon.string().min(1)),
+        "address": zon.record(
+            {"street": zon.string(), "city": zon.string(), "zip": zon.string()}
+        ),
+    }
+).strict()
+
+VALID = {
+    "id": 1,
+    "name": "Jane",
+    "email": "jane@example.com",
+    "tags": ["a", "b", "c"] * 10,
+    "address": {"street": "Main St", "city": "Springfield", "zip": "12345"},
+}
+
+# fails early and in many places
+INVALID = {
+    "id": -1,
+    "name": "",
+    "email": "not an email",
+    "tags": [""] * 30,
+    "address": {"street": 1, "city": 2, "zip": 3},
+    "extra": True,
+}
+
+
+def main():
+    print(f"{'data':<10}{'safe_validate':>16}{'is_valid':>14}")
+
+    for label, data in (("valid", VALID), ("invalid", INVALID)):
+        timings = [
+            min(timeit.repeat(lambda: schema.safe_validate(data), number=NUMBER)),
+            min(timeit.repeat(lambda: schema.is_valid(data), number=NUMBER)),
+        ]
+
+        print(
+            f"{label:<10}"
+            + "".join(
+                f"{timing * 1e6 / NUMBER:>{width}.1f} us"
+                for timing, width in zip(timings, (13, 11))
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
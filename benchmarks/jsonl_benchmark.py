@@ -0,0 +1,53 @@
+"""
+Measures the throughput of `validate_jsonl` on a generated file of JSON lines,
+for an increasing number of workers.
+"""
+
+import json
+import os
+import tempfile
+
+import zon
+
+SIZE = 200_000
+
+schema = zon.record(
+    {
+        "id": zon.number().int().positive(),
+        "email": zon.string().email(),
+        "tags": zon.element_list(zon.string().min(1).max(16)),
+        "scores": zon.element_list(zon.number().gte(0).lte(100)),
+    }
+)
+
+
+def write_rows(file):
+    for i in range(SIZE):
+        row = {
+            "id": i + 1,
+            "email": f"user{i}@example.com",
+            "tags": ["a", "b", "c"],
+            "scores": [i % 100] * 10,
+        }
+        file.write(json.dumps(row) + "\n")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rows.jsonl")
+
+        with open(path, "w", encoding="utf-8") as file:
+            write_rows(file)
+
+        for workers in [None, *sorted({1, 2, 4, os.cpu_count() or 1})]:
+            report = zon.validate_jsonl(path, schema, workers=workers)
+            name = "in-process" if workers is None else f"{workers} workers"
+
+            print(
+                f"{name:<12} {report.records_per_second:>12,.0f} records/s"
+                f" {report.bytes_per_second / 2**20:>8.1f} MiB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
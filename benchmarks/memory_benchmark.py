@@ -0,0 +1,77 @@
+"""
+Measures, with tracemalloc, how much memory schema nodes, validation rules, issues and
+validation contexts take per object, compared with equivalent objects that have a `__dict__`.
+"""
+
+import tracemalloc
+
+import zon
+from zon import ValidationContext, ValidationRule
+from zon.error import ZonIssue
+
+NUMBER = 10_000
+
+
+def unslotted(cls: type) -> type:
+    """A subclass of `cls` whose instances have a `__dict__`"""
+
+    return type(f"Unslotted{cls.__name__}", (cls,), {})
+
+
+def per_object(factory) -> float:
+    tracemalloc.start()
+
+    before = tracemalloc.take_snapshot()
+    objects = [factory() for _ in range(NUMBER)]
+    after = tracemalloc.take_snapshot()
+
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    # the list holding the objects is not part of their footprint
+    size -= objects.__sizeof__()
+
+    return size / NUMBER
+
+
+def main():
+    rule_fn = lambda data: (data, True)  # pylint: disable=unnecessary-lambda-assignment
+
+    cases = {
+        "ZonString": lambda cls: cls(),
+        "ZonNumber": lambda cls: cls(),
+        "ZonList": lambda cls: cls(None),
+        "ZonRecord": lambda cls: cls({}),
+        "ValidationRule": lambda cls: cls("rule", rule_fn),
+        "ZonIssue": lambda cls: cls(value=1, code="not_a_string", path=[]),
+        "ValidationContext": lambda cls: cls(),
+    }
+
+    classes = {
+        "ZonString": zon.ZonString,
+        "ZonNumber": zon.ZonNumber,
+        "ZonList": zon.ZonList,
+        "ZonRecord": zon.ZonRecord,
+        "ValidationRule": ValidationRule,
+        "ZonIssue": ZonIssue,
+        "ValidationContext": ValidationContext,
+    }
+
+    print(f"{'class':<20}{'slots':>12}{'__dict__':>12}{'saved':>10}")
+
+    for name, factory in cases.items():
+        cls = classes[name]
+
+        slotted_size = per_object(lambda: factory(cls))
+        unslotted_cls = unslotted(cls)
+        unslotted_size = per_object(lambda: factory(unslotted_cls))
+
+        print(
+            f"{name:<20}{slotted_size:>10.0f} B{unslotted_size:>10.0f} B"
+            f"{1 - slotted_size / unslotted_size:>10.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
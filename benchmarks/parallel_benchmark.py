@@ -0,0 +1,49 @@
+"""
+Measures the throughput of `safe_validate_many` over a pool of worker processes,
+for an increasing number of workers.
+"""
+
+import os
+import time
+
+import zon
+
+SIZE = 200_000
+
+schema = zon.record(
+    {
+        "id": zon.number().int().positive(),
+        "email": zon.string().email(),
+        "tags": zon.element_list(zon.string().min(1).max(16)),
+        "scores": zon.element_list(zon.number().gte(0).lte(100)),
+    }
+)
+
+
+def rows():
+    for i in range(SIZE):
+        yield {
+            "id": i + 1,
+            "email": f"user{i}@example.com",
+            "tags": ["a", "b", "c"],
+            "scores": [i % 100] * 10,
+        }
+
+
+def main():
+    start = time.perf_counter()
+    schema.safe_validate_many(rows())
+    elapsed = time.perf_counter() - start
+
+    print(f"{'in-process':<12} {SIZE / elapsed:>12,.0f} records/s")
+
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        schema.safe_validate_many(rows(), workers=workers, chunksize=2000)
+        elapsed = time.perf_counter() - start
+
+        print(f"{f'{workers} workers':<12} {SIZE / elapsed:>12,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Compares checking that every element of a list exists in a (SQLite) database
+with one query per element (`refine`) and with one query per list (`refine_batch`).
+"""
+
+import sqlite3
+import timeit
+
+import zon
+
+SIZE = 1000
+
+db = sqlite3.connect(":memory:")
+db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY)")
+db.executemany("INSERT INTO users VALUES (?)", [(i,) for i in range(SIZE * 10)])
+
+
+def exists(user_id):
+    return db.execute("SELECT 1 FROM users WHERE id = ?", (user_id,)).fetchone()
+
+
+def all_exist(user_ids):
+    placeholders = ", ".join("?" * len(user_ids))
+    found = {
+        row[0]
+        for row in db.execute(
+            f"SELECT id FROM users WHERE id IN ({placeholders})", user_ids
+        )
+    }
+
+    return [user_id in found for user_id in user_ids]
+
+
+per_element = zon.element_list(zon.number().int().refine(exists))
+batched = zon.element_list(zon.number().int()).refine_batch(all_exist)
+
+
+def main():
+    data = list(range(0, SIZE * 10, 10))
+
+    for name, schema in [("refine", per_element), ("refine_batch", batched)]:
+        elapsed = min(timeit.repeat(lambda: schema.validate(data), number=10, repeat=5))
+        print(f"{name:<14} {elapsed / 10 * 1000:>8.2f} ms per list of {SIZE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import pytest
+
+import zon
+
+
+def _backends(validator):
+    return [validator.safe_validate, validator.compile(), validator.codegen()]
+
+
+def test_abort_early_list():
+    checked = []
+    validator = zon.element_list(
+        zon.number().refine(lambda data: checked.append(data) or data > 0)
+    )
+
+    for safe_validate in _backends(validator):
+        checked.clear()
+
+        (valid, error) = safe_validate([1, 2, -1, -2, -3], abort_early=True)
+
+        assert valid is False
+        assert len(error.issues) == 1
+        assert error.issues[0].path == [2]
+        assert checked == [1, 2, -1]
+
+
+def test_abort_early_record():
+    validator = zon.record({"name": zon.string(), "age": zon.number()}).strict()
+
+    for safe_validate in _backends(validator):
+        (valid, error) = safe_validate(
+            {"name": 1, "age": "1", "a": 1}, abort_early=True
+        )
+
+        assert valid is False
+        assert len(error.issues) == 1
+        assert error.issues[0].path == ["name"]
+
+
+def test_abort_early_intersection():
+    validator = zon.intersection(zon.string().min(2), zon.string().max(1))
+
+    for safe_validate in _backends(validator):
+        (valid, error) = safe_validate("a", abort_early=True)
+
+        assert valid is False
+        assert len(error.issues) == 1
+
+
+def test_abort_early_union_tries_every_option():
+    validator = zon.record({"id": zon.union([zon.string().min(3), zon.number().int()])})
+
+    for safe_validate in _backends(validator):
+        assert safe_validate({"id": 1}, abort_early=True) == (True, {"id": 1})
+
+        (valid, error) = safe_validate({"id": "a"}, abort_early=True)
+
+        assert valid is False
+        assert [issue.message for issue in error.issues] == [
+            "Validation failed for type min_length",
+            "Not a valid number",
+            "Not a valid union",
+        ]
+        assert all(issue.path == ["id"] for issue in error.issues)
+
+
+def test_abort_early_validate():
+    validator = zon.element_list(zon.string())
+
+    with pytest.raises(zon.error.ZonError) as e:
+        validator.validate([1, 2, 3], abort_early=True)
+
+    assert len(e.value.issues) == 1
+
+    with pytest.raises(zon.error.ZonError) as e:
+        validator.validate([1, 2, 3])
+
+    assert len(e.value.issues) == 3
@@ -0,0 +1,80 @@
+import zon
+from zon.error import ZonIssueGroup
+
+
+def _backends(validator):
+    return [validator.safe_validate, validator.compile(), validator.codegen()]
+
+
+def test_aggregate_groups_by_path_pattern():
+    validator = zon.record(
+        {"items": zon.element_list(zon.record({"price": zon.number().positive()}))}
+    )
+    data = {"items": [{"price": -i} for i in range(1, 101)]}
+
+    for safe_validate in _backends(validator):
+        (valid, error) = safe_validate(data, aggregate=True)
+
+        assert valid is False
+        assert len(error.groups) == 1
+
+        (group,) = error.groups.values()
+
+        assert group.code == "failed_rule"
+        assert group.path == ["items", "*", "price"]
+        assert group.count == 100
+        assert group.message == "Validation failed for type positive"
+        assert len(group.samples) == ZonIssueGroup.MAX_SAMPLES
+        assert [issue.path for issue in group.samples] == [
+            ["items", 0, "price"],
+            ["items", 1, "price"],
+            ["items", 2, "price"],
+        ]
+        assert error.issue_count == 100
+        assert error.issues == group.samples[:1]
+
+
+def test_aggregate_separates_rules_and_paths():
+    validator = zon.element_list(
+        zon.record({"a": zon.number().gt(0).lt(10), "b": zon.string()})
+    )
+    data = [{"a": 0, "b": 1}, {"a": 20, "b": 2}, {"a": 30, "b": "b"}]
+
+    for safe_validate in _backends(validator):
+        (_, error) = safe_validate(data, aggregate=True)
+
+        assert {
+            (group.code, tuple(group.path), group.count)
+            for group in error.groups.values()
+        } == {
+            ("failed_rule", ("*", "a"), 1),
+            ("failed_rule", ("*", "a"), 2),
+            ("not_a_string", ("*", "b"), 2),
+        }
+
+
+def test_aggregate_union():
+    validator = zon.element_list(zon.union([zon.string(), zon.number()]))
+
+    for safe_validate in _backends(validator):
+        (valid, error) = safe_validate([None] * 10, aggregate=True)
+
+        assert valid is False
+        assert [group.count for group in error.groups.values()] == [10, 10, 10]
+
+
+def test_aggregate_max_issues():
+    validator = zon.element_list(zon.number())
+
+    (valid, error) = validator.safe_validate(["a"] * 10, aggregate=True, max_issues=5)
+
+    assert valid is False
+    assert error.truncated
+    assert [group.count for group in error.groups.values()] == [5]
+
+
+def test_aggregate_valid_data():
+    assert zon.element_list(zon.number()).safe_validate([1], aggregate=True) == (
+        True,
+        [1],
+    )
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+import zon
+
+
+async def _is_known(value):
+    await asyncio.sleep(0)
+    return value != "unknown"
+
+
+validator = zon.string().refine_async(_is_known)
+
+
+async def _source(items):
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+async def _collect(results):
+    return [result async for result in results]
+
+
+def test_avalidate_iter():
+    results = asyncio.run(
+        _collect(validator.avalidate_iter(_source(["a", "unknown", 1, "b"]), window=2))
+    )
+
+    assert [(index, valid) for (index, valid, _) in results] == [
+        (0, True),
+        (1, False),
+        (2, False),
+        (3, True),
+    ]
+    assert results[1][2].issues[0].code == "failed_rule"
+    assert results[2][2].issues[0].code == "not_a_string"
+
+
+def test_avalidate_iter_keeps_order():
+    async def _delayed(value):
+        # later values finish first
+        await asyncio.sleep(0.001 * (10 - value))
+        return True
+
+    schema = zon.number().refine_async(_delayed)
+
+    results = asyncio.run(_collect(schema.avalidate_iter(_source(range(10)))))
+
+    assert [value for (_, _, value) in results] == list(range(10))
+
+
+def test_avalidate_iter_backpressure():
+    read = 0
+
+    async def _source_counted():
+        nonlocal read
+
+        for i in range(100):
+            read += 1
+            yield i
+
+    async def _slow(value):
+        await asyncio.sleep(0.001)
+        return True
+
+    async def _main():
+        schema = zon.number().refine_async(_slow)
+        results = schema.avalidate_iter(_source_counted(), window=4)
+
+        first = await anext(results)
+        await results.aclose()
+
+        return first
+
+    assert asyncio.run(_main()) == (0, True, 0)
+    assert read <= 5
+
+
+def test_avalidate_iter_skip_and_raise():
+    results = asyncio.run(
+        _collect(validator.avalidate_iter(_source(["a", "unknown"]), invalid="skip"))
+    )
+
+    assert [index for (index, _, _) in results] == [0]
+
+    with pytest.raises(zon.ZonError):
+        asyncio.run(
+            _collect(
+                validator.avalidate_iter(_source(["a", "unknown"]), invalid="raise")
+            )
+        )
+
+
+def test_avalidate_iter_options():
+    with pytest.raises(ValueError):
+        validator.avalidate_iter(_source([]), window=0)
+
+    with pytest.raises(ValueError):
+        validator.avalidate_iter(_source([]), concurrency=0)
+
+    with pytest.raises(ValueError):
+        validator.avalidate_iter(_source([]), invalid="ignore")
@@ -0,0 +1,130 @@
+import math
+
+import pytest
+
+import zon
+
+np = pytest.importorskip("numpy")
+
+
+def _scalar_mask(validator, values):
+    return [validator.is_valid(value) for value in values]
+
+
+@pytest.mark.parametrize(
+    "validator",
+    [
+        zon.number().gte(0).lt(1000).finite(),
+        zon.number().gt(1).lte(5),
+        zon.number().positive(),
+        zon.number().negative(),
+        zon.number().non_negative(),
+        zon.number().non_positive(),
+        zon.number().multiple_of(2),
+        zon.number().int(),
+        zon.number().float(),
+    ],
+)
+@pytest.mark.parametrize("dtype", [np.float64, np.int64])
+def test_validate_array_matches_scalar_validation(validator, dtype):
+    values = [-3, -1, 0, 1, 2, 5, 999, 1000, 1500]
+    array = np.array(values, dtype=dtype)
+
+    result = validator.validate_array(array)
+
+    assert result.mask.tolist() == _scalar_mask(validator, array.tolist())
+
+
+def test_validate_array_special_floats():
+    validator = zon.number().gte(0).finite()
+    array = np.array([1.0, math.inf, -math.inf, math.nan])
+
+    result = validator.validate_array(array)
+
+    assert result.mask.tolist() == _scalar_mask(validator, array.tolist())
+
+
+def test_validate_array_failures():
+    validator = zon.number().gte(0).lt(10)
+
+    result = validator.validate_array(np.array([5, -1, 20, 3, -2]))
+
+    assert not result.valid
+    assert result.invalid.tolist() == [1, 2, 4]
+    assert result.failures["gte"].tolist() == [1, 4]
+    assert result.failures["lt"].tolist() == [2]
+
+
+def test_validate_array_valid():
+    result = zon.number().gte(0).validate_array(np.arange(100))
+
+    assert result.valid
+    assert result.failures == {}
+    assert result.invalid.tolist() == []
+
+
+def test_validate_array_refinements():
+    validator = zon.number().refine(lambda value: value != 3, "not_three")
+
+    result = validator.validate_array(np.arange(5))
+
+    assert result.failures == {"not_three": pytest.approx(np.array([3]))}
+
+
+def test_validate_array_multiple_of_zero():
+    validator = zon.number().multiple_of(0)
+
+    result = validator.validate_array(np.arange(3))
+
+    assert result.mask.tolist() == _scalar_mask(validator, [0, 1, 2])
+    assert all(
+        isinstance(exception, ZeroDivisionError)
+        for exception in result.exceptions["multiple_of"].values()
+    )
+
+
+def test_validate_array_refinement_exceptions():
+    def _check(value):
+        if value == 3:
+            raise ValueError("three")
+
+        return True
+
+    result = zon.number().refine(_check, "not_three").validate_array(np.arange(5))
+
+    assert result.invalid.tolist() == [3]
+    assert list(result.exceptions["not_three"]) == [3]
+    assert str(result.exceptions["not_three"][3]) == "three"
+
+
+def test_validate_array_not_numbers():
+    with pytest.raises(TypeError):
+        zon.number().validate_array(np.array(["a", "b"]))
+
+
+def test_list_validate_array():
+    validator = zon.element_list(zon.number().gte(0)).min(3)
+
+    result = validator.validate_array(np.array([1, -1]))
+
+    assert result.invalid.tolist() == [1]
+    assert [issue.params for issue in result.issues] == [{"rule": "min_length"}]
+
+
+def test_list_validate_array_batch_rules():
+    validator = zon.element_list(zon.number().gte(0)).refine_batch(
+        lambda values: [value % 2 == 0 for value in values], "even"
+    )
+
+    result = validator.validate_array(np.array([2, -2, 3, 4]))
+
+    assert result.invalid.tolist() == [1, 2]
+    assert result.failures["even"].tolist() == [2]
+
+
+def test_list_validate_array_errors():
+    with pytest.raises(TypeError):
+        zon.element_list(zon.string()).validate_array(np.array([1]))
+
+    with pytest.raises(ValueError):
+        zon.element_list(zon.number()).validate_array(np.zeros((2, 2)))
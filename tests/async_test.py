@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+import zon
+
+
+async def _is_known(value):
+    await asyncio.sleep(0)
+    return value != "unknown"
+
+
+async def _fails(value):
+    raise RuntimeError("lookup failed")
+
+
+validator = zon.record(
+    {
+        "id": zon.number().int(),
+        "tags": zon.element_list(zon.string().refine_async(_is_known, "known")),
+    }
+)
+
+
+def test_async_validate():
+    data = {"id": 1, "tags": ["a", "b"]}
+
+    assert asyncio.run(validator.async_validate(data)) == data
+
+
+def test_async_safe_validate():
+    (valid, error) = asyncio.run(
+        validator.async_safe_validate({"id": 1, "tags": ["a", "unknown", "unknown"]})
+    )
+
+    assert not valid
+    assert [issue.path for issue in error.issues] == [["tags", 1], ["tags", 2]]
+    assert error.issues[0].code == "failed_rule"
+    assert error.issues[0].params == {"rule": "known"}
+
+
+def test_async_issues_follow_sync_issues():
+    (valid, error) = asyncio.run(
+        validator.async_safe_validate({"id": "1", "tags": ["unknown"]})
+    )
+
+    assert not valid
+    assert [issue.path for issue in error.issues] == [["id"], ["tags", 0]]
+
+
+def test_async_validate_raises():
+    with pytest.raises(zon.ZonError):
+        asyncio.run(validator.async_validate({"id": 1, "tags": ["unknown"]}))
+
+
+def test_async_refinement_exception():
+    (valid, error) = asyncio.run(
+        zon.string().refine_async(_fails).async_safe_validate("a")
+    )
+
+    assert not valid
+    assert error.issues[0].code == "failed_rule_with_exception"
+
+
+def test_async_refinements_are_concurrent():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _slow(value):
+        nonlocal in_flight, max_in_flight
+
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+
+        return True
+
+    schema = zon.element_list(zon.number().refine_async(_slow))
+
+    asyncio.run(schema.async_validate(list(range(100)), concurrency=8))
+
+    assert max_in_flight == 8
+
+
+def test_async_abort_early():
+    calls = 0
+
+    async def _counted(value):
+        nonlocal calls
+
+        calls += 1
+        await asyncio.sleep(0)
+        return False
+
+    schema = zon.element_list(zon.number().refine_async(_counted))
+
+    (valid, error) = asyncio.run(
+        schema.async_safe_validate(list(range(100)), abort_early=True, concurrency=1)
+    )
+
+    assert not valid
+    assert len(error.issues) == 1
+    assert calls < 100
+
+
+def test_async_max_issues():
+    schema = zon.element_list(zon.string().refine_async(_is_known))
+
+    (valid, error) = asyncio.run(
+        schema.async_safe_validate(["unknown"] * 10, max_issues=3)
+    )
+
+    assert not valid
+    assert len(error.issues) == 3
+    assert error.truncated
+
+
+def test_sync_validation_of_async_refinement():
+    with pytest.raises(NotImplementedError):
+        validator.validate({"id": 1, "tags": ["a"]})
+
+
+def test_async_refinement_in_union():
+    schema = zon.union([zon.string().refine_async(_is_known), zon.number()])
+
+    with pytest.raises(NotImplementedError):
+        asyncio.run(schema.async_validate("a"))
+
+
+def test_async_refinement_in_cached():
+    schema = zon.string().refine_async(_is_known).cached()
+
+    with pytest.raises(NotImplementedError):
+        asyncio.run(schema.async_validate("a"))
+
+
+def test_codegen_does_not_inline_async_refinements():
+    schema = zon.number().refine_async(_is_known, "int")
+
+    with pytest.raises(NotImplementedError):
+        schema.codegen()(1.5)
+
+
+def test_async_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        asyncio.run(validator.async_validate({}, concurrency=0))
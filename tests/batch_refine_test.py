@@ -0,0 +1,103 @@
+import pytest
+
+import zon
+
+calls = []
+
+
+def _exists(user_ids):
+    calls.append(list(user_ids))
+    return [user_id < 100 for user_id in user_ids]
+
+
+def _broken(values):
+    raise RuntimeError("database is down")
+
+
+def _too_few(values):
+    return [True]
+
+
+validator = zon.element_list(zon.number().int()).refine_batch(_exists, "exists")
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.fixture(params=["validate", "compile", "codegen"])
+def safe_validate(request):
+    def _safe_validate(schema, data):
+        if request.param == "validate":
+            return schema.safe_validate(data)
+
+        return getattr(schema, request.param)()(data)
+
+    return _safe_validate
+
+
+def test_refine_batch(safe_validate):
+    (valid, error) = safe_validate(validator, [1, 2.5, 300, 4, 500])
+
+    assert not valid
+    assert calls == [[1, 300, 4, 500]]
+    assert [issue.path for issue in error.issues] == [[1], [2], [4]]
+    assert [issue.code for issue in error.issues] == [
+        "failed_rule",
+        "failed_rule",
+        "failed_rule",
+    ]
+    assert error.issues[1].params == {"rule": "exists"}
+    assert error.issues[1].value == 300
+
+
+def test_refine_batch_valid(safe_validate):
+    assert safe_validate(validator, [1, 2, 3]) == (True, [1, 2, 3])
+    assert calls == [[1, 2, 3]]
+
+
+def test_refine_batch_empty_list(safe_validate):
+    assert safe_validate(validator, []) == (True, [])
+    assert calls == []
+
+
+def test_refine_batch_records(safe_validate):
+    schema = zon.record(
+        {
+            "users": zon.element_list(
+                zon.record({"id": zon.number().int(), "name": zon.string()})
+            ).refine_batch(lambda users: _exists([user["id"] for user in users]))
+        }
+    )
+
+    (valid, error) = safe_validate(
+        schema, {"users": [{"id": 1, "name": "a"}, {"id": 200, "name": "b"}]}
+    )
+
+    assert not valid
+    assert [issue.path for issue in error.issues] == [["users", 1]]
+
+
+def test_refine_batch_exceptions(safe_validate):
+    (valid, error) = safe_validate(
+        zon.element_list(zon.number()).refine_batch(_broken), [1]
+    )
+
+    assert not valid
+    assert error.issues[0].code == "failed_rule_with_exception"
+    assert error.issues[0].path == []
+
+    (valid, error) = safe_validate(
+        zon.element_list(zon.number()).refine_batch(_too_few), [1, 2]
+    )
+
+    assert not valid
+    assert error.issues[0].code == "failed_rule_with_exception"
+
+
+def test_refine_batch_is_structural():
+    assert validator == zon.element_list(zon.number().int()).refine_batch(
+        _exists, "exists"
+    )
+    assert validator != zon.element_list(zon.number().int())
@@ -0,0 +1,70 @@
+import pytest
+
+import zon
+
+validator = zon.record({"id": zon.number().int(), "name": zon.string().trim()})
+
+
+def test_safe_validate_many():
+    result = validator.safe_validate_many(
+        [{"id": 1, "name": " a "}, {"id": "2", "name": "b"}, {"id": 3, "name": "c"}]
+    )
+
+    assert not result.valid
+    assert result.values == [{"id": 1, "name": "a"}, None, {"id": 3, "name": "c"}]
+    assert list(result.errors) == [1]
+    assert result.errors[1].issues[0].path == ["id"]
+    assert not result.stopped
+
+
+def test_safe_validate_many_generator():
+    result = validator.safe_validate_many({"id": i, "name": str(i)} for i in range(100))
+
+    assert result.valid
+    assert len(result.values) == 100
+
+
+def test_safe_validate_many_abort_early():
+    result = validator.safe_validate_many(
+        [{"id": "1", "name": 1}, {"id": "2", "name": 2}], abort_early=True
+    )
+
+    assert [len(error.issues) for error in result.errors.values()] == [1, 1]
+    assert [error.issues[0].path for error in result.errors.values()] == [
+        ["id"],
+        ["id"],
+    ]
+
+
+def test_safe_validate_many_max_failures():
+    result = validator.safe_validate_many(
+        [{"id": str(i), "name": "a"} for i in range(10)], max_failures=3
+    )
+
+    assert result.stopped
+    assert list(result.errors) == [0, 1, 2]
+    assert len(result.values) == 3
+
+
+def test_safe_validate_many_deep_copy():
+    data = [{"id": 1, "name": " a "}]
+    result = (
+        zon.record({"name": zon.string().trim()})
+        .passthrough()
+        .safe_validate_many(data, copy="deep")
+    )
+
+    assert result.values == [{"id": 1, "name": "a"}]
+    assert data == [{"id": 1, "name": " a "}]
+
+
+def test_validate_many():
+    assert validator.validate_many([{"id": 1, "name": "a"}]) == [{"id": 1, "name": "a"}]
+
+    with pytest.raises(zon.error.ZonError):
+        validator.validate_many([{"id": 1, "name": "a"}, {"id": "1", "name": "a"}])
+
+
+def test_validate_many_options():
+    with pytest.raises(ValueError):
+        validator.safe_validate_many([], max_failures=0)
@@ -0,0 +1,148 @@
+import array
+import mmap
+import pickle
+
+import pytest
+
+import zon
+
+
+@pytest.fixture
+def validator():
+    return zon.buffer("d", element=zon.number().gte(0).lt(1))
+
+
+def test_buffer_validate(validator):
+    data = array.array("d", [0.0, 0.5])
+
+    assert validator.validate(data) is data
+    assert validator.format == "d"
+    assert validator.element == zon.number().gte(0).lt(1)
+
+
+@pytest.mark.parametrize("data", [1, "abc", [0.5], None])
+def test_not_a_buffer(validator, data):
+    (valid, error) = validator.safe_validate(data)
+
+    assert not valid
+    assert [issue.code for issue in error.issues] == ["not_a_buffer"]
+
+
+def test_buffer_format(validator):
+    (valid, error) = validator.safe_validate(array.array("i", [1]))
+
+    assert not valid
+    assert error.issues[0].code == "invalid_buffer_format"
+    assert error.issues[0].message == "Expected a buffer of 'd' elements, got 'i'"
+
+    assert zon.buffer().validate(array.array("i", [1]))
+
+
+def test_bytes_are_cast(validator):
+    assert validator.validate(array.array("d", [0.25]).tobytes())
+    assert validator.validate(bytearray(16))
+
+    (valid, error) = validator.safe_validate(b"\0" * 15)
+
+    assert not valid
+    assert error.issues[0].code == "invalid_buffer_size"
+
+
+def test_buffer_elements(validator):
+    (valid, error) = validator.safe_validate(array.array("d", [0.5, 2.0, -1.0]))
+
+    assert not valid
+    assert [(issue.path, issue.value) for issue in error.issues] == [
+        ([1], 2.0),
+        ([2], -1.0),
+    ]
+
+
+def test_buffer_elements_without_numpy(monkeypatch, validator):
+    # pylint: disable-next=import-outside-toplevel
+    from zon import vectorized
+
+    monkeypatch.setattr(vectorized, "_numpy_or_none", lambda: None)
+
+    (valid, error) = validator.safe_validate(array.array("d", [0.5, 2.0, -1.0]))
+
+    assert not valid
+    assert [(issue.path, issue.value) for issue in error.issues] == [
+        ([1], 2.0),
+        ([2], -1.0),
+    ]
+
+
+def test_buffer_element_refinement():
+    validator = zon.buffer("i", element=zon.number().refine(lambda n: n != 2, "two"))
+
+    (valid, error) = validator.safe_validate(array.array("i", [1, 2, 3]))
+
+    assert not valid
+    assert [issue.path for issue in error.issues] == [[1]]
+
+
+def test_buffer_length(validator):
+    data = array.array("d", [0.0] * 4).tobytes()
+
+    assert validator.length(4).validate(data)
+    assert validator.min(4).max(4).validate(data)
+    assert not validator.max(3).safe_validate(data)[0]
+    assert not validator.min(5).safe_validate(data)[0]
+
+
+def test_bytes():
+    validator = zon.bytes().min(1)
+
+    assert validator.validate(b"abc")
+    assert validator.validate(memoryview(bytearray(b"abc")))
+    assert not validator.safe_validate(b"")[0]
+    assert not validator.safe_validate(array.array("d", [1.0]))[0]
+
+
+def test_aligned():
+    data = memoryview(bytearray(64))
+    aligned = zon.buffer().aligned(8)
+    offset = next(i for i in range(8) if aligned.is_valid(data[i:]))
+
+    assert aligned.is_valid(data[offset + 8 :])
+    assert not aligned.is_valid(data[offset + 1 :])
+
+    with pytest.raises(ValueError):
+        zon.buffer().aligned(0)
+
+
+def test_mmap(tmp_path, validator):
+    path = tmp_path / "data.bin"
+    path.write_bytes(array.array("d", [0.5] * 1000 + [2.0]).tobytes())
+
+    with (
+        open(path, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        (valid, error) = validator.length(1001).safe_validate(mapped)
+
+        assert not valid
+        assert [issue.path for issue in error.issues] == [[1000]]
+
+
+def test_buffer_in_record(validator):
+    record = zon.record({"samples": validator})
+
+    (valid, error) = record.safe_validate({"samples": array.array("d", [5.0])})
+
+    assert not valid
+    assert error.issues[0].path == ["samples", 0]
+    assert record.compile()({"samples": array.array("d", [0.5])})[0]
+
+
+def test_buffer_pickle(validator):
+    assert pickle.loads(pickle.dumps(validator.length(2))) == validator.length(2)
+
+
+def test_bytes_is_not_star_exported():
+    namespace = {}
+    exec("from zon import *", namespace)  # pylint: disable=exec-used
+
+    assert "bytes" not in namespace
+    assert "buffer" in namespace
@@ -0,0 +1,93 @@
+import pytest
+
+import zon
+from zon.cache import LRUCache
+
+
+def _backends(validator):
+    return [validator.safe_validate, validator.compile(), validator.codegen()]
+
+
+def test_cached_counts_hits_and_misses():
+    calls = []
+    validator = zon.string().refine(lambda data: calls.append(data) or True).cached()
+
+    for _ in range(3):
+        assert validator.validate("a") == "a"
+
+    assert calls == ["a"]
+    assert validator.cache.hits == 2
+    assert validator.cache.misses == 1
+
+
+def test_cached_evicts_least_recently_used():
+    validator = zon.number().cached(maxsize=2)
+
+    for data in (1, 2, 1, 3, 1, 2):
+        validator.validate(data)
+
+    assert validator.cache.info() == {
+        "size": 2,
+        "maxsize": 2,
+        "hits": 2,
+        "misses": 4,
+        "evictions": 2,
+    }
+
+
+def test_cached_transforms():
+    validator = zon.string().trim().to_lower_case().cached()
+
+    assert validator.validate("  ABC ") == "abc"
+    assert validator.validate("  ABC ") == "abc"
+    assert validator.cache.hits == 1
+
+
+def test_cached_errors_are_reported_where_they_happen():
+    validator = zon.record(
+        {"a": zon.string().uuid().cached(), "b": zon.string().uuid().cached()}
+    )
+
+    for safe_validate in _backends(validator):
+        (valid, error) = safe_validate({"a": "x", "b": "x"})
+
+        assert valid is False
+        assert [issue.path for issue in error.issues] == [["a"], ["b"]]
+        assert error.issues[0].message == "Validation failed for type uuid"
+
+    assert not validator.is_valid({"a": "x", "b": "x"})
+
+
+def test_cached_tells_equal_values_of_different_types_apart():
+    validator = zon.number().int().cached()
+
+    assert validator.safe_validate(1)[0] is True
+    assert validator.safe_validate(1.0)[0] is False
+    assert validator.safe_validate(True)[0] is True
+
+
+def test_cached_unhashable_data():
+    validator = zon.element_list(zon.number()).cached()
+
+    assert validator.validate([1]) == [1]
+    assert len(validator.cache) == 0
+
+
+def test_cached_ttl():
+    now = [0.0]
+    cache = LRUCache(2, 10, timer=lambda: now[0])
+
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+
+    now[0] = 10.0
+    assert cache.get("a") is None
+    assert cache.misses == 1
+
+
+def test_cache_parameters():
+    with pytest.raises(ValueError):
+        zon.string().cached(maxsize=0)
+
+    with pytest.raises(ValueError):
+        zon.string().cached(ttl=0)
@@ -0,0 +1,134 @@
+import io
+import json
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from zon.__main__ import main
+
+SCHEMA_MODULE = """
+import zon
+
+SCHEMA = zon.record({"id": zon.number().int(), "name": zon.string()})
+NOT_A_SCHEMA = 1
+"""
+
+
+@pytest.fixture(autouse=True)
+def schema_module(tmp_path, monkeypatch):
+    (tmp_path / "cli_schemas.py").write_text(textwrap.dedent(SCHEMA_MODULE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+
+def _run(*argv):
+    (stdout, stderr) = (io.StringIO(), io.StringIO())
+    code = main(list(argv), stdout=stdout, stderr=stderr)
+
+    return (code, stdout.getvalue(), stderr.getvalue())
+
+
+def test_validate_jsonl(tmp_path):
+    (tmp_path / "data.jsonl").write_text(
+        '{"id": 1, "name": "a"}\n\n{"id": "2", "name": "b"}\n{oops\n'
+    )
+
+    (code, stdout, stderr) = _run(
+        "validate", "--schema", "cli_schemas:SCHEMA", "data.jsonl"
+    )
+
+    assert code == 1
+    assert "records:    3" in stdout
+    assert "invalid:    2" in stdout
+    assert "records/s" in stdout
+    assert "p99" in stdout
+    assert "data.jsonl:3: id:" in stderr
+    assert "data.jsonl:4: Not valid JSON" in stderr
+
+
+def test_validate_json_and_csv(tmp_path):
+    (tmp_path / "data.json").write_text(json.dumps([{"id": 1, "name": "a"}]))
+    (tmp_path / "data.csv").write_text("id,name\n1,a\n")
+
+    (code, stdout, stderr) = _run(
+        "validate", "--schema", "cli_schemas:SCHEMA", "data.json", "data.csv"
+    )
+
+    # CSV values are strings
+    assert code == 1
+    assert "records:    2" in stdout
+    assert "data.csv:2: id:" in stderr
+
+
+def test_validate_stdin(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO('{"id": 1, "name": "a"}\n'))
+
+    (code, stdout, _) = _run("validate", "--schema", "cli_schemas:SCHEMA")
+
+    assert code == 0
+    assert "valid:      1" in stdout
+
+
+def test_validate_workers(tmp_path):
+    lines = [json.dumps({"id": i if i % 7 else str(i), "name": "x"}) for i in range(50)]
+    (tmp_path / "data.jsonl").write_text("\n".join(lines))
+
+    (code, stdout, stderr) = _run(
+        "validate",
+        "--schema",
+        "cli_schemas:SCHEMA",
+        "--workers",
+        "2",
+        "--chunksize",
+        "5",
+        "--report-failures",
+        "2",
+        "data.jsonl",
+    )
+
+    assert code == 1
+    assert "records:    50" in stdout
+    assert "invalid:    8" in stdout
+    assert stderr.splitlines() == [
+        "data.jsonl:1: id: Not a valid number",
+        "data.jsonl:8: id: Not a valid number",
+    ]
+
+
+def test_invalid_schema():
+    with pytest.raises(SystemExit) as e:
+        _run("validate", "--schema", "cli_schemas:NOT_A_SCHEMA", "-")
+
+    assert e.value.code == 2
+
+    with pytest.raises(SystemExit):
+        _run("validate", "--schema", "cli_schemas", "-")
+
+
+def test_missing_file(tmp_path):
+    (tmp_path / "data.jsonl").write_text('{"id": 1, "name": "a"}\n')
+
+    with pytest.raises(SystemExit) as e:
+        _run(
+            "validate", "--schema", "cli_schemas:SCHEMA", "data.jsonl", "missing.jsonl"
+        )
+
+    assert e.value.code == 2
+
+
+def test_python_m_zon(tmp_path):
+    (tmp_path / "data.jsonl").write_text('{"id": 1, "name": "a"}\n')
+
+    process = subprocess.run(
+        [sys.executable, "-m", "zon", "validate", "--schema", "cli_schemas:SCHEMA"],
+        input=(tmp_path / "data.jsonl").read_text(),
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        check=False,
+    )
+
+    assert process.returncode == 0, process.stderr
+    assert "records:    1" in process.stdout
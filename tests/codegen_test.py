@@ -0,0 +1,108 @@
+import pytest
+
+import zon
+
+
+@pytest.fixture
+def validator():
+    return zon.record(
+        {
+            "name": zon.string().min(1).trim(),
+            "age": zon.number().int().positive().lte(150),
+            "email": zon.string().email().optional(),
+            "tags": zon.element_list(zon.string().max(5)).max(3),
+            "point": zon.element_tuple([zon.number(), zon.number()]),
+            "id": zon.union([zon.string().uuid(), zon.number().int()]),
+            "role": zon.enum(["admin", "user"]),
+            "flag": zon.boolean().and_also(zon.literal(True)),
+        }
+    )
+
+
+@pytest.fixture
+def generated(validator):
+    return validator.codegen()
+
+
+def _messages(data_or_error):
+    return [issue.message for issue in data_or_error.issues]
+
+
+def test_codegen_valid(validator, generated):
+    data = {
+        "name": "  John ",
+        "age": 1,
+        "tags": ["a", "b"],
+        "point": (1, 2.5),
+        "id": 3,
+        "role": "user",
+        "flag": True,
+        "extra": "stripped",
+    }
+
+    assert generated(data) == validator.safe_validate(data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        1,
+        {},
+        {"name": "", "age": -1},
+        {"name": "John", "age": 151, "tags": ["a", "toolong", 1]},
+        {"name": "John", "age": 1.5, "tags": ["a", "b", "c", "d"]},
+        {"name": "John", "age": 1, "point": (1,), "id": "not-a-uuid"},
+        {"name": "John", "age": 1, "point": (1, "2"), "role": "root"},
+        {"name": "John", "age": 1, "email": "not-an-email", "flag": False},
+    ],
+)
+def test_codegen_invalid(validator, generated, data):
+    (valid, data_or_error) = generated(data)
+    (expected_valid, expected_error) = validator.safe_validate(data)
+
+    assert valid is expected_valid is False
+    assert _messages(data_or_error) == _messages(expected_error)
+
+
+def test_codegen_record_unknown_keys():
+    data = {"name": "John", "extra": 1}
+    shape = {"name": zon.string()}
+
+    assert zon.record(shape).strict().codegen()(data)[0] is False
+    assert zon.record(shape).passthrough().codegen()(data) == (True, data)
+    assert zon.record(shape).catchall(zon.number()).codegen()(data) == (True, data)
+    assert zon.record(shape).catchall(zon.string()).codegen()(data)[0] is False
+
+
+def test_codegen_union_options_do_not_share_transforms():
+    validator = zon.union([zon.string().trim().length(1), zon.string().length(3)])
+
+    assert validator.codegen()(" a ") == validator.safe_validate(" a ")
+
+
+def test_codegen_source_inlines_checks():
+    source = zon.record({"age": zon.number().gt(1)}).codegen_source()
+
+    assert "isinstance" in source
+    assert "'age'" in source
+    assert "> 1" in source
+
+
+@pytest.mark.parametrize(
+    "validator, data",
+    [
+        (zon.number().refine(lambda x: x % 2 == 0, "positive"), 3),
+        (zon.number().refine(lambda x: x < 10, "int"), 11),
+        (
+            zon.element_list(zon.number()).refine(lambda x: len(x) < 2, "nonempty"),
+            [1, 2, 3],
+        ),
+    ],
+)
+def test_codegen_refinements_named_like_built_in_rules(validator, data):
+    (valid, _) = validator.codegen()(data)
+
+    assert not valid
+    assert (
+        validator.codegen()(data)[1].issues == validator.safe_validate(data)[1].issues
+    )
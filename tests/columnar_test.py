@@ -0,0 +1,175 @@
+import pytest
+
+import zon
+
+validator = zon.record(
+    {
+        "id": zon.number().int().positive(),
+        "name": zon.string().trim().min(1),
+        "kind": zon.enum(["a", "b"]),
+        "active": zon.boolean(),
+        "note": zon.string().optional(),
+    }
+)
+
+rows = [
+    {"id": 1, "name": " x ", "kind": "a", "active": True},
+    {"id": -1, "name": "", "kind": "c", "active": 1},
+    "not a record",
+    {"id": 2, "name": "y", "kind": "b", "active": False, "note": "n", "extra": 1},
+    {"name": "z", "kind": "a", "active": True},
+]
+
+
+def _assert_same_as_many(schema, data, rows=None):
+    columnar = schema.safe_validate_columns(data)
+    many = schema.safe_validate_many(data if rows is None else rows)
+
+    assert columnar.values == many.values
+    assert columnar.errors.keys() == many.errors.keys()
+
+    for index, error in many.errors.items():
+        assert columnar.errors[index].issues == error.issues
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        validator,
+        validator.passthrough(),
+        validator.strict(),
+        validator.catchall(zon.number()),
+        validator.refine(lambda record: record["id"] != 2, "not_two"),
+    ],
+)
+def test_columns_match_rows(schema):
+    _assert_same_as_many(schema, rows)
+
+
+def test_column_input():
+    result = validator.safe_validate_columns(
+        {
+            "id": [1, 2],
+            "name": ["x", "y"],
+            "kind": ["a", "c"],
+            "active": [True, False],
+            "extra": [0, 0],
+        }
+    )
+
+    assert result.values == [
+        {"id": 1, "name": "x", "kind": "a", "active": True},
+        None,
+    ]
+    assert [issue.path for issue in result.errors[1].issues] == [["kind"]]
+
+
+def test_column_input_lengths():
+    with pytest.raises(ValueError):
+        validator.safe_validate_columns({"id": [1, 2], "name": ["x"]})
+
+
+def test_empty_batch():
+    result = validator.safe_validate_columns([])
+
+    assert result.values == []
+    assert result.valid
+
+
+def test_numpy_columns():
+    np = pytest.importorskip("numpy")
+
+    schema = zon.record(
+        {
+            "reading": zon.number().gte(0).lt(100),
+            "ok": zon.boolean(),
+            "unit": zon.literal("c"),
+            "sensor": zon.enum(["s1", "s2"]),
+        }
+    )
+    columns = {
+        "reading": np.array([1.5, -1.0, 200.0]),
+        "ok": np.array([True, False, True]),
+        "unit": np.array(["c", "c", "f"]),
+        "sensor": np.array(["s1", "s3", "s2"]),
+    }
+
+    result = schema.safe_validate_columns(columns)
+
+    assert result.values[0] == {"reading": 1.5, "ok": True, "unit": "c", "sensor": "s1"}
+    assert type(result.values[0]["reading"]) is float
+    assert [(issue.path, issue.code) for issue in result.errors[1].issues] == [
+        (["reading"], "failed_rule"),
+        (["sensor"], "invalid_enum_value"),
+    ]
+    assert [(issue.path, issue.code) for issue in result.errors[2].issues] == [
+        (["reading"], "failed_rule"),
+        (["unit"], "invalid_literal"),
+    ]
+
+    rows_result = schema.safe_validate_many(
+        [
+            dict(zip(columns, values))
+            for values in zip(*(c.tolist() for c in columns.values()))
+        ]
+    )
+    for index, error in rows_result.errors.items():
+        assert result.errors[index].issues == error.issues
+
+
+@pytest.mark.parametrize(
+    "field, values",
+    [
+        (zon.number().int().gte(0), [0, 1, -1, 2**70, None]),
+        (zon.number().lt(1.5), [0.5, 2.5, 1, True, float("inf")]),
+        (zon.number().lt(1.5).finite(), [0.5, 2.5, float("-inf")]),
+        (zon.number().int().multiple_of(2), [0, 1, -4]),
+        (zon.number().gt(0), [True, False]),
+        (zon.number().refine(lambda n: n != 3, "not_three"), [1, 2, 3]),
+        (zon.number().positive().optional(), [0, None, -1, 2]),
+        (zon.boolean().optional(), [True, None, 0, 1, False]),
+        (zon.enum(["a", "b"]).optional(), ["a", "", None, "c"]),
+        (zon.literal(None), [None, 0, None]),
+    ],
+)
+def test_leaf_columns_match_rows(field, values):
+    schema = zon.record({"value": field})
+    data = [{"value": value} for value in values]
+
+    _assert_same_as_many(schema, data)
+    _assert_same_as_many(schema, {"value": values}, data)
+
+
+def _raise_on_three(value):
+    if value == 3:
+        raise ValueError("three")
+
+    return True
+
+
+@pytest.mark.parametrize(
+    "field",
+    [
+        zon.number().multiple_of(0),
+        zon.number().refine(_raise_on_three, "not_three"),
+    ],
+)
+def test_numpy_columns_report_exceptions(field):
+    np = pytest.importorskip("numpy")
+
+    schema = zon.record({"value": field})
+    values = [1, 2, 3]
+
+    columnar = schema.safe_validate_columns({"value": np.array(values)})
+    many = schema.safe_validate_many([{"value": value} for value in values])
+
+    assert columnar.errors.keys() == many.errors.keys()
+
+    for index, error in many.errors.items():
+        assert [
+            (issue.path, issue.code, str(issue.params.get("exception")))
+            for issue in columnar.errors[index].issues
+        ] == [
+            (issue.path, issue.code, str(issue.params.get("exception")))
+            for issue in error.issues
+        ]
@@ -0,0 +1,102 @@
+import pytest
+
+import zon
+
+
+@pytest.fixture
+def validator():
+    return zon.record(
+        {
+            "name": zon.string().min(1).trim(),
+            "age": zon.number().int().positive(),
+            "email": zon.string().email().optional(),
+            "tags": zon.element_list(zon.string().max(5)).max(3),
+            "point": zon.element_tuple([zon.number(), zon.number()]),
+            "id": zon.union([zon.string().uuid(), zon.number().int()]),
+            "role": zon.enum(["admin", "user"]),
+            "flag": zon.boolean().and_also(zon.literal(True)),
+        }
+    )
+
+
+@pytest.fixture
+def compiled(validator):
+    return validator.compile()
+
+
+def _messages(data_or_error):
+    return [issue.message for issue in data_or_error.issues]
+
+
+def test_compile_valid(validator, compiled):
+    data = {
+        "name": "  John ",
+        "age": 1,
+        "tags": ["a", "b"],
+        "point": (1, 2.5),
+        "id": 3,
+        "role": "user",
+        "flag": True,
+        "extra": "stripped",
+    }
+
+    assert compiled(data) == validator.safe_validate(data)
+    assert compiled(data) == (
+        True,
+        {
+            "name": "John",
+            "age": 1,
+            "tags": ["a", "b"],
+            "point": (1, 2.5),
+            "id": 3,
+            "role": "user",
+            "flag": True,
+        },
+    )
+
+
+def test_compile_does_not_modify_input(compiled):
+    data = {"name": " John ", "tags": []}
+
+    compiled(data)
+
+    assert data == {"name": " John ", "tags": []}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        1,
+        {},
+        {"name": "", "age": -1},
+        {"name": "John", "age": 1.5, "tags": ["a", "toolong", 1]},
+        {"name": "John", "age": 1, "tags": ["a", "b", "c", "d"]},
+        {"name": "John", "age": 1, "point": (1,), "id": "not-a-uuid"},
+        {"name": "John", "age": 1, "point": (1, "2"), "role": "root"},
+        {"name": "John", "age": 1, "email": "not-an-email", "flag": False},
+    ],
+)
+def test_compile_invalid(validator, compiled, data):
+    (valid, data_or_error) = compiled(data)
+    (expected_valid, expected_error) = validator.safe_validate(data)
+
+    assert valid is expected_valid is False
+    assert _messages(data_or_error) == _messages(expected_error)
+
+
+def test_compile_record_unknown_keys(validator):
+    data = {"name": "John", "extra": 1}
+    shape = {"name": zon.string()}
+
+    assert zon.record(shape).strict().compile()(data)[0] is False
+    assert zon.record(shape).passthrough().compile()(data) == (True, data)
+    assert zon.record(shape).catchall(zon.number()).compile()(data) == (True, data)
+    assert zon.record(shape).catchall(zon.string()).compile()(data)[0] is False
+
+
+def test_compile_refinement():
+    compiled = zon.string().refine(lambda data: data[0] == data[-1]).compile()
+
+    assert compiled("212") == (True, "212")
+    assert compiled("21")[0] is False
+    assert compiled(1)[0] is False
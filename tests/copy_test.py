@@ -0,0 +1,99 @@
+import pytest
+
+import zon
+
+
+@pytest.fixture
+def validator():
+    return zon.record(
+        {
+            "name": zon.string().trim(),
+            "address": zon.record({"city": zon.string()}),
+        }
+    )
+
+
+@pytest.fixture(params=["safe_validate", "compile", "codegen"])
+def safe_validate(request, validator):
+    match request.param:
+        case "safe_validate":
+            return validator.safe_validate
+        case "compile":
+            return validator.compile()
+        case "codegen":
+            return validator.codegen()
+
+
+def test_copy_on_write_unchanged(safe_validate):
+    data = {"name": "John", "address": {"city": "Porto"}}
+
+    (valid, validated) = safe_validate(data)
+
+    assert valid
+    assert validated is data
+
+
+def test_copy_on_write_changed(safe_validate):
+    data = {"name": " John ", "address": {"city": "Porto", "country": "Portugal"}}
+
+    (valid, validated) = safe_validate(data)
+
+    assert valid
+    assert validated == {"name": "John", "address": {"city": "Porto"}}
+    assert data == {
+        "name": " John ",
+        "address": {"city": "Porto", "country": "Portugal"},
+    }
+
+
+def test_copy_on_write_shares_unchanged_values(safe_validate):
+    data = {"name": " John ", "address": {"city": "Porto"}}
+
+    (_, validated) = safe_validate(data)
+
+    assert validated is not data
+    assert validated["address"] is data["address"]
+
+
+def test_copy_deep(safe_validate):
+    data = {"name": "John", "address": {"city": "Porto", "country": "Portugal"}}
+
+    (valid, validated) = safe_validate(data, copy="deep")
+
+    assert valid
+    assert validated == {"name": "John", "address": {"city": "Porto"}}
+    assert validated["address"] is not data["address"]
+    assert data["address"] == {"city": "Porto", "country": "Portugal"}
+
+
+def test_copy_none(safe_validate):
+    data = {"name": " John ", "address": {"city": "Porto", "country": "Portugal"}}
+
+    (valid, validated) = safe_validate(data, copy="none")
+
+    assert valid
+    assert validated is data
+    assert data == {"name": "John", "address": {"city": "Porto"}}
+
+
+def test_copy_none_does_not_change_discarded_values():
+    validator = zon.union(
+        [
+            zon.record({"name": zon.string(), "age": zon.number()}),
+            zon.record({"name": zon.string()}).passthrough(),
+        ]
+    )
+    data = {"name": "John", "nickname": "J"}
+
+    for safe_validate in (
+        validator.safe_validate,
+        validator.compile(),
+        validator.codegen(),
+    ):
+        assert safe_validate(data, copy="none") == (True, data)
+        assert data == {"name": "John", "nickname": "J"}
+
+
+def test_copy_unknown_strategy(validator):
+    with pytest.raises(ValueError):
+        validator.validate({}, copy="shallow")
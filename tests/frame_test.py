@@ -0,0 +1,118 @@
+import pytest
+
+import zon
+
+pd = pytest.importorskip("pandas")
+
+validator = zon.record(
+    {
+        "id": zon.number().int().positive(),
+        "unit": zon.enum(["c", "f"]),
+        "note": zon.string().optional(),
+        "ok": zon.boolean(),
+    }
+)
+
+frame = pd.DataFrame(
+    {
+        "id": [1, -2, 3, 4],
+        "unit": ["c", "x", "f", "c"],
+        "note": ["a", None, "b", None],
+        "ok": [True, False, True, False],
+    }
+)
+
+
+def _rows(data):
+    # missing values are validated as None
+    return [
+        {key: None if pd.isna(value) else value for key, value in row.items()}
+        for row in data.to_dict("records")
+    ]
+
+
+def _assert_same_as_many(schema, data, result):
+    many = schema.safe_validate_many(_rows(data))
+
+    assert result.mask.tolist() == [i not in many.errors for i in range(len(data))]
+    assert result.errors.keys() == many.errors.keys()
+
+    for index, error in many.errors.items():
+        assert result.errors[index].issues == error.issues
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        validator,
+        validator.passthrough(),
+        validator.catchall(zon.number()),
+        validator.refine(lambda record: record["id"] != 3, "not_three"),
+    ],
+)
+def test_frame_matches_rows(schema):
+    result = schema.validate_frame(frame)
+
+    _assert_same_as_many(schema, frame, result)
+    assert result.invalid.tolist() == sorted(result.errors)
+    assert not result.valid
+
+
+def test_valid_frame():
+    result = validator.validate_frame(frame.drop(index=1))
+
+    assert result.valid
+    assert result.table().empty
+
+
+def test_missing_column():
+    result = validator.validate_frame(frame.drop(columns=["ok"]))
+
+    assert not result.mask.any()
+    assert [(issue.path, issue.code) for issue in result.issues] == [
+        (["ok"], "not_a_boolean")
+    ]
+
+    # optional fields may be missing
+    assert validator.validate_frame(frame.drop(columns=["note"])).errors.keys() == {1}
+
+
+def test_unrecognized_columns():
+    extended = frame.assign(extra=0)
+
+    assert validator.validate_frame(extended).errors.keys() == {1}
+
+    result = validator.strict().validate_frame(extended)
+
+    assert not result.mask.any()
+    assert [issue.code for issue in result.issues] == ["unrecognized_keys"]
+
+
+def test_issue_table():
+    result = validator.strict().validate_frame(frame.assign(extra=0))
+    table = result.table()
+
+    assert table.columns.tolist() == ["row", "path", "code", "message", "value"]
+    assert table["row"].isna().tolist() == [True, False, False]
+    assert table["path"].tolist() == ["", "id", "unit"]
+    assert table["code"].tolist() == [
+        "unrecognized_keys",
+        "failed_rule",
+        "invalid_enum_value",
+    ]
+
+
+def test_arrow_table():
+    pa = pytest.importorskip("pyarrow")
+
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+
+    _assert_same_as_many(validator, frame, validator.validate_frame(table))
+    _assert_same_as_many(
+        validator, frame, validator.validate_frame(table.to_batches()[0])
+    )
+
+
+def test_not_a_frame():
+    with pytest.raises(TypeError):
+        validator.validate_frame([{"id": 1}])
@@ -0,0 +1,30 @@
+import zon
+
+
+def test_builders_do_not_change_the_original():
+    validator = zon.string()
+    refined = validator.min(1).max(2)
+
+    assert validator.validators == ()
+    assert [rule.name for rule in refined.validators] == ["min_length", "max_length"]
+
+
+def test_builders_share_rules():
+    validator = zon.number().gt(0)
+    refined = validator.lt(10)
+
+    assert refined is not validator
+    assert refined.validators[0] is validator.validators[0]
+
+
+def test_builders_share_children():
+    name = zon.string()
+    validator = zon.record({"name": name})
+    refined = validator.refine(lambda data: True)
+
+    assert refined.shape is validator.shape
+    assert refined.shape["name"] is name
+
+
+def test_validators_are_immutable():
+    assert isinstance(zon.string().email().validators, tuple)
@@ -0,0 +1,79 @@
+import zon
+
+
+def test_structural_equality():
+    assert zon.string().min(1) == zon.string().min(1)
+    assert hash(zon.string().min(1)) == hash(zon.string().min(1))
+
+    assert zon.string().min(1) != zon.string().min(2)
+    assert zon.string().min(1) != zon.element_list(zon.string()).min(1)
+    assert zon.number().gt(1) != zon.number().gt(1.0)
+    assert zon.literal(1) != zon.literal(True)
+
+    assert zon.record({"a": zon.string()}) == zon.record({"a": zon.string()})
+    assert zon.record({"a": zon.string()}) != zon.record({"a": zon.number()})
+    assert zon.record({"a": zon.string()}) != zon.record({"a": zon.string()}).strict()
+
+
+def test_refinements_are_compared_by_identity():
+    def positive(data):
+        return data > 0
+
+    assert zon.number().refine(positive) == zon.number().refine(positive)
+    assert zon.number().refine(lambda data: data > 0) != zon.number().refine(
+        lambda data: data > 0
+    )
+
+
+def test_builders_intern_their_results():
+    assert zon.string().email() is zon.string().email()
+    assert zon.number().gt(0).lt(10) is zon.number().gt(0).lt(10)
+
+
+def test_intern():
+    first = zon.intern(zon.record({"a": zon.string()}))
+
+    assert zon.intern(zon.record({"a": zon.string()})) is first
+
+
+def test_record_builders_are_memoized():
+    validator = zon.record({"a": zon.string(), "b": zon.number(), "c": zon.boolean()})
+
+    assert validator.pick({"a": True}) is validator.pick({"a": True})
+    assert validator.omit({"a": True}) is validator.omit({"a": True})
+    assert validator.partial() is validator.partial()
+    assert validator.deep_partial() is validator.deep_partial()
+    assert validator.strict() is validator.strict()
+    assert validator.extend({"d": zon.string()}) is validator.extend(
+        {"d": zon.string()}
+    )
+
+    # equal records share their derived records too
+    assert (
+        zon.record({"a": zon.string()}).strict()
+        is zon.record({"a": zon.string()}).strict()
+    )
+
+
+def test_record_rules_share_the_shape_key():
+    def nonempty(data):
+        return len(data) > 0
+
+    validator = zon.record({f"field_{i}": zon.string() for i in range(100)})
+    refined = validator.refine(nonempty)
+
+    # adding a rule does not rehash every field
+    assert refined._shape_key is validator._shape_key
+    assert validator.refine(nonempty) is refined
+
+
+def test_compiled_functions_are_shared():
+    validator = zon.record({"a": zon.string().email()})
+
+    assert validator._compile() is validator._compile()
+    assert zon.string().email()._compile() is zon.string().email()._compile()
+
+
+def test_unhashable_literals():
+    assert zon.literal([1, 2]) == zon.literal([1, 2])
+    assert zon.literal([1, 2]).validate([1, 2]) == [1, 2]
@@ -0,0 +1,72 @@
+import zon
+
+
+def test_is_valid_leaves():
+    assert zon.string().min(2).is_valid("ab")
+    assert not zon.string().min(2).is_valid("a")
+    assert not zon.string().is_valid(1)
+    assert zon.number().gt(0).is_valid(1)
+    assert not zon.number().gt(0).is_valid(0)
+
+
+def test_is_valid_record():
+    validator = zon.record(
+        {"name": zon.string(), "tags": zon.element_list(zon.string()).nonempty()}
+    ).strict()
+
+    assert validator.is_valid({"name": "a", "tags": ["b"]})
+    assert not validator.is_valid({"name": "a", "tags": []})
+    assert not validator.is_valid({"name": "a", "tags": ["b"], "extra": 1})
+    assert not validator.is_valid({"name": 1, "tags": ["b"]})
+
+
+def test_is_valid_does_not_mutate_data():
+    data = {"name": "a", "extra": 1}
+
+    assert zon.record({"name": zon.string()}).strip().is_valid(data)
+    assert data == {"name": "a", "extra": 1}
+
+
+def test_is_valid_union():
+    validator = zon.element_list(zon.union([zon.string().min(3), zon.number().int()]))
+
+    assert validator.is_valid(["abc", 1])
+    assert not validator.is_valid(["abc", "a"])
+    assert not validator.is_valid([1.5])
+    assert zon.union([]).is_valid(1)
+
+
+def test_is_valid_rules_see_validated_data():
+    validator = (
+        zon.record({"a": zon.number()}).strip().refine(lambda data: "b" not in data)
+    )
+
+    assert validator.is_valid({"a": 1, "b": 2})
+    assert (
+        not zon.record({"a": zon.number()})
+        .passthrough()
+        .refine(lambda data: "b" not in data)
+        .is_valid({"a": 1, "b": 2})
+    )
+
+
+def test_is_valid_matches_safe_validate():
+    validator = zon.record(
+        {
+            "id": zon.union([zon.string().uuid(), zon.number().int().positive()]),
+            "scores": zon.element_list(zon.number().gte(0).lte(10)),
+            "nickname": zon.string().optional(),
+        }
+    )
+
+    for data in [
+        {"id": 1, "scores": [1, 2]},
+        {"id": -1, "scores": [1, 2]},
+        {"id": 1, "scores": [1, 20]},
+        {"id": "x", "scores": []},
+        {"id": 1, "scores": [], "nickname": 1},
+        [],
+    ]:
+        (valid, _) = validator.safe_validate(data)
+
+        assert validator.is_valid(data) is valid
@@ -0,0 +1,99 @@
+import pytest
+
+import zon
+from zon.error import ZonIssue
+
+
+def _backends(validator):
+    return [validator.safe_validate, validator.compile(), validator.codegen()]
+
+
+def test_issue_message_is_rendered_from_code():
+    issue = ZonIssue(
+        value=1, code="invalid_enum_value", params={"options": ["a"]}, path=[]
+    )
+
+    assert issue.message == "Expected one of ['a']"
+
+
+def test_issue_message_can_be_given():
+    issue = ZonIssue(value=1, message="Something went wrong", path=[])
+
+    assert issue.code == "custom"
+    assert issue.message == "Something went wrong"
+
+
+def test_issues_have_codes():
+    validator = zon.record(
+        {
+            "kind": zon.enum(["a", "b"]),
+            "version": zon.literal(2),
+            "count": zon.number().gt(0),
+        }
+    ).strict()
+
+    for safe_validate in _backends(validator):
+        (valid, error) = safe_validate(
+            {"kind": "c", "version": 1, "count": 0, "extra": 1}
+        )
+
+        assert valid is False
+        assert [issue.code for issue in error.issues] == [
+            "invalid_enum_value",
+            "invalid_literal",
+            "failed_rule",
+            "unrecognized_keys",
+        ]
+        assert [issue.message for issue in error.issues] == [
+            "Expected one of ['a', 'b']",
+            "Expected 2",
+            "Validation failed for type gt",
+            "Unexpected keys: {'extra'}",
+        ]
+
+
+def test_max_issues():
+    validator = zon.element_list(zon.number())
+
+    for safe_validate in _backends(validator):
+        (valid, error) = safe_validate(["a"] * 100, max_issues=10)
+
+        assert valid is False
+        assert len(error.issues) == 10
+        assert error.truncated
+        assert error.issues[-1].path == [9]
+
+
+def test_max_issues_not_reached():
+    validator = zon.element_list(zon.number())
+
+    for safe_validate in _backends(validator):
+        (valid, error) = safe_validate(["a"] * 10, max_issues=10)
+
+        assert valid is False
+        assert len(error.issues) == 10
+        assert not error.truncated
+
+
+def test_max_issues_union():
+    validator = zon.element_list(zon.union([zon.string(), zon.number()]))
+
+    for safe_validate in _backends(validator):
+        (valid, error) = safe_validate([None, None], max_issues=4)
+
+        assert valid is False
+        assert [issue.path for issue in error.issues] == [[0], [0], [0], [1]]
+        assert error.truncated
+
+
+def test_max_issues_validate():
+    with pytest.raises(zon.error.ZonError) as e:
+        zon.element_list(zon.string()).validate(list(range(5)), max_issues=2)
+
+    assert len(e.value.issues) == 2
+    assert e.value.truncated
+
+
+def test_max_issues_must_be_positive():
+    with pytest.raises(ValueError):
+        zon.string().safe_validate("", max_issues=0)
@@ -0,0 +1,109 @@
+import io
+import itertools
+
+import pytest
+
+import zon
+
+validator = zon.record({"id": zon.number().int(), "name": zon.string()})
+
+
+def test_validate_iter():
+    data = [{"id": 1, "name": "a"}, {"id": "2", "name": "b"}, {"id": 3, "name": "c"}]
+
+    results = list(validator.validate_iter(data, chunk_size=2))
+
+    assert [(index, valid) for (index, valid, _) in results] == [
+        (0, True),
+        (1, False),
+        (2, True),
+    ]
+    assert results[0][2] == {"id": 1, "name": "a"}
+    assert results[1][2].issues[0].path == ["id"]
+
+
+def test_validate_iter_is_lazy():
+    data = ({"id": i, "name": str(i)} for i in itertools.count())
+
+    results = validator.validate_iter(data, chunk_size=10)
+
+    assert [index for (index, _, _) in itertools.islice(results, 25)] == list(range(25))
+
+
+def test_validate_iter_skip():
+    data = [{"id": 1, "name": "a"}, {"id": "2", "name": "b"}, {"id": 3, "name": "c"}]
+
+    assert [
+        index for (index, _, _) in validator.validate_iter(data, invalid="skip")
+    ] == [
+        0,
+        2,
+    ]
+
+
+def test_validate_iter_raise():
+    data = [{"id": 1, "name": "a"}, {"id": "2", "name": "b"}, {"id": 3, "name": "c"}]
+    results = validator.validate_iter(data, invalid="raise")
+
+    assert next(results)[0] == 0
+
+    with pytest.raises(zon.error.ZonError):
+        next(results)
+
+
+def test_validate_iter_options():
+    with pytest.raises(ValueError):
+        validator.validate_iter([], chunk_size=0)
+
+    with pytest.raises(ValueError):
+        validator.validate_iter([], invalid="ignore")
+
+    with pytest.raises(ValueError):
+        validator.validate_iter([], copy="bogus")
+
+    with pytest.raises(ValueError):
+        validator.validate_iter([], max_issues=0)
+
+
+def test_jsonl_rows():
+    file = io.StringIO('{"id": 1, "name": "a"}\n\n{"id": "2", "name": "b"}\n')
+
+    results = list(validator.validate_iter(zon.jsonl_rows(file)))
+
+    assert [valid for (_, valid, _) in results] == [True, False]
+
+
+def test_jsonl_rows_malformed_lines():
+    file = io.BytesIO(b'{"id": 1, "name": "a"}\n{"id": 2,\n{"id": 3, "name": "c"}\n')
+
+    results = list(validator.validate_iter(zon.jsonl_rows(file), chunk_size=2))
+
+    assert [(index, valid) for (index, valid, _) in results] == [
+        (0, True),
+        (1, False),
+        (2, True),
+    ]
+    assert results[1][2].issues[0].code == "invalid_json"
+    assert results[1][2].issues[0].value == '{"id": 2,'
+    assert results[2][2] == {"id": 3, "name": "c"}
+
+    file.seek(0)
+
+    assert [
+        index
+        for (index, _, _) in validator.validate_iter(
+            zon.jsonl_rows(file), invalid="skip"
+        )
+    ] == [0, 2]
+
+
+def test_csv_rows():
+    file = io.StringIO("id,name\n1,a\nx,b\n")
+    csv_validator = zon.record(
+        {"id": zon.string().regex(r"^\d+$"), "name": zon.string()}
+    )
+
+    results = list(csv_validator.validate_iter(zon.csv_rows(file)))
+
+    assert [valid for (_, valid, _) in results] == [True, False]
+    assert results[0][2] == {"id": "1", "name": "a"}
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+import zon
+
+validator = zon.record({"id": zon.number().int(), "name": zon.string()})
+
+
+def _write_lines(path, lines):
+    path.write_text("".join(line + "\n" for line in lines))
+    return path
+
+
+@pytest.fixture
+def jsonl_file(tmp_path):
+    lines = []
+    for i in range(100):
+        if i % 10 == 3:
+            lines.append(json.dumps({"id": str(i), "name": "x"}))
+        else:
+            lines.append(json.dumps({"id": i, "name": "x"}))
+
+    return _write_lines(tmp_path / "data.jsonl", lines)
+
+
+def test_validate_jsonl(jsonl_file):
+    report = zon.validate_jsonl(jsonl_file, validator)
+
+    assert report.total == 100
+    assert report.valid == 90
+    assert report.invalid == 10
+    assert [line for (line, _) in report.failures] == list(range(4, 100, 10))
+    assert report.failures[0][1].issues[0].path == ["id"]
+    assert report.bytes == jsonl_file.stat().st_size
+    assert report.records_per_second > 0
+
+
+def test_validate_jsonl_workers(jsonl_file):
+    report = zon.validate_jsonl(jsonl_file, validator, workers=2)
+
+    assert (report.total, report.valid, report.invalid) == (100, 90, 10)
+    assert [line for (line, _) in report.failures] == list(range(4, 100, 10))
+
+
+def test_validate_jsonl_report_failures(jsonl_file):
+    report = zon.validate_jsonl(jsonl_file, validator, workers=2, report_failures=3)
+
+    assert report.invalid == 10
+    assert [line for (line, _) in report.failures] == [4, 14, 24]
+
+
+def test_validate_jsonl_blank_lines_and_invalid_json(tmp_path):
+    path = _write_lines(
+        tmp_path / "data.jsonl",
+        ['{"id": 1, "name": "a"}', "", "{not json", '{"id": 2, "name": "b"}'],
+    )
+
+    report = zon.validate_jsonl(path, validator)
+
+    assert (report.total, report.valid, report.invalid) == (3, 2, 1)
+    (line, error) = report.failures[0]
+    assert line == 3
+    assert error.issues[0].code == "invalid_json"
+
+
+def test_validate_jsonl_no_trailing_newline(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"id": 1, "name": "a"}\n{"id": "2", "name": "b"}')
+
+    report = zon.validate_jsonl(path, validator, workers=2)
+
+    assert (report.total, report.invalid) == (2, 1)
+    assert report.failures[0][0] == 2
+
+
+def test_validate_jsonl_empty_file(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text("")
+
+    report = zon.validate_jsonl(path, validator, workers=2)
+
+    assert (report.total, report.failures) == (0, [])
+
+
+def test_validate_jsonl_workers_must_be_positive(jsonl_file):
+    with pytest.raises(ValueError):
+        zon.validate_jsonl(jsonl_file, validator, workers=0)
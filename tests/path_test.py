@@ -0,0 +1,89 @@
+import pytest
+
+import zon
+
+
+@pytest.fixture
+def validator():
+    return zon.record(
+        {
+            "users": zon.element_list(
+                zon.record(
+                    {
+                        "email": zon.string().email(),
+                        "age": zon.number().int(),
+                    }
+                )
+            ),
+            "point": zon.element_tuple([zon.number(), zon.number()]).rest(zon.string()),
+            "id": zon.union([zon.string(), zon.number()]),
+            "meta": zon.record({}).catchall(zon.string()),
+        }
+    )
+
+
+@pytest.fixture(params=["safe_validate", "compile", "codegen"])
+def safe_validate(request, validator):
+    match request.param:
+        case "safe_validate":
+            return validator.safe_validate
+        case "compile":
+            return validator.compile()
+        case "codegen":
+            return validator.codegen()
+
+
+def _paths(error):
+    return [issue.path for issue in error.issues]
+
+
+def test_path_root(safe_validate):
+    (_, error) = safe_validate(1)
+
+    assert _paths(error) == [[]]
+
+
+def test_path_record_list(safe_validate):
+    user = {"email": "john@example.com", "age": 1}
+
+    (valid, error) = safe_validate(
+        {
+            "users": [user, user, user, {"email": "not an email", "age": 1.5}],
+            "point": (1, 2),
+            "id": 1,
+            "meta": {},
+        }
+    )
+
+    assert valid is False
+    assert _paths(error) == [["users", 3, "email"], ["users", 3, "age"]]
+
+
+def test_path_tuple(safe_validate):
+    (_, error) = safe_validate(
+        {"users": [], "point": ("1", 2, "a", 3), "id": 1, "meta": {}}
+    )
+
+    assert _paths(error) == [["point", 0], ["point", 3]]
+
+
+def test_path_union(safe_validate):
+    (_, error) = safe_validate({"users": [], "point": (1, 2), "id": None, "meta": {}})
+
+    assert _paths(error) == [["id"], ["id"], ["id"]]
+
+
+def test_path_catchall(safe_validate):
+    (_, error) = safe_validate(
+        {"users": [], "point": (1, 2), "id": 1, "meta": {"a": "1", "b": 2}}
+    )
+
+    assert _paths(error) == [["meta", "b"]]
+
+
+def test_path_is_not_shared(safe_validate):
+    (_, error) = safe_validate({"users": [{}], "point": (1, 2), "id": 1, "meta": {}})
+
+    (first, second) = error.issues
+
+    assert first.path is not second.path
@@ -0,0 +1,77 @@
+import pickle
+
+import pytest
+
+import zon
+
+
+def is_even(data):
+    return data % 2 == 0
+
+
+validator = zon.record(
+    {
+        "id": zon.number().int().gt(0).refine(is_even),
+        "email": zon.string().email().to_lower_case(),
+        "tags": zon.element_list(zon.string().min(1).max(10)).nonempty(),
+        "kind": zon.union([zon.literal("a"), zon.enum(["b", "c"])]),
+        "created": zon.string().datetime().optional(),
+        "code": zon.element_tuple([zon.string().regex(r"^\d+$"), zon.boolean()]),
+    }
+).strict()
+
+VALID = {
+    "id": 2,
+    "email": "A@EXAMPLE.COM",
+    "tags": ["x"],
+    "kind": "b",
+    "code": ("1", True),
+}
+
+
+def test_pickle_roundtrip():
+    validator._compile()
+
+    unpickled = pickle.loads(pickle.dumps(validator))
+
+    assert unpickled == validator
+    assert unpickled.validate(VALID) == validator.validate(VALID)
+    assert unpickled.safe_validate({**VALID, "id": 3})[0] is False
+
+
+def test_pickle_cached():
+    cached = zon.string().uuid().cached()
+    cached.validate("9a6bc3f4-6bb1-4e8f-8a3f-8c1d8c2a4c5e")
+
+    unpickled = pickle.loads(pickle.dumps(cached))
+
+    assert len(unpickled.cache) == 0
+    assert unpickled.cache.maxsize == cached.cache.maxsize
+
+
+def test_parallel_validate_many():
+    data = [{**VALID, "id": i} for i in range(1, 101)]
+
+    result = validator.safe_validate_many(data, workers=2, chunksize=7)
+
+    assert list(result.errors) == list(range(0, 100, 2))
+    assert result.values[1] == {**VALID, "id": 2, "email": "a@example.com"}
+    assert result.values == validator.safe_validate_many(data).values
+
+
+def test_parallel_validate_many_max_failures():
+    data = [{**VALID, "id": i} for i in range(1, 101)]
+
+    result = validator.safe_validate_many(data, workers=2, chunksize=5, max_failures=10)
+
+    assert result.stopped
+    assert list(result.errors) == list(range(0, 20, 2))
+    assert len(result.values) == 19
+
+
+def test_parallel_validate_many_raises():
+    with pytest.raises(zon.error.ZonError):
+        validator.validate_many([VALID, {**VALID, "id": 1}], workers=2)
+
+    with pytest.raises(ValueError):
+        validator.validate_many([VALID], workers=0)
@@ -0,0 +1,149 @@
+import pickle
+import threading
+import time
+
+import pytest
+
+import zon
+from zon.cache import LRUCache
+
+calls = []
+
+
+def _checksum(value):
+    calls.append(value)
+    return sum(map(int, value)) % 10 == 0
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+def test_refine_cache():
+    validator = zon.string().refine(_checksum, cache=16)
+
+    assert validator.validate("55") == "55"
+    assert validator.validate("55") == "55"
+    assert not validator.is_valid("12")
+    assert not validator.is_valid("12")
+
+    assert calls == ["55", "12"]
+
+
+def test_refine_cache_statistics():
+    cache = LRUCache(2)
+    validator = zon.string().refine(_checksum, cache=cache)
+
+    for value in ["55", "55", "19", "28", "55"]:
+        validator.safe_validate(value)
+
+    assert cache.info() == {
+        "size": 2,
+        "maxsize": 2,
+        "hits": 1,
+        "misses": 4,
+        "evictions": 2,
+    }
+
+
+def test_refine_cache_unhashable_data():
+    calls_by_value = []
+
+    def _nonempty(value):
+        calls_by_value.append(value)
+        return len(value) > 0
+
+    validator = zon.element_list(zon.anything()).refine(_nonempty, cache=16)
+
+    assert validator.is_valid([1])
+    assert validator.is_valid([1])
+    assert len(calls_by_value) == 2
+
+
+def test_refine_cache_tells_types_apart():
+    validator = zon.anything().refine(lambda value: value is not True, cache=16)
+
+    assert validator.is_valid(1)
+    assert not validator.is_valid(True)
+
+
+def test_refine_cache_exceptions_are_not_cached():
+    attempts = []
+
+    def _flaky(value):
+        attempts.append(value)
+
+        if len(attempts) == 1:
+            raise RuntimeError("flaky")
+
+        return True
+
+    validator = zon.string().refine(_flaky, cache=16)
+
+    (valid, error) = validator.safe_validate("a")
+    assert not valid
+    assert error.issues[0].code == "failed_rule_with_exception"
+
+    assert validator.is_valid("a")
+    assert validator.is_valid("a")
+    assert len(attempts) == 2
+
+
+def test_refine_cache_single_flight():
+    computed = []
+
+    def _slow(value):
+        computed.append(value)
+        time.sleep(0.05)
+        return True
+
+    validator = zon.string().refine(_slow, cache=16)
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(validator.is_valid("a")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True] * 8
+    assert computed == ["a"]
+
+
+def test_get_or_compute():
+    cache = LRUCache(4)
+
+    assert cache.get_or_compute("a", lambda: 1) == 1
+    assert cache.get_or_compute("a", lambda: 2) == 1
+    assert cache.info()["hits"] == 1
+    assert cache.info()["misses"] == 1
+
+
+def test_get_or_compute_expires():
+    now = [0.0]
+    cache = LRUCache(4, ttl=10, timer=lambda: now[0])
+
+    assert cache.get_or_compute("a", lambda: 1) == 1
+    now[0] = 11
+    assert cache.get_or_compute("a", lambda: 2) == 2
+
+
+def test_refine_cache_is_part_of_the_structure():
+    assert zon.string().refine(_checksum, cache=16) != zon.string().refine(_checksum)
+    assert zon.string().refine(_checksum, cache=16) != zon.string().refine(
+        _checksum, cache=16
+    )
+
+
+def test_refine_cache_pickle():
+    validator = zon.string().refine(_checksum, cache=16)
+    validator.validate("55")
+
+    unpickled = pickle.loads(pickle.dumps(validator))
+
+    assert unpickled.validate("55") == "55"
+    assert calls == ["55", "55"]
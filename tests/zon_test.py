@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 import zon
@@ -16,3 +19,18 @@ def test_refinement(validator):
 
     with pytest.raises(zon.error.ZonError):
         _validator.validate("21")
+
+
+def test_import_is_lazy():
+    # the helpers for streams, processes, arrays and frames are loaded on first use
+    code = (
+        "import sys, zon; "
+        "print(sorted({'asyncio', 'multiprocessing', 'mmap', 'zon.parallel', 'zon.frame'}"
+        " & sys.modules.keys()))"
+    )
+    process = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert process.stdout.strip() == "[]"
+    assert zon.validate_jsonl.__module__ == "zon.parallel"
@@ -17,10 +17,24 @@ __copyright__ = "Copyright 2023, Nuno Pereira"
 # - Container and other collections.abc types
 # - Typing with Self
 
-import copy
+import copy as _copy
+import functools
+import importlib
+import itertools
 from abc import ABC, abstractmethod, update_abstractmethods
-from typing import Any, Self, TypeVar, final, Literal
-from collections.abc import Callable, Mapping, Sequence  # TODO: explore Container type
+from typing import TYPE_CHECKING, Any, Self, TypeVar, final, Literal
+from collections.abc import (  # TODO: explore Container type
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from collections import deque
 from dataclasses import dataclass, field
 import re
 import math
@@ -28,13 +42,24 @@ from enum import Enum, auto
 
 import validators
 
+from .cache import LRUCache
 from .error import ZonError, ZonIssue
 from .traits import HasMax, HasMin
 
+if TYPE_CHECKING:
+    import asyncio
+
+    from .frame import ZonFrameResult
+    from .parallel import ZonJsonlReport, validate_jsonl
+    from .streams import csv_rows, jsonl_rows
+    from .vectorized import ZonArrayResult
+
 __all__ = [
     "Zon",
     "element_list",
     "ZonList",
+    "ZonBuffer",
+    "buffer",
     "ZonBoolean",
     "boolean",
     # "ZonDate",
@@ -48,6 +73,7 @@ __all__ = [
     "string",
     "ZonOptional",
     "optional",
+    "ZonCached",
     "ZonIntersection",
     "intersection",
     "ZonEnum",
@@ -58,15 +84,85 @@ __all__ = [
     "union",
     "ZonTuple",
     "element_tuple",
+    "intern",
+    "ZonBatchResult",
+    "jsonl_rows",
+    "csv_rows",
+    "validate_jsonl",
+    "ZonJsonlReport",
+    "ZonArrayResult",
+    "ZonFrameResult",
 ]
 
+_LAZY_EXPORTS = {
+    "jsonl_rows": ".streams",
+    "csv_rows": ".streams",
+    "validate_jsonl": ".parallel",
+    "ZonJsonlReport": ".parallel",
+    "ZonArrayResult": ".vectorized",
+    "ZonFrameResult": ".frame",
+}
+"""Public names imported on first use, so that `import zon` does not load their dependencies
+(like `multiprocessing` or `mmap`)."""
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+CopyStrategy = Literal["deep", "on_write", "none"]
+"""How the data under validation is copied:
+
+- `"deep"`: the data is deep-copied once, before validation.
+- `"on_write"`: the data is never copied up-front, containers are only copied if validation changes them.
+- `"none"`: the data is never copied, containers are changed in place.
+"""
+
+_COPY_STRATEGIES = ("deep", "on_write", "none")
+
+InvalidPolicy = Literal["yield", "skip", "raise"]
+"""What `Zon.validate_iter` does with invalid data:
+
+- `"yield"`: yields its error.
+- `"skip"`: leaves it out.
+- `"raise"`: raises its error.
+"""
+
+_INVALID_POLICIES = ("yield", "skip", "raise")
 
-@dataclass
+
+class _AbortValidation(Exception):
+    """Raised to unwind a validation run as soon as it is known to have failed."""
+
+
+@dataclass(slots=True)
 class ValidationContext:
     """Context used throughout an entire validation run"""
 
     error: ZonError = None
-    path: list[str] = field(default_factory=list)
+    path: list[str | int] = field(default_factory=list)
+    """Path to the value currently under validation, as a stack of record keys and list/tuple indices."""
+    copy_strategy: CopyStrategy = "on_write"
+    """How containers changed by validation are written to. Never `"deep"`."""
+    abort_early: bool = False
+    """Whether the validation run stops as soon as the first issue is added."""
+    max_issues: int | None = None
+    """How many issues are collected before the validation run stops, if there is a limit."""
+    record_issues: bool = True
+    """Whether issues are recorded at all. If not, the validation run stops as soon as the first issue is added."""
+    build_output: bool = True
+    """Whether containers build their validated data, or just validate their children."""
+    deferred: list[tuple[AsyncValidationRule, Any, list[str | int]]] | None = None
+    """Async rules left to check once the synchronous part of the run is over, with the data and path they check.
+    `None` if the run cannot await them."""
 
     def _ensure_error(self):
         if self.error is None:
@@ -74,27 +170,77 @@ class ValidationContext:
 
     def add_issue(self, issue: ZonIssue):
         """Adds the given `ZodIssue` to this context's `ZonError`"""
+        if not self.record_issues:
+            raise _AbortValidation()
+
         self._ensure_error()
+
+        if self.max_issues is not None and self.error.issue_count >= self.max_issues:
+            self.error.truncated = True
+            raise _AbortValidation()
+
         self.error.add_issue(issue)
 
+        if self.abort_early:
+            raise _AbortValidation()
+
     def add_issues(self, issues: list[ZonIssue]):
         """Adds the given `ZodIssue`s to this context's `ZonError`"""
+        if not self.record_issues and len(issues) > 0:
+            raise _AbortValidation()
+
         self._ensure_error()
+
+        if self.max_issues is not None:
+            room = self.max_issues - self.error.issue_count
+
+            if len(issues) > room:
+                self.error.add_issues(issues[: max(room, 0)])
+                self.error.truncated = True
+                raise _AbortValidation()
+
         self.error.add_issues(issues)
 
+        if self.abort_early and len(issues) > 0:
+            raise _AbortValidation()
+
     @property
     def dirty(self):
-        return self.error is not None and len(self.error.issues) >= 0
+        return self.error is not None and self.error.issue_count > 0
+
+    @property
+    def issue_count(self) -> int:
+        """The number of issues added to this context so far"""
+        return 0 if self.error is None else self.error.issue_count
 
 
 T = TypeVar("T")
 
 
+@dataclass(slots=True)
+class ZonBatchResult:
+    """The outcome of validating a batch of data with `Zon.safe_validate_many`"""
+
+    values: list[Any]
+    """The validated data, in the same order as the batch. Invalid data is left as `None`."""
+    errors: dict[int, ZonError]
+    """The errors of the invalid data, by their index in the batch."""
+    stopped: bool = False
+    """Whether validation stopped before the end of the batch, because too many pieces of data were invalid."""
+
+    @property
+    def valid(self) -> bool:
+        """Whether every piece of data in the batch is valid"""
+        return len(self.errors) == 0
+
+
 class ValidationRule:
     """
     Custom validation rul used to add more complex validation rules to an existing `Zon`
     """
 
+    __slots__ = ("fn", "name", "additional_data", "_hash")
+
     def __init__(
         self,
         name: str,
@@ -105,6 +251,38 @@ class ValidationRule:
         self.fn = fn
         self.name = name
         self.additional_data = additional_data if additional_data is not None else {}
+        self._hash = None
+
+    def _structural_key(self) -> tuple:
+        fn = self.fn
+
+        if isinstance(fn, functools.partial):
+            # built-in rules are told apart by their parameters
+            fn = (fn.func, _freeze(fn.args), _freeze(fn.keywords))
+
+        return (self.name, _freeze(self.additional_data), fn)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
+        if not isinstance(other, ValidationRule):
+            return NotImplemented
+
+        return (
+            hash(self) == hash(other)
+            and self._structural_key() == other._structural_key()
+        )
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._structural_key())
+
+        return self._hash
+
+    def __getstate__(self):
+        # hashes are not stable across processes
+        return _slots_state(self, ("_hash",))
 
     def check(self, data: T, ctx: ValidationContext) -> T:
         """
@@ -120,280 +298,1836 @@ class ValidationRule:
 
         try:
             new_data, valid = self.fn(data)
-
-            if not valid:
-                ctx.add_issue(
-                    ZonIssue(
-                        value=data,
-                        message=f"Validation failed for type {self.name}",
-                        path=[],
-                    )
-                )
-
-            return new_data
         except Exception as e:
             ctx.add_issue(
                 ZonIssue(
                     value=data,
-                    message=f"Validation failed for type {self.name}: {e}",
-                    path=[],
+                    code="failed_rule_with_exception",
+                    params={"rule": self.name, "exception": e},
+                    path=list(ctx.path),
                 )
             )
 
             return data
 
+        if not valid:
+            ctx.add_issue(
+                ZonIssue(
+                    value=data,
+                    code="failed_rule",
+                    params={"rule": self.name},
+                    path=list(ctx.path),
+                )
+            )
 
-@update_abstractmethods
-class Zon(ABC):
-    """
-    Base class for all Zons.
+        return new_data
 
-    A Zon is the basic unit of validation in Zon.
-    It is used to validate data, and can be composed with other Zons
-    to create more complex validations.
+
+class AsyncValidationRule(ValidationRule):
     """
+    Validation rule whose check is awaited, used by `Zon.refine_async`.
 
-    def __init__(self):
-        self.validators: list[ValidationRule] = []
-        """validators that will run when 'validate' is invoked."""
+    Async rules are not checked where they are found: they are deferred until the rest of the data
+    is validated, and then checked concurrently by `Zon.async_safe_validate`.
+    """
 
-    def _clone(self) -> Self:
-        """Creates a copy of this Zon."""
-        return copy.deepcopy(self)
+    __slots__ = ()
 
-    @abstractmethod
-    def _default_validate(self, data: T, ctx: ValidationContext) -> T:
-        """Default validation for any Zon validator
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[T], Awaitable[bool]],
+        *,
+        additional_data: Mapping[str, Any] = None,
+    ):
+        super().__init__(name, fn, additional_data=additional_data)
 
-        The contract for this method is the same for any other `ValidationRule`: If the validation fails, mark the context as dirty.
+    def check(self, data: T, ctx: ValidationContext) -> T:
+        """
+        Defers this validation rule until the end of the validation run.
 
-        In any case, this method should return the original data
+        Args:
+            data (T): the piece of data to be validated.
+            ctx (ValidationContext): the context in which the validation is being run.
 
-        The default implementation raises a NotImplementedError.
+        Returns:
+            T: The original data
 
-        Args:
-            data (Any): the piece of data to be validated.
-            ctx (ValidationContext): the context of the validation.
+        Raises:
+            NotImplementedError: if the validation run cannot await this rule.
         """
 
-        raise NotImplementedError(
-            "This method is not implemented for the base Zon class. You need to provide your "
-        )
+        if ctx.deferred is None:
+            raise NotImplementedError(
+                f"Rule '{self.name}' is async: validate with async_validate or async_safe_validate. "
+                "Async rules are not supported within unions or cached Zons."
+            )
 
-    @final
-    def _validate(self, data: T) -> tuple[Literal[True], T] | tuple[Literal[False], ZonError]:
-        """Validates the supplied data.
+        ctx.deferred.append((self, data, list(ctx.path)))
+
+        return data
+
+    async def check_async(self, data: T, path: list[str | int]) -> ZonIssue | None:
+        """
+        Awaits this validation rule against the supplied data.
 
         Args:
-            data (Any): the piece of data to be validated.
+            data (T): the piece of data to be validated.
+            path (list[str | int]): the path to the data.
 
         Returns:
-            (bool, T) | (bool, ZonError): A tuple containing a boolean indicating whether the data is valid,
-            and either the validated data or a ZonError object.
+            ZonIssue | None: the issue found, if any.
+        """
 
-        Raises:
-            ZonError: if validation against the supplied data fails.
-            NotImplementedError: if the default validation rule was not overriden for this Zon object.
+        try:
+            valid = await self.fn(data)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return ZonIssue(
+                value=data,
+                code="failed_rule_with_exception",
+                params={"rule": self.name, "exception": e},
+                path=path,
+            )
+
+        if not valid:
+            return ZonIssue(
+                value=data, code="failed_rule", params={"rule": self.name}, path=path
+            )
+
+        return None
+
+
+class BatchValidationRule(ValidationRule):
+    """
+    Validation rule that checks every element of a list at once, used by `ZonList.refine_batch`.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[list[T]], Iterable[bool]],
+        *,
+        additional_data: Mapping[str, Any] = None,
+    ):
+        super().__init__(name, fn, additional_data=additional_data)
+
+    def check_batch(self, candidates: list[tuple[int, T]], ctx: ValidationContext):
+        """
+        Check this validation rule against the elements of a list.
+
+        Args:
+            candidates (list[tuple[int, T]]): the elements to be validated, with their index in the list.
+            ctx (ValidationContext): the context in which the validation is being run.
         """
 
-        ctx = ValidationContext()
+        if not candidates:
+            return
 
-        cloned_data = copy.deepcopy(data)
+        values = [value for (_, value) in candidates]
 
         try:
-            cloned_data = self._default_validate(cloned_data, ctx)
-        except NotImplementedError as ni:
-            raise ni
+            verdicts = list(self.fn(values))
 
-        if ctx.dirty:
-            return (False, ctx.error)
+            if len(verdicts) != len(values):
+                raise ValueError(
+                    f"expected {len(values)} verdicts, got {len(verdicts)}"
+                )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            ctx.add_issue(
+                ZonIssue(
+                    value=values,
+                    code="failed_rule_with_exception",
+                    params={"rule": self.name, "exception": e},
+                    path=list(ctx.path),
+                )
+            )
 
-        for validator in self.validators:
-            cloned_data = validator.check(cloned_data, ctx)
+            return
 
-        return (not ctx.dirty, cloned_data if not ctx.dirty else ctx.error)
+        for (index, value), valid in zip(candidates, verdicts):
+            if not valid:
+                ctx.add_issue(
+                    ZonIssue(
+                        value=value,
+                        code="failed_rule",
+                        params={"rule": self.name},
+                        path=[*ctx.path, index],
+                    )
+                )
 
-    @final
-    def validate(self, data: T) -> T:
-        """Validates the supplied data.
 
-        Args:
-            data (Any): the piece of data to be validated.
+def _slots_state(obj: Any, dropped: Sequence[str]) -> tuple[dict | None, dict]:
+    """Returns the state of an object with `__slots__`, for pickling, with the `dropped` slots set to `None`"""
 
-        Returns:
-            T: the validated data.
+    state = {
+        name: getattr(obj, name)
+        for cls in type(obj).__mro__
+        for name in getattr(cls, "__slots__", ())
+        if hasattr(obj, name)
+    }
 
-        Raises:
-            NotImplementedError: the default implementation of this method
-            is not implemented on base Zon class.
-            ZonError: if validation fails.
-        """
+    for name in dropped:
+        state[name] = None
 
-        valid, data_or_error = self.safe_validate(data)
+    return (getattr(obj, "__dict__", None), state)
 
-        if valid:
-            return data_or_error
 
-        raise data_or_error
+# Built-in validation rules are module-level functions, bound to their parameters with
+# `functools.partial`, so that Zons can be pickled.
 
-    @final
-    def safe_validate(
-        self, data: T
-    ) -> tuple[Literal[True], T] | tuple[Literal[False], ZonError]:
-        """Validates the supplied data. This method is different from `validate` in the sense that
-        it does not raise an error when validation fails. Instead, it returns an object encapsulating
-        either a successful validation result or a validation error.
 
-        Args:
-            data (Any): the piece of data to be validated.
+def _refined(refinement: Callable[[T], bool], data: T) -> tuple[T, bool]:
+    return (data, refinement(data))
 
-        Returns:
-            (bool, T) | (bool, ZonError): A tuple containing a boolean indicating whether the data is valid,
-            and either the validated data or a ZonError object.
 
-        Raises:
-            NotImplementedError: the default implementation of this method
-            is not implemented on base Zon class.
-            Exception: if any unexpected exception is encountered
-        """
+def _refined_cached(
+    refinement: Callable[[T], bool], cache: LRUCache, data: T
+) -> tuple[T, bool]:
+    try:
+        # 1, 1.0 and True are equal, but are not necessarily valid for the same refinements
+        key = (type(data), data)
+        hash(key)
+    except TypeError:
+        # unhashable data
+        return (data, refinement(data))
 
-        try:
-            return self._validate(data)
-        except Exception as e:
-            raise e
+    return (data, cache.get_or_compute(key, lambda: refinement(data)))
 
-    def and_also(self, other: Zon) -> ZonIntersection:
-        """Returns a validator that validates that the data is valid for both this and the supplied validators.
 
-        Args:
-            other (Zon): the second validator
+def _has_max_length(value: int | float, data: Any) -> tuple[Any, bool]:
+    return (data, hasattr(data, "__len__") and len(data) <= value)
 
-        Returns:
-            ZonIntersection: The intersection data validator.
-        """
 
-        return intersection(self, other)
+def _has_min_length(value: int | float, data: Any) -> tuple[Any, bool]:
+    return (data, hasattr(data, "__len__") and len(data) >= value)
 
-    def or_else(self, other: Sequence[Zon]) -> ZonUnion:
-        """Returns a validator that validates that the data is valid for at least one of the supplied validators.
 
-        Args:
-            other (Sequence(Zon))
-        """
+def _has_length(value: int, data: Any) -> tuple[Any, bool]:
+    return (data, hasattr(data, "__len__") and len(data) == value)
 
-        return union([self, *other])
 
-    def optional(self) -> ZonOptional:
-        """Returns a validator that validates that the data is valid for this validator if it exists.
+def _is_nonempty(data: Any) -> tuple[Any, bool]:
+    return (data, hasattr(data, "__len__") and len(data) > 0)
 
-        Returns:
-            ZonOptional: The optional data validator.
-        """
 
-        return optional(self)
+def _has_buffer_length(
+    format_: str | None,
+    check: Callable[[int, Any], tuple[Any, bool]],
+    value: int | float,
+    data: Any,
+) -> tuple[Any, bool]:
+    from .buffers import typed_view  # pylint: disable=import-outside-toplevel
 
-    def list(self) -> ZonList:
-        """Returns a validator that validates a list whose elements are valid under this validator.
+    view = typed_view(data, format_)
+    return (data, isinstance(view, memoryview) and check(value, view)[1])
 
-        Returns:
-            ZonArray: The list data validator.
-        """
 
-        return element_list(self)
+def _is_aligned(alignment: int, data: Any) -> tuple[Any, bool]:
+    # pylint: disable-next=import-outside-toplevel
+    from .buffers import buffer_address, typed_view
 
-    def refine(
-        self, refinement: Callable[[T], bool], /, message: str | None = None
-    ) -> Self:
-        """Returns a validator that validates that the data is valid under this validator and that it is valid under the provided refinement function.
+    view = typed_view(data, None)
+    return (
+        data,
+        isinstance(view, memoryview) and buffer_address(view) % alignment == 0,
+    )
 
-        Args:
-            refinement (Callable[[T], tuple[T, bool]]): the refinement function
-            message (str | None): custom message to be used in the error.
 
-        Returns:
-            Zon: The refined data validator.
-        """
+def _is_email(data: str) -> tuple[str, bool]:
+    return (data, validators.email(data))
 
-        _clone = self._clone()
 
-        _clone.validators.append(
-            ValidationRule(
-                message if message is not None else "custom",
-                lambda data: (data, refinement(data)),
-            )
-        )
+def _is_url(data: str) -> tuple[str, bool]:
+    return (data, validators.url(data))
 
-        return _clone
 
+def _is_uuid(data: str) -> tuple[str, bool]:
+    return (data, validators.uuid(data))
 
-def intersection(zon1: Zon, zon2: Zon) -> ZonIntersection:
-    """Returns a validator that validates that the data is valid for both validators supplied.
 
-    Args:
-        zon1 (Zon): the first validator
-        zon2 (Zon): the second validator
+def _matches(regex: str | re.Pattern[str], data: str) -> tuple[str, bool]:
+    return (data, re.match(regex, data) is not None)
 
-    Returns:
-        ZonIntersection: The intersection data validator.
-    """
 
-    return ZonIntersection(zon1, zon2)
+def _includes(needle: str, data: str) -> tuple[str, bool]:
+    return (data, needle in data)
 
 
-class ZonIntersection(Zon):
-    """A Zon that validates that the data is valid for both this Zon and the supplied Zon."""
+def _starts_with(prefix: str, data: str) -> tuple[str, bool]:
+    return (data, data.startswith(prefix))
 
-    def __init__(self, zon1: Zon, zon2: Zon, /, **kwargs):
-        super().__init__(**kwargs)
-        self.zon1 = zon1
-        self.zon2 = zon2
 
-    def _default_validate(self, data: T, ctx: ValidationContext):
-        (zon_1_parsed, data1_or_error) = self.zon1.safe_validate(data)
+def _ends_with(suffix: str, data: str) -> tuple[str, bool]:
+    return (data, data.endswith(suffix))
+
+
+# code ported from https://github.com/colinhacks/zod. All credit goes to the original author.
+def _time_regex_source(opts: Mapping[str, Any]):
+    regex = r"([01]\d|2[0-3]):[0-5]\d:[0-5]\d"
+
+    if "precision" in opts:
+        precision = opts["precision"]
+
+        regex = rf"{regex}\.\d{{{precision}}}"
+    else:
+        regex = rf"{regex}(\.\d+)?"
+
+    return regex
+
+
+def _datetime_regex(opts: Mapping[str, Any]):
+    dateRegexSource = r"((\d\d[2468][048]|\d\d[13579][26]|\d\d0[48]|[02468][048]00|[13579][26]00)-02-29|\d{4}-((0[13578]|1[02])-(0[1-9]|[12]\d|3[01])|(0[469]|11)-(0[1-9]|[12]\d|30)|(02)-(0[1-9]|1\d|2[0-8])))"
+
+    regex = f"{dateRegexSource}T{_time_regex_source(opts)}"
+
+    branches: list[str] = []
+    branches.append("Z?" if opts.get("local", False) else "Z")
+    if opts.get("offset", False):
+        branches.append(
+            r"([+-]\d{2}(:?\d{2})?)"
+        )  # slight deviation from zod's regex, allowing for hour-only offsets
+
+    regex = f"{regex}({'|'.join(branches)})"
+
+    return re.compile(f"^{regex}$")
+
+
+def _is_ip(opts: Mapping[str, Any], data: str) -> tuple[str, bool]:
+    doesnt_specify_version = "version" not in opts
+
+    if doesnt_specify_version or opts["version"] == "v4":
+        try:
+            if validators.ipv4(data):
+                return (data, True)
+        except validators.ValidationError:
+            pass
+
+    if doesnt_specify_version or opts["version"] == "v6":
+        try:
+            if validators.ipv6(data):
+                return (data, True)
+        except validators.ValidationError:
+            pass
+
+    return (data, False)
+
+
+def _trimmed(data: str) -> tuple[str, bool]:
+    return (data.strip(), True)
+
+
+def _lower_cased(data: str) -> tuple[str, bool]:
+    return (data.lower(), True)
+
+
+def _upper_cased(data: str) -> tuple[str, bool]:
+    return (data.upper(), True)
+
+
+def _is_gt(value: int | float, data: Any) -> tuple[Any, bool]:
+    return (data, data is not None and data > value)
+
+
+def _is_gte(value: int | float, data: Any) -> tuple[Any, bool]:
+    return (data, data is not None and data >= value)
+
+
+def _is_lt(value: int | float, data: Any) -> tuple[Any, bool]:
+    return (data, data is not None and data < value)
+
+
+def _is_lte(value: int | float, data: Any) -> tuple[Any, bool]:
+    return (data, data is not None and data <= value)
+
+
+def _is_multiple_of(base: int | float, data: Any) -> tuple[Any, bool]:
+    return (data, data is not None and data % base == 0)
+
+
+def _is_int(data: Any) -> tuple[Any, bool]:
+    return (data, isinstance(data, int))
+
+
+def _is_float(data: Any) -> tuple[Any, bool]:
+    return (data, isinstance(data, float))
+
+
+def _is_finite(data: Any) -> tuple[Any, bool]:
+    return (data, data is not None and not math.isinf(data))
+
+
+@update_abstractmethods
+class Zon(ABC):
+    """
+    Base class for all Zons.
+
+    A Zon is the basic unit of validation in Zon.
+    It is used to validate data, and can be composed with other Zons
+    to create more complex validations.
+    """
+
+    __slots__ = ("validators", "_hash", "_compiled", "_generated")
+
+    _has_children = True
+    """Whether this Zon validates other Zons. Only those build their validated data, or not."""
+
+    def __init__(self):
+        self.validators: tuple[ValidationRule, ...] = ()
+        """validators that will run when 'validate' is invoked."""
+        self._hash = None
+        self._compiled = None
+        self._generated = None
+
+    def _clone(self) -> Self:
+        """Creates a shallow copy of this Zon.
+
+        Zons are immutable, so the copy shares its children and validators with this Zon.
+        """
+
+        _clone = _copy.copy(self)
+        _clone._hash = None
+        _clone._compiled = None
+        _clone._generated = None
+
+        return _clone
+
+    def _with_validator(self, validator: ValidationRule) -> Self:
+        """Returns a copy of this Zon with the given validator added to it."""
+
+        _clone = self._clone()
+        _clone.validators = (*self.validators, validator)
+
+        return intern(_clone)
+
+    def _structural_key(self) -> tuple:
+        """The values that determine how this Zon validates data.
+
+        Zons with equal keys are equal. Subclasses that hold more state must extend this key.
+        """
+
+        return (type(self), self.validators)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
+        if not isinstance(other, Zon):
+            return NotImplemented
+
+        return (
+            hash(self) == hash(other)
+            and self._structural_key() == other._structural_key()
+        )
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._structural_key())
+
+        return self._hash
+
+    def __getstate__(self):
+        # caches are rebuilt when needed, and hashes are not stable across processes
+        return _slots_state(self, ("_hash", "_compiled", "_generated"))
+
+    @abstractmethod
+    def _default_validate(self, data: T, ctx: ValidationContext) -> T:
+        """Default validation for any Zon validator
+
+        The contract for this method is the same for any other `ValidationRule`: If the validation fails, mark the context as dirty.
+
+        In any case, this method should return the original data
+
+        The default implementation raises a NotImplementedError.
+
+        Args:
+            data (Any): the piece of data to be validated.
+            ctx (ValidationContext): the context of the validation.
+        """
+
+        raise NotImplementedError(
+            "This method is not implemented for the base Zon class. You need to provide your "
+        )
+
+    def _compile_default(self) -> Callable[[T, ValidationContext], T]:
+        """Builds the function used by `compile` in place of `_default_validate`.
+
+        The returned function has the same contract as `_default_validate`, but container Zons
+        override this method so that their children are run through their own compiled functions
+        instead of going through `_run`.
+
+        The default implementation returns `_default_validate` itself.
+        """
+
+        return self._default_validate
+
+    @final
+    def _run(self, data: T, ctx: ValidationContext) -> T:
+        """Validates the supplied data within an existing validation run.
+
+        This is how Zons validate their children: issues are added to the given context,
+        with the path of the data under validation.
+
+        Args:
+            data (Any): the piece of data to be validated.
+            ctx (ValidationContext): the context of the validation.
+
+        Returns:
+            T: the validated data.
+        """
+
+        if not self.validators:
+            return self._default_validate(data, ctx)
+
+        # validators need the validated data
+        build_output = ctx.build_output
+        ctx.build_output = True
+
+        issue_count = ctx.issue_count
+
+        data = self._default_validate(data, ctx)
+
+        if ctx.issue_count == issue_count:
+            for validator in self.validators:
+                data = validator.check(data, ctx)
+
+        ctx.build_output = build_output
+
+        return data
+
+    @final
+    def _compile(self) -> Callable[[T, ValidationContext], T]:
+        """Builds a function that runs this Zon's default validation followed by its validators.
+
+        The function is built once per Zon.
+        """
+
+        if self._compiled is None:
+            self._compiled = self._build_compiled()
+
+        return self._compiled
+
+    def _build_compiled(self) -> Callable[[T, ValidationContext], T]:
+        default = self._compile_default()
+        checks = tuple(validator.check for validator in self.validators)
+
+        if not checks:
+            return default
+
+        has_children = self._has_children
+
+        def _run(data: T, ctx: ValidationContext) -> T:
+            error = ctx.error
+            issue_count = 0 if error is None else error.issue_count
+
+            if ctx.build_output or not has_children:
+                data = default(data, ctx)
+            else:
+                # validators need the validated data
+                ctx.build_output = True
+                data = default(data, ctx)
+                ctx.build_output = False
+
+            error = ctx.error
+
+            if error is None or error.issue_count == issue_count:
+                for check in checks:
+                    data = check(data, ctx)
+
+            return data
+
+        return _run
+
+    def compile(
+        self,
+    ) -> Callable[[T], tuple[Literal[True], T] | tuple[Literal[False], ZonError]]:
+        """Compiles this Zon into a single validation function.
+
+        The schema tree is walked once, and the resulting function validates data without
+        dispatching through `_run` and `_default_validate` for every nested value.
+
+        Changes made to this Zon (or any of its children) after it is compiled are not reflected
+        in the returned function.
+
+        Returns:
+            Callable[[T], (bool, T) | (bool, ZonError)]: a function with the same contract as `safe_validate`.
+        """
+
+        return _entrypoint(self._compile())
+
+    def codegen(
+        self,
+    ) -> Callable[[T], tuple[Literal[True], T] | tuple[Literal[False], ZonError]]:
+        """Compiles this Zon into a validation function by generating Python source code for it.
+
+        Unlike `compile`, which chains closures together, this unrolls the whole schema into
+        a single function: type checks, record keys and simple validation rules are inlined.
+        The generated code can be inspected with `codegen_source`.
+
+        Changes made to this Zon (or any of its children) after it is compiled are not reflected
+        in the returned function.
+
+        Returns:
+            Callable[[T], (bool, T) | (bool, ZonError)]: a function with the same contract as `safe_validate`.
+        """
+
+        # pylint: disable-next=import-outside-toplevel,cyclic-import
+        from .codegen import generate
+
+        if self._generated is None:
+            self._generated = generate(self)
+
+        return _entrypoint(self._generated)
+
+    def codegen_source(self) -> str:
+        """Returns the Python source code that `codegen` generates for this Zon.
+
+        Returns:
+            str: the source code of the generated validation function.
+        """
+
+        # pylint: disable-next=import-outside-toplevel,cyclic-import
+        from .codegen import generate_source
+
+        (source, _) = generate_source(self)
+
+        return source
+
+    @final
+    def _validate(
+        self,
+        data: T,
+        copy_strategy: CopyStrategy = "on_write",
+        abort_early: bool = False,
+        max_issues: int | None = None,
+        aggregate: bool = False,
+    ) -> tuple[Literal[True], T] | tuple[Literal[False], ZonError]:
+        """Validates the supplied data.
+
+        Args:
+            data (Any): the piece of data to be validated.
+            copy_strategy (CopyStrategy): how the data is copied.
+            abort_early (bool): whether to stop at the first issue.
+            max_issues (int, optional): how many issues to collect before stopping.
+            aggregate (bool): whether to group the issues by code and path pattern.
+
+        Returns:
+            (bool, T) | (bool, ZonError): A tuple containing a boolean indicating whether the data is valid,
+            and either the validated data or a ZonError object.
+
+        Raises:
+            ZonError: if validation against the supplied data fails.
+            NotImplementedError: if the default validation rule was not overriden for this Zon object.
+        """
+
+        (cloned_data, ctx) = _prepare(
+            data, copy_strategy, abort_early, max_issues, aggregate
+        )
+
+        try:
+            cloned_data = self._run(cloned_data, ctx)
+        except _AbortValidation:
+            return (False, ctx.error)
+        except NotImplementedError as ni:
+            raise ni
+
+        return (not ctx.dirty, cloned_data if not ctx.dirty else ctx.error)
+
+    @final
+    def validate(
+        self,
+        data: T,
+        *,
+        copy: CopyStrategy = "on_write",
+        abort_early: bool = False,
+        max_issues: int | None = None,
+        aggregate: bool = False,
+    ) -> T:
+        """Validates the supplied data.
+
+        Args:
+            data (Any): the piece of data to be validated.
+            copy (CopyStrategy): how the data is copied. By default, the data is only copied
+            where validation changes it (e.g. when transforming strings or stripping record keys).
+            abort_early (bool): whether to stop validating as soon as the first issue is found.
+            If so, the raised `ZonError` only holds the issues found up until then.
+            max_issues (int, optional): how many issues to collect before stopping validation.
+            If more issues are found, the raised `ZonError` is marked as `truncated`.
+            aggregate (bool): whether the raised `ZonError` groups its issues by code and path pattern
+            (with list and tuple indices replaced by `"*"`), instead of keeping every one of them.
+
+        Returns:
+            T: the validated data.
+
+        Raises:
+            NotImplementedError: the default implementation of this method
+            is not implemented on base Zon class.
+            ZonError: if validation fails.
+        """
+
+        valid, data_or_error = self.safe_validate(
+            data,
+            copy=copy,
+            abort_early=abort_early,
+            max_issues=max_issues,
+            aggregate=aggregate,
+        )
+
+        if valid:
+            return data_or_error
+
+        raise data_or_error
+
+    @final
+    def safe_validate(
+        self,
+        data: T,
+        *,
+        copy: CopyStrategy = "on_write",
+        abort_early: bool = False,
+        max_issues: int | None = None,
+        aggregate: bool = False,
+    ) -> tuple[Literal[True], T] | tuple[Literal[False], ZonError]:
+        """Validates the supplied data. This method is different from `validate` in the sense that
+        it does not raise an error when validation fails. Instead, it returns an object encapsulating
+        either a successful validation result or a validation error.
+
+        Args:
+            data (Any): the piece of data to be validated.
+            copy (CopyStrategy): how the data is copied. By default, the data is only copied
+            where validation changes it (e.g. when transforming strings or stripping record keys).
+            abort_early (bool): whether to stop validating as soon as the first issue is found.
+            If so, the returned `ZonError` only holds the issues found up until then.
+            max_issues (int, optional): how many issues to collect before stopping validation.
+            If more issues are found, the returned `ZonError` is marked as `truncated`.
+            aggregate (bool): whether the returned `ZonError` groups its issues by code and path pattern
+            (with list and tuple indices replaced by `"*"`), instead of keeping every one of them.
+
+        Returns:
+            (bool, T) | (bool, ZonError): A tuple containing a boolean indicating whether the data is valid,
+            and either the validated data or a ZonError object.
+
+        Raises:
+            NotImplementedError: the default implementation of this method
+            is not implemented on base Zon class.
+            Exception: if any unexpected exception is encountered
+        """
+
+        try:
+            return self._validate(data, copy, abort_early, max_issues, aggregate)
+        except Exception as e:
+            raise e
+
+    @final
+    def is_valid(self, data: T) -> bool:
+        """Checks whether the supplied data is valid.
+
+        This is cheaper than `safe_validate`: the compiled validation function is used (see `compile`),
+        validation stops at the first issue, no issues are recorded and, where possible, no validated
+        data is built. Most of the savings are on invalid data.
+
+        Args:
+            data (Any): the piece of data to be validated.
+
+        Returns:
+            bool: whether the data is valid.
+        """
+
+        ctx = ValidationContext(record_issues=False, build_output=False)
+
+        try:
+            self._compile()(data, ctx)
+        except _AbortValidation:
+            return False
+
+        return True
+
+    @final
+    async def async_validate(
+        self,
+        data: T,
+        *,
+        copy: CopyStrategy = "on_write",
+        abort_early: bool = False,
+        max_issues: int | None = None,
+        concurrency: int = 16,
+    ) -> T:
+        """Validates the supplied data, awaiting its async refinements.
+
+        Args:
+            data (Any): the piece of data to be validated.
+            copy (CopyStrategy): how the data is copied.
+            abort_early (bool): whether to stop validating as soon as the first issue is found.
+            max_issues (int, optional): how many issues to collect before stopping validation.
+            concurrency (int): how many async refinements are awaited at a time.
+
+        Returns:
+            T: the validated data.
+
+        Raises:
+            ZonError: if validation fails.
+        """
+
+        valid, data_or_error = await self.async_safe_validate(
+            data,
+            copy=copy,
+            abort_early=abort_early,
+            max_issues=max_issues,
+            concurrency=concurrency,
+        )
+
+        if valid:
+            return data_or_error
+
+        raise data_or_error
+
+    @final
+    async def async_safe_validate(
+        self,
+        data: T,
+        *,
+        copy: CopyStrategy = "on_write",
+        abort_early: bool = False,
+        max_issues: int | None = None,
+        concurrency: int = 16,
+    ) -> tuple[Literal[True], T] | tuple[Literal[False], ZonError]:
+        """Validates the supplied data, awaiting its async refinements, without raising an error when validation fails.
+
+        The data is validated synchronously first, deferring async refinements (e.g. of every element
+        of a list), which are then awaited concurrently. Their issues follow the synchronous ones.
+
+        Args:
+            data (Any): the piece of data to be validated.
+            copy (CopyStrategy): how the data is copied.
+            abort_early (bool): whether to stop validating as soon as the first issue is found.
+            max_issues (int, optional): how many issues to collect before stopping validation.
+            concurrency (int): how many async refinements are awaited at a time.
+
+        Returns:
+            (bool, T) | (bool, ZonError): A tuple containing a boolean indicating whether the data is valid,
+            and either the validated data or a ZonError object.
+        """
+
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        return await self._async_validate(
+            data, copy, abort_early, max_issues, asyncio.Semaphore(concurrency)
+        )
+
+    @final
+    async def _async_validate(
+        self,
+        data: T,
+        copy_strategy: CopyStrategy,
+        abort_early: bool,
+        max_issues: int | None,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[Literal[True], T] | tuple[Literal[False], ZonError]:
+        (cloned_data, ctx) = _prepare(data, copy_strategy, abort_early, max_issues)
+        ctx.deferred = []
+
+        try:
+            cloned_data = self._run(cloned_data, ctx)
+
+            if ctx.deferred:
+                await _check_deferred(ctx, semaphore)
+        except _AbortValidation:
+            return (False, ctx.error)
+
+        return (not ctx.dirty, cloned_data if not ctx.dirty else ctx.error)
+
+    @final
+    def validate_many(
+        self,
+        data: Iterable[T],
+        *,
+        copy: CopyStrategy = "on_write",
+        abort_early: bool = False,
+        max_issues: int | None = None,
+        workers: int | None = None,
+        chunksize: int = 1000,
+    ) -> list[T]:
+        """Validates every piece of data in the supplied batch.
+
+        Args:
+            data (Iterable[Any]): the batch of data to be validated.
+            copy (CopyStrategy): how each piece of data is copied.
+            abort_early (bool): whether to stop validating each piece of data as soon as its first issue is found.
+            max_issues (int, optional): how many issues to collect for each piece of data.
+            workers (int, optional): how many worker processes to validate the batch with. See `safe_validate_many`.
+            chunksize (int): how many pieces of data are sent to a worker process at a time.
+
+        Returns:
+            list[T]: the validated data, in the same order as the batch.
+
+        Raises:
+            ZonError: the error of the first invalid piece of data. The rest of the batch is not validated.
+        """
+
+        result = self.safe_validate_many(
+            data,
+            copy=copy,
+            abort_early=abort_early,
+            max_issues=max_issues,
+            max_failures=1,
+            workers=workers,
+            chunksize=chunksize,
+        )
+
+        if result.valid:
+            return result.values
+
+        raise next(iter(result.errors.values()))
+
+    @final
+    def safe_validate_many(
+        self,
+        data: Iterable[T],
+        *,
+        copy: CopyStrategy = "on_write",
+        abort_early: bool = False,
+        max_issues: int | None = None,
+        max_failures: int | None = None,
+        workers: int | None = None,
+        chunksize: int = 1000,
+    ) -> ZonBatchResult:
+        """Validates every piece of data in the supplied batch, without raising errors.
+
+        This is faster than calling `safe_validate` for each piece of data, since the validation
+        setup is shared by the whole batch.
+
+        Args:
+            data (Iterable[Any]): the batch of data to be validated.
+            copy (CopyStrategy): how each piece of data is copied.
+            abort_early (bool): whether to stop validating each piece of data as soon as its first issue is found.
+            max_issues (int, optional): how many issues to collect for each piece of data.
+            max_failures (int, optional): how many pieces of data can be invalid before the rest of the batch
+            is skipped. By default, the whole batch is validated.
+            workers (int, optional): how many worker processes to validate the batch with, in chunks.
+            By default, the batch is validated in the current process. This Zon (including the functions
+            it was refined with) must be picklable, i.e. refinements must be importable functions.
+            chunksize (int): how many pieces of data are sent to a worker process at a time.
+
+        Returns:
+            ZonBatchResult: the validated data and the errors of the invalid data, by index.
+        """
+
+        if workers is not None:
+            _check_options(copy, max_issues)
+
+            from .parallel import (  # pylint: disable=import-outside-toplevel
+                validate_many,
+            )
+
+            return validate_many(
+                self,
+                data,
+                workers=workers,
+                chunksize=chunksize,
+                copy_strategy=copy,
+                abort_early=abort_early,
+                max_issues=max_issues,
+                max_failures=max_failures,
+            )
+
+        return _validate_many(
+            self._compile(),
+            data,
+            copy,
+            abort_early,
+            max_issues,
+            max_failures=max_failures,
+        )
+
+    @final
+    def validate_iter(
+        self,
+        data: Iterable[T],
+        *,
+        copy: CopyStrategy = "on_write",
+        abort_early: bool = False,
+        max_issues: int | None = None,
+        chunk_size: int = 256,
+        invalid: InvalidPolicy = "yield",
+    ) -> Iterator[tuple[int, Literal[True], T] | tuple[int, Literal[False], ZonError]]:
+        """Lazily validates every piece of data in the supplied, possibly unbounded, iterable.
+
+        Data is read and validated in chunks, so only `chunk_size` pieces of data are held at a time.
+        Pieces of data that are already a ZonError, like the malformed lines of `jsonl_rows`,
+        are invalid with that error.
+
+        Args:
+            data (Iterable[Any]): the data to be validated, e.g. from `jsonl_rows` or `csv_rows`.
+            copy (CopyStrategy): how each piece of data is copied.
+            abort_early (bool): whether to stop validating each piece of data as soon as its first issue is found.
+            max_issues (int, optional): how many issues to collect for each piece of data.
+            chunk_size (int): how many pieces of data are validated at a time.
+            invalid (InvalidPolicy): whether to yield (the default), skip or raise the errors of invalid data.
+
+        Returns:
+            Iterator[(int, bool, T) | (int, bool, ZonError)]: for each piece of data, its index,
+            whether it is valid, and either the validated data or a ZonError object.
+
+        Raises:
+            ValueError: if `chunk_size` is less than 1, `invalid` is not a known policy,
+            or the copy strategy or `max_issues` are invalid.
+            ZonError: if `invalid` is `"raise"`, the error of the first invalid piece of data.
+        """
+
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+        if invalid not in _INVALID_POLICIES:
+            raise ValueError(
+                f"Unknown invalid data policy {invalid!r}, expected one of {_INVALID_POLICIES}"
+            )
+
+        _check_options(copy, max_issues)
+
+        return self._validate_iter(
+            data,
+            copy_strategy=copy,
+            abort_early=abort_early,
+            max_issues=max_issues,
+            chunk_size=chunk_size,
+            invalid=invalid,
+        )
+
+    def _validate_iter(
+        self,
+        data: Iterable[T],
+        *,
+        copy_strategy: CopyStrategy,
+        abort_early: bool,
+        max_issues: int | None,
+        chunk_size: int,
+        invalid: InvalidPolicy,
+    ) -> Iterator[tuple[int, Literal[True], T] | tuple[int, Literal[False], ZonError]]:
+        run = self._compile()
+        iterator = iter(data)
+        offset = 0
+
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+
+            if not chunk:
+                return
+
+            # e.g. the malformed lines of `jsonl_rows`, which are not validated
+            errors = {
+                index: value
+                for (index, value) in enumerate(chunk)
+                if isinstance(value, ZonError)
+            }
+            positions = [index for index in range(len(chunk)) if index not in errors]
+
+            result = _validate_many(
+                run,
+                [chunk[index] for index in positions] if errors else chunk,
+                copy_strategy,
+                abort_early,
+                max_issues,
+            )
+            values = dict(zip(positions, result.values))
+            errors.update(
+                (positions[index], error) for (index, error) in result.errors.items()
+            )
+
+            for index in range(len(chunk)):
+                error = errors.get(index)
+
+                if error is None:
+                    yield (offset + index, True, values[index])
+                elif invalid == "yield":
+                    yield (offset + index, False, error)
+                elif invalid == "raise":
+                    raise error
+
+            offset += len(chunk)
+
+    def avalidate_iter(
+        self,
+        data: AsyncIterable[T],
+        *,
+        copy: CopyStrategy = "on_write",
+        abort_early: bool = False,
+        max_issues: int | None = None,
+        window: int = 64,
+        concurrency: int = 16,
+        invalid: InvalidPolicy = "yield",
+    ) -> AsyncIterator[
+        tuple[int, Literal[True], T] | tuple[int, Literal[False], ZonError]
+    ]:
+        """Lazily validates every piece of data in the supplied async iterable, awaiting async refinements.
+
+        Up to `window` pieces of data are validated at a time. Results are yielded in order, and no more
+        data is read while the window is full, so a slow refinement holds back the source instead of
+        letting data pile up.
+
+        Args:
+            data (AsyncIterable[Any]): the data to be validated, e.g. read from a socket or a queue.
+            copy (CopyStrategy): how each piece of data is copied.
+            abort_early (bool): whether to stop validating each piece of data as soon as its first issue is found.
+            max_issues (int, optional): how many issues to collect for each piece of data.
+            window (int): how many pieces of data are validated at a time.
+            concurrency (int): how many async refinements are awaited at a time, across the whole window.
+            invalid (InvalidPolicy): whether to yield (the default), skip or raise the errors of invalid data.
+
+        Returns:
+            AsyncIterator[(int, bool, T) | (int, bool, ZonError)]: for each piece of data, its index,
+            whether it is valid, and either the validated data or a ZonError object.
+
+        Raises:
+            ValueError: if `window` or `concurrency` is less than 1, `invalid` is not a known policy,
+            or the copy strategy or `max_issues` are invalid.
+            ZonError: if `invalid` is `"raise"`, the error of the first invalid piece of data.
+        """
+
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        if invalid not in _INVALID_POLICIES:
+            raise ValueError(
+                f"Unknown invalid data policy {invalid!r}, expected one of {_INVALID_POLICIES}"
+            )
+
+        _check_options(copy, max_issues)
+
+        return self._avalidate_iter(
+            data,
+            copy_strategy=copy,
+            abort_early=abort_early,
+            max_issues=max_issues,
+            window=window,
+            concurrency=concurrency,
+            invalid=invalid,
+        )
+
+    async def _avalidate_iter(
+        self,
+        data: AsyncIterable[T],
+        *,
+        copy_strategy: CopyStrategy,
+        abort_early: bool,
+        max_issues: int | None,
+        window: int,
+        concurrency: int,
+        invalid: InvalidPolicy,
+    ) -> AsyncIterator[
+        tuple[int, Literal[True], T] | tuple[int, Literal[False], ZonError]
+    ]:
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        semaphore = asyncio.Semaphore(concurrency)
+        pending: deque[asyncio.Future] = deque()
+        index = 0
+
+        async def _results(
+            drain: bool,
+        ) -> AsyncIterator[
+            tuple[int, Literal[True], T] | tuple[int, Literal[False], ZonError]
+        ]:
+            # results are yielded in order: when the window is full (or the data is over), wait for
+            # the oldest piece of data, otherwise only yield what is already done
+            while pending and (drain or len(pending) >= window or pending[0].done()):
+                (valid, data_or_error) = await pending.popleft()
+
+                if valid:
+                    yield (index - len(pending) - 1, True, data_or_error)
+                elif invalid == "yield":
+                    yield (index - len(pending) - 1, False, data_or_error)
+                elif invalid == "raise":
+                    raise data_or_error
+
+        try:
+            async for item in data:
+                pending.append(
+                    asyncio.ensure_future(
+                        self._async_validate(
+                            item, copy_strategy, abort_early, max_issues, semaphore
+                        )
+                    )
+                )
+                index += 1
+
+                async for result in _results(drain=False):
+                    yield result
+
+            async for result in _results(drain=True):
+                yield result
+        finally:
+            # the consumer may have stopped early
+            for future in pending:
+                future.cancel()
+
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def and_also(self, other: Zon) -> ZonIntersection:
+        """Returns a validator that validates that the data is valid for both this and the supplied validators.
+
+        Args:
+            other (Zon): the second validator
+
+        Returns:
+            ZonIntersection: The intersection data validator.
+        """
+
+        return intersection(self, other)
+
+    def or_else(self, other: Sequence[Zon]) -> ZonUnion:
+        """Returns a validator that validates that the data is valid for at least one of the supplied validators.
+
+        Args:
+            other (Sequence(Zon))
+        """
+
+        return union([self, *other])
+
+    def optional(self) -> ZonOptional:
+        """Returns a validator that validates that the data is valid for this validator if it exists.
+
+        Returns:
+            ZonOptional: The optional data validator.
+        """
+
+        return optional(self)
+
+    def cached(self, maxsize: int = 1024, ttl: float | None = None) -> ZonCached:
+        """Returns a validator that caches the outcome of validating hashable data with this validator.
+
+        Only use this on validators whose outcome only depends on the data under validation,
+        e.g. do not cache validators refined with functions that depend on the current time.
+
+        Args:
+            maxsize (int): how many outcomes to keep. The least recently used ones are evicted first.
+            ttl (float, optional): how many seconds outcomes are kept for. By default, they do not expire.
+
+        Returns:
+            ZonCached: The caching data validator.
+        """
+
+        return ZonCached(self, maxsize, ttl)
+
+    def list(self) -> ZonList:
+        """Returns a validator that validates a list whose elements are valid under this validator.
+
+        Returns:
+            ZonArray: The list data validator.
+        """
+
+        return element_list(self)
+
+    def refine(
+        self,
+        refinement: Callable[[T], bool],
+        /,
+        message: str | None = None,
+        *,
+        cache: int | LRUCache | None = None,
+    ) -> Self:
+        """Returns a validator that validates that the data is valid under this validator and that it is valid under the provided refinement function.
+
+        Args:
+            refinement (Callable[[T], tuple[T, bool]]): the refinement function
+            message (str | None): custom message to be used in the error.
+            cache (int | LRUCache, optional): memoizes the outcomes of the refinement for hashable data,
+            in an LRU cache of the given size, or in the given `LRUCache` (e.g. to read its statistics
+            or give its entries a TTL). Only pure refinements should be cached. Concurrent checks of the
+            same data run the refinement once.
+
+        Returns:
+            Zon: The refined data validator.
+        """
+
+        if cache is None:
+            fn = functools.partial(_refined, refinement)
+        else:
+            if not isinstance(cache, LRUCache):
+                cache = LRUCache(cache)
+
+            fn = functools.partial(_refined_cached, refinement, cache)
+
+        return self._with_validator(
+            ValidationRule(message if message is not None else "custom", fn)
+        )
+
+    def refine_async(
+        self, refinement: Callable[[T], Awaitable[bool]], /, message: str | None = None
+    ) -> Self:
+        """Returns a validator that validates that the data is valid under this validator and that it is valid under the provided async refinement function.
+
+        Async refinements are awaited concurrently once the rest of the data is validated, so data
+        with async refinements must be validated with `async_validate` or `async_safe_validate`.
+        They are not supported within unions or cached Zons.
+
+        Args:
+            refinement (Callable[[T], Awaitable[bool]]): the async refinement function
+            message (str | None): custom message to be used in the error.
+
+        Returns:
+            Zon: The refined data validator.
+        """
+
+        return self._with_validator(
+            AsyncValidationRule(
+                message if message is not None else "custom", refinement
+            )
+        )
+
+
+_INTERNED = LRUCache(maxsize=4096)
+"""Canonical instances of the Zons built so far, see `intern`."""
+
+_BUILDERS = LRUCache(maxsize=1024)
+"""Results of memoized builder calls."""
+
+
+def intern(zon: Zon) -> Zon:
+    """Returns the canonical instance of the given Zon.
+
+    Structurally equal Zons are interned to the same instance, so that they share memory
+    and compiled validation functions. Builder methods intern the Zons they return.
+
+    Args:
+        zon (Zon): the Zon to intern.
+
+    Returns:
+        Zon: a Zon equal to the given one.
+    """
+
+    interned = _INTERNED.get(zon)
+
+    if interned is None:
+        _INTERNED.put(zon, zon)
+        return zon
+
+    return interned
+
+
+def _memoized(builder: Callable[..., Zon]) -> Callable[..., Zon]:
+    """Memoizes a builder method, so that calling it again with equal arguments returns the same Zon."""
+
+    @functools.wraps(builder)
+    def _builder(self, *args, **kwargs):
+        key = (builder, self, _freeze(args), _freeze(kwargs))
+        result = _BUILDERS.get(key)
+
+        if result is None:
+            result = intern(builder(self, *args, **kwargs))
+            _BUILDERS.put(key, result)
+
+        return result
+
+    return _builder
+
+
+class _Identity:
+    """Wraps unhashable values so that they are compared by identity."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and self.value is other.value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+
+class _HashedItems:
+    """The items of a mapping, hashed once, for structural keys that are rebuilt often."""
+
+    __slots__ = ("items", "_hash")
+
+    def __init__(self, items: tuple[tuple[Any, Any], ...]):
+        self.items = items
+        self._hash = hash(items)
+
+    def __reduce__(self):
+        # hashes are not stable across processes
+        return (_HashedItems, (self.items,))
+
+    def __eq__(self, other: object) -> bool:
+        return self is other or (
+            isinstance(other, _HashedItems)
+            and self._hash == other._hash
+            and self.items == other.items
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+def _freeze(value: Any) -> Hashable:
+    """Returns a hashable version of `value`, for structural keys.
+
+    Values of different types are never equal, so `1`, `1.0` and `True` are told apart.
+    """
+
+    if isinstance(value, (Zon, ValidationRule)):
+        return value
+
+    if isinstance(value, Mapping):
+        return (type(value), tuple((k, _freeze(v)) for k, v in value.items()))
+
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(v) for v in value))
+
+    try:
+        hash(value)
+    except TypeError:
+        return _Identity(value)
+
+    return (type(value), value)
+
+
+async def _check_deferred(ctx: ValidationContext, semaphore: asyncio.Semaphore):
+    """Awaits the async rules deferred during a validation run, as many at a time as `semaphore` allows.
+
+    Issues are added in the order the rules were deferred in.
+    """
+
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    async def _check(rule: AsyncValidationRule, data: Any, path: list[str | int]):
+        async with semaphore:
+            return await rule.check_async(data, path)
+
+    tasks = [
+        asyncio.ensure_future(_check(rule, data, path))
+        for (rule, data, path) in ctx.deferred
+    ]
+
+    try:
+        for task in tasks:
+            issue = await task
+
+            if issue is not None:
+                ctx.add_issue(issue)
+    finally:
+        # the run may have been aborted
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _check_options(copy_strategy: CopyStrategy, max_issues: int | None):
+    if copy_strategy not in _COPY_STRATEGIES:
+        raise ValueError(
+            f"Unknown copy strategy {copy_strategy!r}, expected one of {_COPY_STRATEGIES}"
+        )
+
+    if max_issues is not None and max_issues < 1:
+        raise ValueError(f"max_issues must be at least 1, got {max_issues}")
+
+
+def _prepare(
+    data: T,
+    copy_strategy: CopyStrategy,
+    abort_early: bool,
+    max_issues: int | None = None,
+    aggregate: bool = False,
+) -> tuple[T, ValidationContext]:
+    """Sets up a validation run, copying the data if needed.
+
+    Returns:
+        (T, ValidationContext): the data to validate and the context for the run.
+    """
+
+    _check_options(copy_strategy, max_issues)
+
+    ctx = ValidationContext(
+        error=ZonError(aggregate=True) if aggregate else None,
+        copy_strategy=copy_strategy,
+        abort_early=abort_early,
+        max_issues=max_issues,
+    )
+
+    if copy_strategy == "deep":
+        # we own the copy, so it can be changed in place from now on
+        ctx.copy_strategy = "none"
+
+        return (_copy.deepcopy(data), ctx)
+
+    return (data, ctx)
+
+
+def _shared_runner(
+    run: Callable[[T, ValidationContext], T],
+    copy_strategy: CopyStrategy,
+    abort_early: bool,
+    max_issues: int | None,
+) -> Callable[[T], tuple[Literal[True], T] | tuple[Literal[False], ZonError]]:
+    """Returns a function that validates data with `run`, sharing one validation context between calls.
+
+    The returned function has the same contract as `Zon.safe_validate`.
+    """
+
+    _check_options(copy_strategy, max_issues)
+
+    deep = copy_strategy == "deep"
+    if deep:
+        # we own the copies, so they can be changed in place
+        copy_strategy = "none"
+
+    ctx = ValidationContext(
+        copy_strategy=copy_strategy, abort_early=abort_early, max_issues=max_issues
+    )
+
+    def _validate(data: T) -> tuple[Literal[True], T] | tuple[Literal[False], ZonError]:
+        if deep:
+            data = _copy.deepcopy(data)
+
+        ctx.error = None
+
+        try:
+            data = run(data, ctx)
+        except _AbortValidation:
+            # the run was unwound, so the context must be reset
+            ctx.path.clear()
+            ctx.copy_strategy = copy_strategy
+            ctx.build_output = True
+
+        if ctx.dirty:
+            return (False, ctx.error)
+
+        return (True, data)
+
+    return _validate
+
+
+def _validate_many(
+    run: Callable[[T, ValidationContext], T],
+    data: Iterable[T],
+    copy_strategy: CopyStrategy,
+    abort_early: bool,
+    max_issues: int | None,
+    *,
+    max_failures: int | None = None,
+) -> ZonBatchResult:
+    """Validates every piece of data with `run`, sharing one validation context between them."""
+
+    if max_failures is not None and max_failures < 1:
+        raise ValueError(f"max_failures must be at least 1, got {max_failures}")
+
+    validate = _shared_runner(run, copy_strategy, abort_early, max_issues)
+
+    values = []
+    errors = {}
+    result = ZonBatchResult(values, errors)
+
+    for index, item in enumerate(data):
+        (valid, data_or_error) = validate(item)
+
+        if valid:
+            values.append(data_or_error)
+            continue
+
+        values.append(None)
+        errors[index] = data_or_error
+
+        if max_failures is not None and len(errors) >= max_failures:
+            result.stopped = True
+            break
+
+    return result
+
+
+def _discarded_copy_strategy(copy_strategy: CopyStrategy) -> CopyStrategy:
+    """The copy strategy for validating values whose validated counterpart is discarded.
+
+    Zons that return the data they were given as-is (lists, unions, ...) must not have it changed
+    in place by their children.
+    """
+
+    return "on_write" if copy_strategy == "none" else copy_strategy
+
+
+_REMOVED = object()
+"""Marks record keys that are removed from the validated data."""
+
+
+def _record_change(
+    changes: dict[Any, Any] | None, data: dict, key: Any, value: Any, validated: Any
+) -> dict[Any, Any] | None:
+    """Records that validating `data[key]` (`value`) produced `validated`.
+
+    `None` values are removed from the validated data.
+
+    Returns:
+        dict | None: the changes that must be applied to `data`, if any.
+    """
+
+    if validated is None:
+        if key not in data:
+            return changes
+
+        validated = _REMOVED
+    elif validated is value or validated == value:
+        return changes
+
+    if changes is None:
+        changes = {}
+
+    changes[key] = validated
+
+    return changes
+
+
+def _record_output(
+    data: dict, changes: dict[Any, Any] | None, copy_strategy: CopyStrategy
+) -> dict:
+    """Applies the changes made while validating a record, copying it unless told otherwise."""
+
+    if changes is None:
+        return data
+
+    output = data if copy_strategy == "none" else dict(data)
+
+    for key, value in changes.items():
+        if value is _REMOVED:
+            del output[key]
+        else:
+            output[key] = value
+
+    return output
+
+
+def _entrypoint(
+    run: Callable[[T, ValidationContext], T],
+) -> Callable[[T], tuple[Literal[True], T] | tuple[Literal[False], ZonError]]:
+    """Wraps a compiled validation function so that it has the same contract as `Zon.safe_validate`."""
+
+    def _compiled(
+        data: T,
+        *,
+        copy: CopyStrategy = "on_write",
+        abort_early: bool = False,
+        max_issues: int | None = None,
+        aggregate: bool = False,
+    ) -> tuple[Literal[True], T] | tuple[Literal[False], ZonError]:
+        if copy == "on_write" and max_issues is None and not aggregate:
+            # the default options need neither checking nor copying
+            (cloned_data, ctx) = (data, ValidationContext(abort_early=abort_early))
+        else:
+            (cloned_data, ctx) = _prepare(
+                data, copy, abort_early, max_issues, aggregate
+            )
+
+        try:
+            cloned_data = run(cloned_data, ctx)
+        except _AbortValidation:
+            return (False, ctx.error)
+
+        if ctx.dirty:
+            return (False, ctx.error)
+
+        return (True, cloned_data)
+
+    return _compiled
+
+
+def intersection(zon1: Zon, zon2: Zon) -> ZonIntersection:
+    """Returns a validator that validates that the data is valid for both validators supplied.
+
+    Args:
+        zon1 (Zon): the first validator
+        zon2 (Zon): the second validator
+
+    Returns:
+        ZonIntersection: The intersection data validator.
+    """
+
+    return ZonIntersection(zon1, zon2)
+
+
+class ZonIntersection(Zon):
+    """A Zon that validates that the data is valid for both this Zon and the supplied Zon."""
+
+    __slots__ = ("zon1", "zon2")
+
+    def __init__(self, zon1: Zon, zon2: Zon, /, **kwargs):
+        super().__init__(**kwargs)
+        self.zon1 = zon1
+        self.zon2 = zon2
+
+    def _structural_key(self) -> tuple:
+        return (*super()._structural_key(), self.zon1, self.zon2)
+
+    def _default_validate(self, data: T, ctx: ValidationContext):
+        copy_strategy = ctx.copy_strategy
+        ctx.copy_strategy = _discarded_copy_strategy(copy_strategy)
+
+        issue_count = ctx.issue_count
+
+        self.zon1._run(data, ctx)
+
+        if ctx.issue_count == issue_count:
+            self.zon2._run(data, ctx)
+
+        ctx.copy_strategy = copy_strategy
+
+        return data
+
+    def _compile_default(self):
+        zon1 = self.zon1._compile()
+        zon2 = self.zon2._compile()
+
+        def _check(data, ctx: ValidationContext):
+            copy_strategy = ctx.copy_strategy
+            ctx.copy_strategy = _discarded_copy_strategy(copy_strategy)
+
+            issue_count = ctx.issue_count
+
+            zon1(data, ctx)
+
+            if ctx.issue_count == issue_count:
+                zon2(data, ctx)
+
+            ctx.copy_strategy = copy_strategy
+
+            return data
+
+        return _check
+
+
+def optional(zon: Zon) -> ZonIntersection:
+    """Returns a validator that validates that the data is valid for this validator if it exists.
+
+    Args:
+        zon (Zon): the supplied validator
+
+    Returns:
+        ZonIntersection: The intersection data validator.
+    """
+    return ZonOptional(zon)
+
+
+class ZonOptional(Zon):
+    """A Zon that makes its data validation optional."""
+
+    __slots__ = ("_zon",)
+
+    def __init__(self, zon: Zon, **kwargs):
+        super().__init__(**kwargs)
+        self._zon = zon
+
+    def _structural_key(self) -> tuple:
+        return (*super()._structural_key(), self._zon)
+
+    def _default_validate(self, data, ctx):
+        if data:
+            copy_strategy = ctx.copy_strategy
+            ctx.copy_strategy = _discarded_copy_strategy(copy_strategy)
+
+            self._zon._run(data, ctx)
+
+            ctx.copy_strategy = copy_strategy
+
+        return data
+
+    def _compile_default(self):
+        zon = self._zon._compile()
+
+        def _check(data, ctx: ValidationContext):
+            if data:
+                copy_strategy = ctx.copy_strategy
+                ctx.copy_strategy = _discarded_copy_strategy(copy_strategy)
+
+                zon(data, ctx)
+
+                ctx.copy_strategy = copy_strategy
+
+            return data
+
+        return _check
+
+    def unwrap(self) -> Zon:
+        """Extracts the wrapped Zon from this ZonOptional.
+
+        Returns:
+            Zon: the wrapped Zon
+        """
+
+        return self._zon
+
+
+class ZonCached(Zon):
+    """A Zon that caches the outcome of validating hashable data with another Zon."""
+
+    __slots__ = ("_zon", "cache")
+
+    def __init__(self, zon: Zon, maxsize: int, ttl: float | None = None, /, **kwargs):
+        super().__init__(**kwargs)
+        self._zon = zon
+        self.cache = LRUCache(maxsize, ttl)
+        """The outcomes cached so far, by the type and value of the data."""
 
-        if not zon_1_parsed:
-            ctx.add_issues(data1_or_error.issues)
-            return data
+    def _structural_key(self) -> tuple:
+        # each cached Zon has its own cache
+        return (*super()._structural_key(), _Identity(self))
 
-        (zon_2_parsed, data2_or_error) = self.zon2.safe_validate(data)
+    def _default_validate(self, data, ctx):
+        return self._check(data, ctx, self._zon._run)
 
-        if not zon_2_parsed:
-            ctx.add_issues(data2_or_error.issues)
-            return data
+    def _compile_default(self):
+        zon = self._zon._compile()
 
-        return data
+        def _check(data, ctx: ValidationContext):
+            return self._check(data, ctx, zon)
 
+        return _check
 
-def optional(zon: Zon) -> ZonIntersection:
-    """Returns a validator that validates that the data is valid for this validator if it exists.
+    def _check(
+        self,
+        data: T,
+        ctx: ValidationContext,
+        run: Callable[[T, ValidationContext], T],
+    ) -> T:
+        try:
+            # 1, 1.0 and True are equal, but are not necessarily valid for the same Zons
+            key = (type(data), data)
+            outcome = self.cache.get(key)
+        except TypeError:
+            # unhashable data
+            return run(data, ctx)
 
-    Args:
-        zon (Zon): the supplied validator
+        if outcome is None:
+            inner_ctx = ValidationContext()
+            validated = run(data, inner_ctx)
 
-    Returns:
-        ZonIntersection: The intersection data validator.
-    """
-    return ZonOptional(zon)
+            outcome = (False, inner_ctx.error) if inner_ctx.dirty else (True, validated)
+            self.cache.put(key, outcome)
 
+        (valid, data_or_error) = outcome
 
-class ZonOptional(Zon):
-    """A Zon that makes its data validation optional."""
+        if valid:
+            return data_or_error
 
-    def __init__(self, zon: Zon, **kwargs):
-        super().__init__(**kwargs)
-        self._zon = zon
+        issues = data_or_error.issues
 
-    def _default_validate(self, data, ctx):
-        if data:
-            (passed, data_or_error) = self._zon.safe_validate(data)
+        if ctx.path:
+            issues = [issue.at(ctx.path) for issue in issues]
 
-            if not passed:
-                ctx.add_issues(data_or_error.issues)
+        ctx.add_issues(issues)
 
         return data
 
     def unwrap(self) -> Zon:
-        """Extracts the wrapped Zon from this ZonOptional.
+        """Extracts the wrapped Zon from this ZonCached.
 
         Returns:
             Zon: the wrapped Zon
@@ -408,6 +2142,8 @@ class ZonContainer(Zon, HasMax, HasMin):
     Contains container specific validator rules.
     """
 
+    __slots__ = ()
+
     def max(self, max_value: int | float) -> Self:
         """Validates that this container as at most `max_value` elements (inclusive).
 
@@ -415,20 +2151,14 @@ class ZonContainer(Zon, HasMax, HasMin):
             max_value (int | float): the maximum number of elements that this container can have
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "max_length",
-                lambda data: (
-                    data,
-                    hasattr(data, "__len__") and len(data) <= max_value,
-                ),
+                functools.partial(_has_max_length, max_value),
+                additional_data={"value": max_value},
             )
         )
 
-        return _clone
-
     def min(self, min_value: int | float) -> Self:
         """Validates that this container as at least `max_value` elements (inclusive).
 
@@ -436,20 +2166,14 @@ class ZonContainer(Zon, HasMax, HasMin):
             min_value (int | float): the minimum number of elements that this container can have
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "min_length",
-                lambda data: (
-                    data,
-                    hasattr(data, "__len__") and len(data) >= min_value,
-                ),
+                functools.partial(_has_min_length, min_value),
+                additional_data={"value": min_value},
             )
         )
 
-        return _clone
-
     def length(self, length: int) -> Self:
         """Validates that this container as exactly `length` elements.
 
@@ -457,17 +2181,14 @@ class ZonContainer(Zon, HasMax, HasMin):
             length (int): the exact number of elements that this container can have
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "equal_length",
-                lambda data: (data, hasattr(data, "__len__") and len(data) == length),
+                functools.partial(_has_length, length),
+                additional_data={"value": length},
             )
         )
 
-        return _clone
-
 
 def string() -> ZonString:
     """Returns a validator for string data.
@@ -485,9 +2206,15 @@ class ZonString(ZonContainer):
     For all purposes, a string is a container of characters.
     """
 
+    __slots__ = ()
+
+    _has_children = False
+
     def _default_validate(self, data: T, ctx: ValidationContext):
         if not isinstance(data, str):
-            ctx.add_issue(ZonIssue(value=data, message="Not a string", path=[]))
+            ctx.add_issue(
+                ZonIssue(value=data, code="not_a_string", path=list(ctx.path))
+            )
 
         return data
 
@@ -499,17 +2226,13 @@ class ZonString(ZonContainer):
             ZonString: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "email",
-                lambda data: (data, validators.email(data)),
+                _is_email,
             )
         )
 
-        return _clone
-
     def url(self) -> Self:
         """
         Assert that the value under validation is a valid URL.
@@ -518,17 +2241,13 @@ class ZonString(ZonContainer):
             ZonString: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "url",
-                lambda data: (data, validators.url(data)),
+                _is_url,
             )
         )
 
-        return _clone
-
     def emoji(self) -> Self:
         """Assert that the value under validation is a valid emoji.
 
@@ -538,9 +2257,7 @@ class ZonString(ZonContainer):
 
         raise NotImplementedError
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "emoji",
                 lambda data: re.compile(
@@ -550,8 +2267,6 @@ class ZonString(ZonContainer):
             )
         )
 
-        return _clone
-
     def uuid(self) -> Self:
         """Assert that the value under validation is a valid UUID.
 
@@ -559,17 +2274,13 @@ class ZonString(ZonContainer):
             ZonString: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "uuid",
-                lambda data: (data, validators.uuid(data)),
+                _is_uuid,
             )
         )
 
-        return _clone
-
     # TODO: cuid, cuid2, nanoid, ulid
 
     def regex(self, regex: str | re.Pattern[str]) -> Self:
@@ -582,17 +2293,14 @@ class ZonString(ZonContainer):
             ZonString: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "regex",
-                lambda data: (data, re.match(regex, data) is not None),
+                functools.partial(_matches, regex),
+                additional_data={"regex": regex},
             )
         )
 
-        return _clone
-
     def includes(self, needle: str) -> Self:
         """Assert that the value under validation includes the given string.
 
@@ -603,17 +2311,14 @@ class ZonString(ZonContainer):
             ZonString: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "includes",
-                lambda data: (data, needle in data),
+                functools.partial(_includes, needle),
+                additional_data={"needle": needle},
             )
         )
 
-        return _clone
-
     def starts_with(self, prefix: str) -> Self:
         """Assert that the value under validation starts with the given string.
 
@@ -624,17 +2329,14 @@ class ZonString(ZonContainer):
             ZonString: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "starts_with",
-                lambda data: (data, data.startswith(prefix)),
+                functools.partial(_starts_with, prefix),
+                additional_data={"prefix": prefix},
             )
         )
 
-        return _clone
-
     def ends_with(self, suffix: str) -> Self:
         """Assert that the value under validation ends with the given string.
 
@@ -645,17 +2347,14 @@ class ZonString(ZonContainer):
             ZonString: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "ends_with",
-                lambda data: (data, data.endswith(suffix)),
+                functools.partial(_ends_with, suffix),
+                additional_data={"suffix": suffix},
             )
         )
 
-        return _clone
-
     def datetime(self, opts: Mapping[str, Any] | None = None) -> Self:
         """Assert that the value under validation is a valid datetime.
 
@@ -666,48 +2365,14 @@ class ZonString(ZonContainer):
         if opts is None:
             opts = {}
 
-        # code ported from https://github.com/colinhacks/zod. All credit goes to the original author.
-        def _time_regex_source(opts: Mapping[str, Any]):
-            regex = r"([01]\d|2[0-3]):[0-5]\d:[0-5]\d"
-
-            if "precision" in opts:
-                precision = opts["precision"]
-
-                regex = rf"{regex}\.\d{{{precision}}}"
-            else:
-                regex = rf"{regex}(\.\d+)?"
-
-            return regex
-
-        def _datetime_regex(opts: Mapping[str, Any]):
-            dateRegexSource = r"((\d\d[2468][048]|\d\d[13579][26]|\d\d0[48]|[02468][048]00|[13579][26]00)-02-29|\d{4}-((0[13578]|1[02])-(0[1-9]|[12]\d|3[01])|(0[469]|11)-(0[1-9]|[12]\d|30)|(02)-(0[1-9]|1\d|2[0-8])))"
-
-            regex = f"{dateRegexSource}T{_time_regex_source(opts)}"
-
-            branches: list[str] = []
-            branches.append("Z?" if opts.get("local", False) else "Z")
-            if opts.get("offset", False):
-                branches.append(
-                    r"([+-]\d{2}(:?\d{2})?)"
-                )  # slight deviation from zod's regex, allowing for hour-only offsets
-
-            regex = f"{regex}({'|'.join(branches)})"
-
-            print(regex)
-
-            return re.compile(f"^{regex}$")
-
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "datetime",
-                lambda data: (data, _datetime_regex(opts).match(data) is not None),
+                functools.partial(_matches, _datetime_regex(opts)),
+                additional_data={"opts": opts},
             )
         )
 
-        return _clone
-
     def ip(self, opts: Mapping[str, Any] | None = None) -> Self:
         """Assert that the value under validation is a valid IP address.
 
@@ -727,37 +2392,14 @@ class ZonString(ZonContainer):
         if opts is None:
             opts = {}
 
-        _clone = self._clone()
-
-        def _validator(data, opts: Mapping[str, Any]):
-
-            doesnt_specify_version = "version" not in opts
-
-            if doesnt_specify_version or opts["version"] == "v4":
-                try:
-                    if validators.ipv4(data):
-                        return True
-                except validators.ValidationError:
-                    pass
-
-            if doesnt_specify_version or opts["version"] == "v6":
-                try:
-                    if validators.ipv6(data):
-                        return True
-                except validators.ValidationError:
-                    pass
-
-            return False
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "ip",
-                lambda data: (data, _validator(data, opts)),
+                functools.partial(_is_ip, opts),
+                additional_data={"opts": opts},
             )
         )
 
-        return _clone
-
     def trim(self) -> Self:
         """Trim whitespace from both sides of the value.
 
@@ -765,17 +2407,13 @@ class ZonString(ZonContainer):
             ZonString: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "trim",
-                lambda data: (data.strip(), True),
+                _trimmed,
             )
         )
 
-        return _clone
-
     def to_lower_case(self) -> Self:
         """Convert the value to lowercase.
 
@@ -783,17 +2421,13 @@ class ZonString(ZonContainer):
             ZonString: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "to_lower_case",
-                lambda data: (data.lower(), True),
+                _lower_cased,
             )
         )
 
-        return _clone
-
     def to_upper_case(self) -> Self:
         """Convert the value to uppercase.
 
@@ -801,17 +2435,13 @@ class ZonString(ZonContainer):
             ZonString: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "to_upper_case",
-                lambda data: (data.upper(), True),
+                _upper_cased,
             )
         )
 
-        return _clone
-
 
 def number() -> ZonNumber:
     """Returns a validator for numeric data.
@@ -826,12 +2456,42 @@ def number() -> ZonNumber:
 class ZonNumber(Zon, HasMax, HasMin):
     """A Zon that validates that the data is a number."""
 
+    __slots__ = ()
+
+    _has_children = False
+
     def _default_validate(self, data: T, ctx: ValidationContext):
         if not isinstance(data, (int, float)):
-            ctx.add_issue(ZonIssue(value=data, message="Not a valid number", path=[]))
+            ctx.add_issue(
+                ZonIssue(value=data, code="not_a_number", path=list(ctx.path))
+            )
 
         return data
 
+    def validate_array(self, array: Any) -> ZonArrayResult:
+        """Validates every element of a NumPy array of numbers at once, with vectorized operations.
+
+        Comparisons, `int`, `float`, `multiple_of` and `finite` are evaluated over the whole array.
+        Other rules, like refinements, are checked element by element, keeping the exceptions they raise.
+        Requires NumPy.
+
+        Args:
+            array (ArrayLike): the array of numbers to be validated.
+
+        Returns:
+            ZonArrayResult: a mask of the valid elements, and the indices of the elements that failed each rule.
+
+        Raises:
+            TypeError: if the array does not hold numbers.
+            ImportError: if NumPy is not installed.
+        """
+
+        from .vectorized import (  # pylint: disable=import-outside-toplevel
+            validate_number_array,
+        )
+
+        return validate_number_array(self, array)
+
     def gt(self, min_ex: float | int) -> Self:
         """Assert that the value under validation is greater than the given number.
 
@@ -842,17 +2502,14 @@ class ZonNumber(Zon, HasMax, HasMin):
             ZonNumber: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "gt",
-                lambda data: (data, data is not None and data > min_ex),
+                functools.partial(_is_gt, min_ex),
+                additional_data={"value": min_ex},
             )
         )
 
-        return _clone
-
     def gte(self, min_in: float | int) -> Self:
         """Assert that the value under validation is greater than or equal to the given number.
 
@@ -863,17 +2520,14 @@ class ZonNumber(Zon, HasMax, HasMin):
             ZonNumber: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "gte",
-                lambda data: (data, data is not None and data >= min_in),
+                functools.partial(_is_gte, min_in),
+                additional_data={"value": min_in},
             )
         )
 
-        return _clone
-
     def min(self, min_value: int | float) -> Self:
         return self.gte(min_value)
 
@@ -887,17 +2541,14 @@ class ZonNumber(Zon, HasMax, HasMin):
             ZonNumber: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "lt",
-                lambda data: (data, data is not None and data < max_ex),
+                functools.partial(_is_lt, max_ex),
+                additional_data={"value": max_ex},
             )
         )
 
-        return _clone
-
     def lte(self, max_in: float | int) -> Self:
         """Assert that the value under validation is less than or equal to the given number.
 
@@ -908,17 +2559,14 @@ class ZonNumber(Zon, HasMax, HasMin):
             ZonNumber: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "lte",
-                lambda data: (data, data is not None and data <= max_in),
+                functools.partial(_is_lte, max_in),
+                additional_data={"value": max_in},
             )
         )
 
-        return _clone
-
     def max(self, max_value: int | float) -> Self:
         return self.lte(max_value)
 
@@ -929,17 +2577,13 @@ class ZonNumber(Zon, HasMax, HasMin):
             ZonNumber: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "int",
-                lambda data: (data, isinstance(data, int)),
+                _is_int,
             )
         )
 
-        return _clone
-
     def float(self) -> Self:
         """Assert that the value under validation is a float.
 
@@ -947,17 +2591,13 @@ class ZonNumber(Zon, HasMax, HasMin):
             ZonNumber: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "float",
-                lambda data: (data, isinstance(data, float)),
+                _is_float,
             )
         )
 
-        return _clone
-
     def positive(self) -> Self:
         """Assert that the value under validation is a positive number.
 
@@ -965,17 +2605,13 @@ class ZonNumber(Zon, HasMax, HasMin):
             ZonNumber: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "positive",
-                lambda data: (data, data is not None and data > 0),
+                functools.partial(_is_gt, 0),
             )
         )
 
-        return _clone
-
     def negative(self) -> Self:
         """Assert that the value under validation is a negative number.
 
@@ -983,17 +2619,13 @@ class ZonNumber(Zon, HasMax, HasMin):
             ZonNumber: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "negative",
-                lambda data: (data, data is not None and data < 0),
+                functools.partial(_is_lt, 0),
             )
         )
 
-        return _clone
-
     def non_negative(self) -> Self:
         """Assert that the value under validation is a non-negative number.
 
@@ -1001,17 +2633,13 @@ class ZonNumber(Zon, HasMax, HasMin):
             ZonNumber: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "non_negative",
-                lambda data: (data, data is not None and data >= 0),
+                functools.partial(_is_gte, 0),
             )
         )
 
-        return _clone
-
     def non_positive(self) -> Self:
         """Assert that the value under validation is a non-positive number.
 
@@ -1019,17 +2647,13 @@ class ZonNumber(Zon, HasMax, HasMin):
             ZonNumber: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "non_positive",
-                lambda data: (data, data is not None and data <= 0),
+                functools.partial(_is_lte, 0),
             )
         )
 
-        return _clone
-
     def multiple_of(self, base: int | float) -> Self:
         """Assert that the value under validation is a multiple of the given number.
 
@@ -1040,17 +2664,14 @@ class ZonNumber(Zon, HasMax, HasMin):
             ZonNumber: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "multiple_of",
-                lambda data: (data, data is not None and data % base == 0),
+                functools.partial(_is_multiple_of, base),
+                additional_data={"value": base},
             )
         )
 
-        return _clone
-
     def step(self, base: int | float) -> Self:
         return self.multiple_of(base)
 
@@ -1061,17 +2682,13 @@ class ZonNumber(Zon, HasMax, HasMin):
             ZonNumber: a new `Zon` with the validation rule added
         """
 
-        _clone = self._clone()
-
-        _clone.validators.append(
+        return self._with_validator(
             ValidationRule(
                 "finite",
-                lambda data: (data, data is not None and not math.isinf(data)),
+                _is_finite,
             )
         )
 
-        return _clone
-
 
 def boolean() -> ZonBoolean:
     """Returns a validator for boolean data.
@@ -1086,9 +2703,15 @@ def boolean() -> ZonBoolean:
 class ZonBoolean(Zon):
     """A Zon that validates that the data is a boolean."""
 
+    __slots__ = ()
+
+    _has_children = False
+
     def _default_validate(self, data: T, ctx: ValidationContext):
         if not isinstance(data, bool):
-            ctx.add_issue(ZonIssue(value=data, message="Not a valid boolean", path=[]))
+            ctx.add_issue(
+                ZonIssue(value=data, code="not_a_boolean", path=list(ctx.path))
+            )
 
         return data
 
@@ -1109,10 +2732,17 @@ def literal(value: Any, /) -> ZonLiteral:
 class ZonLiteral(Zon):
     """A Zon that validates that the data is one of the given literals."""
 
+    __slots__ = ("_value",)
+
+    _has_children = False
+
     def __init__(self, value: Any, /, **kwargs):
         super().__init__(**kwargs)
         self._value = value
 
+    def _structural_key(self) -> tuple:
+        return (*super()._structural_key(), _freeze(self._value))
+
     @property
     def value(self):
         return self._value
@@ -1120,7 +2750,12 @@ class ZonLiteral(Zon):
     def _default_validate(self, data: T, ctx: ValidationContext):
         if data != self._value:
             ctx.add_issue(
-                ZonIssue(value=data, message=f"Expected {self._value}", path=[])
+                ZonIssue(
+                    value=data,
+                    code="invalid_literal",
+                    params={"expected": self._value},
+                    path=list(ctx.path),
+                )
             )
 
         return data
@@ -1145,10 +2780,17 @@ class ZonEnum(Zon):
     This class mimics the behavior of `zod`'s own enums, not TypeScript enums.
     """
 
+    __slots__ = ("_options",)
+
+    _has_children = False
+
     def __init__(self, options: Sequence[str], **kwargs):
         super().__init__(**kwargs)
         self._options: set[str] = options
 
+    def _structural_key(self) -> tuple:
+        return (*super()._structural_key(), _freeze(self._options))
+
     @property
     def enum(self) -> set[str]:
         """
@@ -1160,7 +2802,10 @@ class ZonEnum(Zon):
         if data not in self._options:
             ctx.add_issue(
                 ZonIssue(
-                    value=data, message=f"Expected one of {self._options}", path=[]
+                    value=data,
+                    code="invalid_enum_value",
+                    params={"options": self._options},
+                    path=list(ctx.path),
                 )
             )
 
@@ -1181,7 +2826,7 @@ class ZonEnum(Zon):
 
         _clone._options = self._options - set(options)
 
-        return _clone
+        return intern(_clone)
 
     def extract(self, options: Sequence[str]) -> Self:
         """
@@ -1198,7 +2843,7 @@ class ZonEnum(Zon):
 
         _clone._options = self._options & set(options)
 
-        return _clone
+        return intern(_clone)
 
 
 def record(properties: dict[str, Zon], /) -> ZonRecord:
@@ -1217,6 +2862,8 @@ def record(properties: dict[str, Zon], /) -> ZonRecord:
 class ZonRecord(Zon):
     """A Zon that validates that the data is a record with the provided shape."""
 
+    __slots__ = ("_shape", "unknown_key_policy", "_catchall", "_shape_key")
+
     class UnknownKeyPolicy(Enum):
         STRIP = auto()
         PASSTHROUGH = auto()
@@ -1234,76 +2881,226 @@ class ZonRecord(Zon):
         self._shape = shape
         self.unknown_key_policy = unknown_key_policy
         self._catchall = catchall
+        # clones share the shape, and so its key: adding a rule to a big record stays cheap
+        self._shape_key = _HashedItems(tuple(shape.items()))
+
+    def _structural_key(self) -> tuple:
+        return (
+            *super()._structural_key(),
+            self._shape_key,
+            self.unknown_key_policy,
+            self._catchall,
+        )
+
+    def _default_validate(self, data, ctx: ValidationContext):
+
+        if not isinstance(data, dict):
+            ctx.add_issue(
+                ZonIssue(value=data, code="not_an_object", path=list(ctx.path))
+            )
+
+            return data
+
+        build_output = ctx.build_output
+
+        # changes are only applied (and the record copied) at the end, if there are any
+        changes = None
+
+        extra_keys: set[str] = set(data.keys()) - set(self._shape.keys())
+
+        for key, zon in self._shape.items():
+            # default to None since this way we also validate the attribute if it is optional
+            validation_value = data.get(key, None)
+
+            issue_count = ctx.issue_count
+
+            ctx.path.append(key)
+            validated = zon._run(validation_value, ctx)
+            ctx.path.pop()
+
+            if (
+                build_output
+                and ctx.issue_count == issue_count
+                and (validated is None or validated is not validation_value)
+            ):
+                changes = _record_change(
+                    changes, data, key, validation_value, validated
+                )
+
+        if self._catchall is None:
+            match self.unknown_key_policy:
+                case ZonRecord.UnknownKeyPolicy.STRIP if build_output:
+                    for key in extra_keys:
+                        changes = _record_change(changes, data, key, data[key], None)
+                case ZonRecord.UnknownKeyPolicy.PASSTHROUGH:
+                    # keep extra keys
+                    pass
+                case ZonRecord.UnknownKeyPolicy.STRICT:
+                    if len(extra_keys) > 0:
+                        ctx.add_issue(
+                            ZonIssue(
+                                value=extra_keys,
+                                code="unrecognized_keys",
+                                params={"keys": extra_keys},
+                                path=list(ctx.path),
+                            )
+                        )
+
+        else:
+            for key in extra_keys:
+                value = data.get(key)
+
+                issue_count = ctx.issue_count
+
+                ctx.path.append(key)
+                validated = self._catchall._run(value, ctx)
+                ctx.path.pop()
+
+                if (
+                    build_output
+                    and ctx.issue_count == issue_count
+                    and (validated is None or validated is not value)
+                ):
+                    changes = _record_change(changes, data, key, value, validated)
+
+        return _record_output(data, changes, ctx.copy_strategy)
+
+    def _compile_default(self):
+        shape = tuple((key, zon._compile()) for key, zon in self._shape.items())
+        shape_keys = frozenset(self._shape.keys())
+        catchall = self._catchall._compile() if self._catchall is not None else None
+        unknown_key_policy = self.unknown_key_policy
+
+        def _check(data, ctx: ValidationContext):
+            if not isinstance(data, dict):
+                ctx.add_issue(
+                    ZonIssue(value=data, code="not_an_object", path=list(ctx.path))
+                )
+
+                return data
+
+            build_output = ctx.build_output
+            changes = None
+
+            extra_keys = data.keys() - shape_keys
+
+            path = ctx.path
+
+            for key, zon in shape:
+                issue_count = ctx.issue_count
+
+                value = data.get(key, None)
+
+                path.append(key)
+                validated = zon(value, ctx)
+                path.pop()
+
+                if (
+                    build_output
+                    and ctx.issue_count == issue_count
+                    and (validated is None or validated is not value)
+                ):
+                    changes = _record_change(changes, data, key, value, validated)
+
+            if catchall is None:
+                match unknown_key_policy:
+                    case ZonRecord.UnknownKeyPolicy.STRIP if build_output:
+                        for key in extra_keys:
+                            changes = _record_change(
+                                changes, data, key, data[key], None
+                            )
+                    case ZonRecord.UnknownKeyPolicy.STRICT:
+                        if len(extra_keys) > 0:
+                            ctx.add_issue(
+                                ZonIssue(
+                                    value=extra_keys,
+                                    code="unrecognized_keys",
+                                    params={"keys": extra_keys},
+                                    path=list(ctx.path),
+                                )
+                            )
+            else:
+                for key in extra_keys:
+                    issue_count = ctx.issue_count
+
+                    value = data.get(key)
+
+                    path.append(key)
+                    validated = catchall(value, ctx)
+                    path.pop()
 
-    def _default_validate(self, data, ctx: ValidationContext):
+                    if (
+                        build_output
+                        and ctx.issue_count == issue_count
+                        and (validated is None or validated is not value)
+                    ):
+                        changes = _record_change(changes, data, key, value, validated)
 
-        if not isinstance(data, dict):
-            ctx.add_issue(ZonIssue(value=data, message="Not a valid object", path=[]))
+            return _record_output(data, changes, ctx.copy_strategy)
 
-            return data
+        return _check
 
-        data_to_return = {}
+    @property
+    def shape(self) -> Mapping[str, Zon]:
+        return self._shape
 
-        extra_keys: set[str] = {}
-        if (
-            self._catchall is not None
-            or self.unknown_key_policy is not ZonRecord.UnknownKeyPolicy.STRIP
-        ):
-            extra_keys = set(data.keys()) - set(self._shape.keys())
+    def safe_validate_columns(
+        self, data: Sequence[Any] | Mapping[str, Sequence[Any]]
+    ) -> ZonBatchResult:
+        """Validates a batch of records field by field, instead of record by record.
 
-        for key, zon in self._shape.items():
-            # TODO: need to verify path
-            # maybe instantiate new context here and compute path from there?
+        The batch is transposed, and each field is validated over its whole column with one validation
+        context. Columns of `ZonNumber`s, and of `ZonBoolean`s, `ZonEnum`s and `ZonLiteral`s without
+        validation rules, are checked in one pass; columns of numbers are vectorized with NumPy if it is
+        installed. The results are the same as with `safe_validate_many`, with issues by row index and key.
 
-            # default to None since this way we also validate the attribute if it is optional
-            validation_value = data.get(key, None)
+        Args:
+            data (Sequence[Any] | Mapping[str, Sequence[Any]]): the records, either as a sequence of rows
+            or as a mapping of columns of the same length.
 
-            (validated, data_or_error) = zon.safe_validate(validation_value)
+        Returns:
+            ZonBatchResult: the validated records, and the errors of the invalid records by row index.
 
-            if not validated:
-                ctx.add_issues(data_or_error.issues)
-            elif data_or_error is not None:  # in case of optional data
-                data_to_return[key] = data_or_error
+        Raises:
+            ValueError: if the columns are not all of the same length.
+        """
 
-        if self._catchall is None:
-            match self.unknown_key_policy:
-                case ZonRecord.UnknownKeyPolicy.STRIP:
-                    # ignore extra keys
-                    pass
-                case ZonRecord.UnknownKeyPolicy.PASSTHROUGH:
-                    data_to_return.update({k: data[k] for k in extra_keys})
-                case ZonRecord.UnknownKeyPolicy.STRICT:
-                    if len(extra_keys) > 0:
-                        ctx.add_issue(
-                            ZonIssue(
-                                value=extra_keys,
-                                message=f"Unexpected keys: {extra_keys}",
-                                path=[],
-                            )
-                        )
+        from .columnar import (  # pylint: disable=import-outside-toplevel
+            validate_columns,
+        )
 
-        else:
-            for key in extra_keys:
-                value = data.get(key)
+        return validate_columns(self, data)
 
-                (valid, data_or_error) = self._catchall.safe_validate(value)
+    def validate_frame(self, frame: Any) -> ZonFrameResult:
+        """Validates every row of a pandas DataFrame or a pyarrow Table, column by column.
 
-                if not valid:
-                    ctx.add_issues(data_or_error.issues)
-                elif data_or_error is not None:  # in case of optional data
-                    data_to_return[key] = data_or_error
+        Each field of this record is validated over the column of the same name, without converting
+        the frame to records. Missing values are validated as None. Missing columns, and unrecognized
+        ones if unknown keys are not allowed, are issues of the whole frame. Rows are only built
+        if this record has validation rules of its own.
 
-        return data_to_return
+        Args:
+            frame (pandas.DataFrame | pyarrow.Table | pyarrow.RecordBatch): the frame to validate.
 
-    @property
-    def shape(self) -> Mapping[str, Zon]:
-        return self._shape
+        Returns:
+            ZonFrameResult: a mask of the valid rows, the errors of the invalid rows by position,
+            and the issues of the frame itself.
+
+        Raises:
+            TypeError: if the frame is neither a pandas DataFrame nor a pyarrow Table.
+            ImportError: if NumPy is not installed.
+        """
+
+        from .frame import validate_frame  # pylint: disable=import-outside-toplevel
+
+        return validate_frame(self, frame)
 
     def keyof(self) -> ZonEnum:
         """Returns a validator for the keys of an object"""
 
         return enum(self.shape.keys())
 
+    @_memoized
     def extend(self, extra_properties: Mapping[str, Zon]) -> Self:
         """
         Extends the shape of the record with the given properties.
@@ -1321,6 +3118,7 @@ class ZonRecord(Zon):
             catchall=self._catchall,
         )
 
+    @_memoized
     def merge(self, other: ZonRecord) -> Self:
         """
         Merges the shape of the record with the given properties.
@@ -1334,6 +3132,7 @@ class ZonRecord(Zon):
 
         return self.extend(other.shape)
 
+    @_memoized
     def pick(self, attributes: Mapping[str, Literal[True]]) -> ZonRecord:
         """
         Picks the given attributes from the record.
@@ -1351,6 +3150,7 @@ class ZonRecord(Zon):
             catchall=self._catchall,
         )
 
+    @_memoized
     def omit(self, attributes: Mapping[str, Literal[True]]) -> ZonRecord:
         """
         Omits the given attributes from the record.
@@ -1368,6 +3168,7 @@ class ZonRecord(Zon):
             catchall=self._catchall,
         )
 
+    @_memoized
     def partial(
         self, /, optional_properties: Mapping[str, Literal[True]] | None = None
     ) -> ZonRecord:
@@ -1393,6 +3194,7 @@ class ZonRecord(Zon):
             catchall=self._catchall,
         )
 
+    @_memoized
     def deep_partial(self) -> ZonRecord:
         """
         Marks all attributes as optional.
@@ -1418,6 +3220,7 @@ class ZonRecord(Zon):
             catchall=self._catchall,
         )
 
+    @_memoized
     def required(
         self, /, required_properties: Mapping[str, Literal[True]] | None = None
     ) -> ZonRecord:
@@ -1438,6 +3241,7 @@ class ZonRecord(Zon):
             catchall=self._catchall,
         )
 
+    @_memoized
     def passthrough(self) -> ZonRecord:
         """
         Returns a validator for the same record shape that adds unknown keys to the returned.
@@ -1454,6 +3258,7 @@ class ZonRecord(Zon):
             catchall=self._catchall,
         )
 
+    @_memoized
     def strict(self) -> ZonRecord:
         """
         Returns a validator for the same record shape but that fails validation if the data under validation does not match this validator's shape exactly.
@@ -1468,6 +3273,7 @@ class ZonRecord(Zon):
             catchall=self._catchall,
         )
 
+    @_memoized
     def strip(self) -> ZonRecord:
         """
         Returns a validator for the same record shape that unknown keys from the returned data.
@@ -1484,6 +3290,7 @@ class ZonRecord(Zon):
             catchall=self._catchall,
         )
 
+    @_memoized
     def catchall(self, catchall_validator: Zon) -> ZonRecord:
         """
         Returns a validator for the same record shape that pipes unknown keys and their values through a general, "catch-all" validator.
@@ -1516,24 +3323,110 @@ def element_list(element: Zon, /) -> ZonList:
 class ZonList(ZonContainer):
     """A Zon that validates that the input is a list with the given element type"""
 
+    __slots__ = ("_element", "_batch_rules")
+
     def __init__(self, element, **kwargs):
         super().__init__(**kwargs)
 
         self._element = element
+        self._batch_rules: tuple[BatchValidationRule, ...] = ()
+
+    def _structural_key(self) -> tuple:
+        return (*super()._structural_key(), self._element, self._batch_rules)
 
     def _default_validate(self, data: T, ctx: ValidationContext):
+        if self._batch_rules:
+            return self._check_batched(data, ctx, self._element._run)
+
         if not isinstance(data, list):
-            ctx.add_issue(ZonIssue(value=data, message="Not a valid list", path=[]))
+            ctx.add_issue(ZonIssue(value=data, code="not_a_list", path=list(ctx.path)))
             return data
 
-        for element in data:
-            (valid, data_or_error) = self._element.safe_validate(element)
+        copy_strategy = ctx.copy_strategy
+        ctx.copy_strategy = _discarded_copy_strategy(copy_strategy)
 
-            if not valid:
-                ctx.add_issues(data_or_error.issues)
+        for i, element in enumerate(data):
+            ctx.path.append(i)
+            self._element._run(element, ctx)
+            ctx.path.pop()
+
+        ctx.copy_strategy = copy_strategy
+
+        return data
+
+    def _check_batched(
+        self,
+        data: T,
+        ctx: ValidationContext,
+        element: Callable[[T, ValidationContext], T],
+    ) -> T:
+        """Validates the elements of the list, then checks the valid ones against the batch rules"""
+
+        if not isinstance(data, list):
+            ctx.add_issue(ZonIssue(value=data, code="not_a_list", path=list(ctx.path)))
+            return data
+
+        copy_strategy = ctx.copy_strategy
+        ctx.copy_strategy = _discarded_copy_strategy(copy_strategy)
+
+        # batch rules need the validated elements
+        build_output = ctx.build_output
+        ctx.build_output = True
+
+        path = ctx.path
+        candidates = []
+
+        for i, value in enumerate(data):
+            issue_count = ctx.issue_count
+
+            path.append(i)
+            validated = element(value, ctx)
+            path.pop()
+
+            if ctx.issue_count == issue_count:
+                candidates.append((i, validated))
+
+        ctx.copy_strategy = copy_strategy
+        ctx.build_output = build_output
+
+        for rule in self._batch_rules:
+            rule.check_batch(candidates, ctx)
 
         return data
 
+    def _compile_default(self):
+        element = self._element._compile()
+
+        if self._batch_rules:
+
+            def _check_batched(data, ctx: ValidationContext):
+                return self._check_batched(data, ctx, element)
+
+            return _check_batched
+
+        def _check(data, ctx: ValidationContext):
+            if not isinstance(data, list):
+                ctx.add_issue(
+                    ZonIssue(value=data, code="not_a_list", path=list(ctx.path))
+                )
+                return data
+
+            copy_strategy = ctx.copy_strategy
+            ctx.copy_strategy = _discarded_copy_strategy(copy_strategy)
+
+            path = ctx.path
+
+            for i, value in enumerate(data):
+                path.append(i)
+                element(value, ctx)
+                path.pop()
+
+            ctx.copy_strategy = copy_strategy
+
+            return data
+
+        return _check
+
     @property
     def element(self):
         return self._element
@@ -1546,16 +3439,260 @@ class ZonList(ZonContainer):
             ZonList: a new `ZonList` validator
         """
 
+        return self._with_validator(
+            ValidationRule(
+                "nonempty",
+                _is_nonempty,
+            )
+        )
+
+    def validate_array(self, array: Any) -> ZonArrayResult:
+        """Validates a one-dimensional NumPy array against this list of numbers, with vectorized operations.
+
+        See `ZonNumber.validate_array`. The rules of the list itself are checked against the whole array.
+
+        Args:
+            array (ArrayLike): the array of numbers to be validated.
+
+        Returns:
+            ZonArrayResult: a mask of the valid elements, the indices of the elements that failed each rule,
+            and the issues of the array as a whole.
+
+        Raises:
+            TypeError: if the array does not hold numbers, or the elements of this list are not numbers.
+            ValueError: if the array is not one-dimensional.
+            ImportError: if NumPy is not installed.
+        """
+
+        from .vectorized import (  # pylint: disable=import-outside-toplevel
+            validate_list_array,
+        )
+
+        return validate_list_array(self, array)
+
+    def refine_batch(
+        self,
+        refinement: Callable[[list[T]], Iterable[bool]],
+        /,
+        message: str | None = None,
+    ) -> Self:
+        """
+        Returns a validator for a list whose elements are also valid under the provided batch refinement function.
+
+        The refinement is called once per list, with every element that is valid under the element
+        validator, and returns whether each of them is valid, in the same order. This allows
+        checking all the elements in a single round trip (e.g. one `SELECT ... WHERE id IN (...)`).
+
+        Args:
+            refinement (Callable[[list[T]], Iterable[bool]]): the batch refinement function.
+            message (str | None): custom message to be used in the errors.
+
+        Returns:
+            ZonList: a new `ZonList` validator
+        """
+
         _clone = self._clone()
+        _clone._batch_rules = (
+            *self._batch_rules,
+            BatchValidationRule(
+                message if message is not None else "custom", refinement
+            ),
+        )
+
+        return intern(_clone)
+
+
+def buffer(
+    format: str | None = None,  # pylint: disable=redefined-builtin
+    /,
+    *,
+    element: Zon | None = None,
+) -> ZonBuffer:
+    """Returns a validator for typed buffers, like `array.array`, `memoryview` or `mmap.mmap`.
+
+    Args:
+        format (str, optional): the struct format of the elements, e.g. `"d"`. If not given, any format is allowed.
+        element (Zon, optional): the Zon to validate each element with.
+
+    Returns:
+        ZonBuffer: a new `ZonBuffer` validator
+    """
+
+    return ZonBuffer(format, element)
+
+
+def bytes() -> ZonBuffer:  # pylint: disable=redefined-builtin
+    """Returns a validator for binary data, like `bytes`, `bytearray` or `mmap.mmap`.
+
+    Not exported by `from zon import *`, where it would shadow the `bytes` built-in.
+
+    Returns:
+        ZonBuffer: a new `ZonBuffer` validator for buffers of unsigned bytes
+    """
+
+    return ZonBuffer("B")
+
+
+class ZonBuffer(ZonContainer):
+    """A Zon that validates that the data supports the buffer protocol, with elements of a given format.
+
+    Buffers are checked through `memoryview`s, so they are never copied. Buffers of raw bytes
+    (like `bytes` or `mmap.mmap`) are viewed as elements of the format, and lengths count elements.
+    """
+
+    __slots__ = ("_format", "_element")
+
+    def __init__(
+        self, format_: str | None = None, element: Zon | None = None, **kwargs
+    ):
+        super().__init__(**kwargs)
 
-        _clone.validators.append(
+        self._format = format_
+        self._element = element
+
+    def _structural_key(self) -> tuple:
+        return (*super()._structural_key(), self._format, self._element)
+
+    @property
+    def format(self) -> str | None:
+        return self._format
+
+    @property
+    def element(self) -> Zon | None:
+        return self._element
+
+    def _default_validate(self, data: T, ctx: ValidationContext):
+        return self._check(
+            data, ctx, self._element._run if self._element is not None else None
+        )
+
+    def _compile_default(self):
+        element = self._element._compile() if self._element is not None else None
+
+        def _check(data, ctx: ValidationContext):
+            return self._check(data, ctx, element)
+
+        return _check
+
+    def _check(
+        self,
+        data: T,
+        ctx: ValidationContext,
+        element: Callable[[Any, ValidationContext], Any] | None,
+    ) -> T:
+        from .buffers import typed_view  # pylint: disable=import-outside-toplevel
+
+        view = typed_view(data, self._format)
+
+        if isinstance(view, ZonIssue):
+            view.path = list(ctx.path)
+            ctx.add_issue(view)
+            return data
+
+        if element is None:
+            return data
+
+        failures = None
+        if isinstance(self._element, ZonNumber):
+            from .vectorized import (  # pylint: disable=import-outside-toplevel
+                buffer_failures,
+            )
+
+            failures = buffer_failures(self._element, view)
+
+        if failures is not None:
+            for index, rule in failures:
+                ctx.add_issue(
+                    ZonIssue(
+                        value=view[index],
+                        code="failed_rule",
+                        params={"rule": rule},
+                        path=[*ctx.path, index],
+                    )
+                )
+
+            return data
+
+        path = ctx.path
+
+        for i, value in enumerate(view):
+            path.append(i)
+            element(value, ctx)
+            path.pop()
+
+        return data
+
+    def max(self, max_value: int | float) -> Self:
+        """Validates that this buffer has at most `max_value` elements (inclusive).
+
+        Args:
+            max_value (int | float): the maximum number of elements that this buffer can have
+        """
+
+        return self._with_validator(
             ValidationRule(
-                "nonempty",
-                lambda data: (data, hasattr(data, "__len__") and len(data) > 0),
+                "max_length",
+                functools.partial(
+                    _has_buffer_length, self._format, _has_max_length, max_value
+                ),
+                additional_data={"value": max_value},
             )
         )
 
-        return _clone
+    def min(self, min_value: int | float) -> Self:
+        """Validates that this buffer has at least `min_value` elements (inclusive).
+
+        Args:
+            min_value (int | float): the minimum number of elements that this buffer can have
+        """
+
+        return self._with_validator(
+            ValidationRule(
+                "min_length",
+                functools.partial(
+                    _has_buffer_length, self._format, _has_min_length, min_value
+                ),
+                additional_data={"value": min_value},
+            )
+        )
+
+    def length(self, length: int) -> Self:
+        """Validates that this buffer has exactly `length` elements.
+
+        Args:
+            length (int): the exact number of elements that this buffer can have
+        """
+
+        return self._with_validator(
+            ValidationRule(
+                "equal_length",
+                functools.partial(
+                    _has_buffer_length, self._format, _has_length, length
+                ),
+                additional_data={"value": length},
+            )
+        )
+
+    def aligned(self, alignment: int) -> Self:
+        """Validates that this buffer starts at a memory address that is a multiple of `alignment` bytes.
+
+        Args:
+            alignment (int): the alignment, in bytes.
+
+        Raises:
+            ValueError: if the alignment is not positive.
+        """
+
+        if alignment < 1:
+            raise ValueError(f"alignment must be at least 1, got {alignment}")
+
+        return self._with_validator(
+            ValidationRule(
+                "aligned",
+                functools.partial(_is_aligned, alignment),
+                additional_data={"value": alignment},
+            )
+        )
 
 
 def union(options: Sequence[Zon], /) -> ZonUnion:
@@ -1575,28 +3712,85 @@ def union(options: Sequence[Zon], /) -> ZonUnion:
 class ZonUnion(Zon):
     """A Zon that validates that the input is one of the given types"""
 
+    __slots__ = ("_options",)
+
     def __init__(self, options: Sequence[Zon], /, **kwargs):
         super().__init__(**kwargs)
         self._options = options
 
+    def _structural_key(self) -> tuple:
+        return (*super()._structural_key(), tuple(self._options))
+
     @property
     def options(self) -> Sequence[Zon]:
         return self._options
 
     def _default_validate(self, data: T, ctx: ValidationContext):
+        return ZonUnion._check_options(
+            data, ctx, tuple(option._run for option in self._options)
+        )
+
+    def _compile_default(self):
+        options = tuple(option._compile() for option in self._options)
 
+        def _check(data, ctx: ValidationContext):
+            return ZonUnion._check_options(data, ctx, options)
+
+        return _check
+
+    @staticmethod
+    def _check_options(
+        data: T,
+        ctx: ValidationContext,
+        options: Sequence[Callable[[T, ValidationContext], T]],
+    ) -> T:
+        """Validates that the data is valid for at least one of the given options.
+
+        Args:
+            data (T): the piece of data to be validated.
+            ctx (ValidationContext): the context of the validation.
+            options (Sequence[Callable[[T, ValidationContext], T]]): functions that validate the data against each option.
+        """
+
+        error = ctx.error
+        copy_strategy = ctx.copy_strategy
+        build_output = ctx.build_output
+        deferred = ctx.deferred
+        path_length = len(ctx.path)
+
+        ctx.copy_strategy = _discarded_copy_strategy(copy_strategy)
+        # options are told apart as soon as they are validated, so async rules cannot wait
+        ctx.deferred = None
+
+        valid = False
         issues = []
-        for option in self._options:
-            (valid, data_or_error) = option.safe_validate(data)
+        for option in options:
+            # each option reports into a fresh error so that its issues can be discarded
+            ctx.error = None
+
+            try:
+                option(data, ctx)
+                valid = not ctx.dirty
+            except _AbortValidation:
+                # this option failed, try the next one
+                del ctx.path[path_length:]
+                ctx.build_output = build_output
 
             if valid:
-                return data
+                break
+
+            if ctx.error is not None:
+                issues.extend(ctx.error.issues)
 
-            issues.extend(data_or_error.issues)
+        ctx.error = error
+        ctx.copy_strategy = copy_strategy
+        ctx.deferred = deferred
 
-        if len(issues) > 0:
+        if not valid and len(options) > 0:
+            issues.append(
+                ZonIssue(value=data, code="invalid_union", path=list(ctx.path))
+            )
             ctx.add_issues(issues)
-            ctx.add_issue(ZonIssue(value=data, message="Not a valid union", path=[]))
 
         return data
 
@@ -1618,42 +3812,104 @@ def element_tuple(items: Sequence[Zon], /) -> ZonTuple:
 class ZonTuple(Zon):
     """A Zon that validates that the input is a tuple whose elements might have different types"""
 
+    __slots__ = ("_items", "_rest")
+
     def __init__(self, items: Sequence[Zon], rest: Zon | None = None, /, **kwargs):
         super().__init__(**kwargs)
         self._items = items
         self._rest = rest
 
+    def _structural_key(self) -> tuple:
+        return (*super()._structural_key(), tuple(self._items), self._rest)
+
     def _default_validate(self, data: T, ctx: ValidationContext):
         if not isinstance(data, tuple):
-            ctx.add_issue(ZonIssue(value=data, message="Not a valid list", path=[]))
+            ctx.add_issue(ZonIssue(value=data, code="not_a_list", path=list(ctx.path)))
             return data
 
         if len(data) < len(self._items):
-            ctx.add_issue(ZonIssue(value=data, message="Not enough elements", path=[]))
+            ctx.add_issue(
+                ZonIssue(value=data, code="too_few_elements", path=list(ctx.path))
+            )
             return data
 
         if self._rest is None and len(data) > len(self._items):
-            ctx.add_issue(ZonIssue(value=data, message="Too many elements", path=[]))
+            ctx.add_issue(
+                ZonIssue(value=data, code="too_many_elements", path=list(ctx.path))
+            )
             return data
 
+        copy_strategy = ctx.copy_strategy
+        ctx.copy_strategy = _discarded_copy_strategy(copy_strategy)
+
         for i, _validator in enumerate(self._items):
             if _validator is None:
                 continue
 
-            (valid, data_or_error) = _validator.safe_validate(data[i])
-
-            if not valid:
-                ctx.add_issues(data_or_error.issues)
+            ctx.path.append(i)
+            _validator._run(data[i], ctx)
+            ctx.path.pop()
 
         if self._rest is not None:
-            for extra_value in data[len(self.items) :]:
-                (valid, data_or_error) = self._rest.safe_validate(extra_value)
+            for i, extra_value in enumerate(data[len(self.items) :], len(self.items)):
+                ctx.path.append(i)
+                self._rest._run(extra_value, ctx)
+                ctx.path.pop()
 
-                if not valid:
-                    ctx.add_issues(data_or_error.issues)
+        ctx.copy_strategy = copy_strategy
 
         return data
 
+    def _compile_default(self):
+        items = tuple(
+            (i, _validator._compile())
+            for i, _validator in enumerate(self._items)
+            if _validator is not None
+        )
+        item_count = len(self._items)
+        rest = self._rest._compile() if self._rest is not None else None
+
+        def _check(data, ctx: ValidationContext):
+            if not isinstance(data, tuple):
+                ctx.add_issue(
+                    ZonIssue(value=data, code="not_a_list", path=list(ctx.path))
+                )
+                return data
+
+            if len(data) < item_count:
+                ctx.add_issue(
+                    ZonIssue(value=data, code="too_few_elements", path=list(ctx.path))
+                )
+                return data
+
+            if rest is None and len(data) > item_count:
+                ctx.add_issue(
+                    ZonIssue(value=data, code="too_many_elements", path=list(ctx.path))
+                )
+                return data
+
+            copy_strategy = ctx.copy_strategy
+            ctx.copy_strategy = _discarded_copy_strategy(copy_strategy)
+
+            path = ctx.path
+
+            for i, _validator in items:
+                path.append(i)
+                _validator(data[i], ctx)
+                path.pop()
+
+            if rest is not None:
+                for i, extra_value in enumerate(data[item_count:], item_count):
+                    path.append(i)
+                    rest(extra_value, ctx)
+                    path.pop()
+
+            ctx.copy_strategy = copy_strategy
+
+            return data
+
+        return _check
+
     @property
     def items(self):
         return self._items
@@ -1686,6 +3942,10 @@ def anything() -> ZonAnything:
 class ZonAnything(Zon):
     """A Zon that validates that the input is anything"""
 
+    __slots__ = ()
+
+    _has_children = False
+
     def _default_validate(self, data: T, ctx: ValidationContext):
         return data
 
@@ -1704,6 +3964,10 @@ def never() -> ZonNever:
 class ZonNever(Zon):
     """A Zon that validates no input."""
 
+    __slots__ = ()
+
+    _has_children = False
+
     def _default_validate(self, data: T, ctx: ValidationContext):
-        ctx.add_issue(ZonIssue(value=data, message="No data allowed", path=[]))
+        ctx.add_issue(ZonIssue(value=data, code="no_data_allowed", path=list(ctx.path)))
         return data
@@ -0,0 +1,370 @@
+"""The zon command line.
+
+Validates files of data against a schema that can be imported from a module, e.g.:
+
+    python -m zon validate --schema mymodule:SCHEMA data.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import importlib
+import itertools
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from typing import IO, Any, Literal, Optional, TextIO
+
+from . import Zon
+from .error import ZonError
+from .parallel import time_chunks
+from .streams import json_error
+
+Format = Literal["json", "jsonl", "csv"]
+
+_EXTENSIONS: dict[str, Format] = {
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+}
+
+Record = tuple[str, Any, Optional[ZonError]]
+"""A piece of data read from a file: where it was read from, the data and, if it could not be decoded, its error."""
+
+
+def load_schema(spec: str) -> Zon:
+    """Imports a schema from a `module:attribute` specification.
+
+    Args:
+        spec (str): the module to import the schema from and its (possibly dotted) name in that module.
+
+    Returns:
+        Zon: the imported schema.
+
+    Raises:
+        ValueError: if the specification is malformed or does not point to a Zon.
+    """
+
+    (module_name, _, attribute) = spec.partition(":")
+
+    if not module_name or not attribute:
+        raise ValueError(f"expected a schema like 'module:SCHEMA', got '{spec}'")
+
+    schema = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        schema = getattr(schema, name)
+
+    if not isinstance(schema, Zon):
+        raise ValueError(f"'{spec}' is not a Zon, but a {type(schema).__name__}")
+
+    return schema
+
+
+def read_records(file: TextIO, name: str, data_format: Format) -> Iterator[Record]:
+    """Lazily reads the data in a file.
+
+    Lines of JSON lines files and rows of CSV files are located by their line number,
+    and the elements of JSON arrays by their index.
+    """
+
+    if data_format == "jsonl":
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                yield (f"{name}:{line_number}", json.loads(line), None)
+            except ValueError as e:
+                yield (f"{name}:{line_number}", None, json_error(line.rstrip(), e))
+    elif data_format == "csv":
+        reader = csv.DictReader(file)
+
+        for row in reader:
+            yield (f"{name}:{reader.line_num}", row, None)
+    else:
+        text = file.read()
+
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            yield (name, None, json_error(text, e))
+            return
+
+        if isinstance(data, list):
+            for index, item in enumerate(data):
+                yield (f"{name}[{index}]", item, None)
+        else:
+            yield (name, data, None)
+
+
+def _format_of(path: str, data_format: Format | None) -> Format:
+    if data_format is not None:
+        return data_format
+
+    if path == "-":
+        return "jsonl"
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension not in _EXTENSIONS:
+        raise ValueError(
+            f"cannot tell the format of '{path}', use --format to choose one"
+        )
+
+    return _EXTENSIONS[extension]
+
+
+def _open_files(
+    stack: ExitStack, paths: list[str], data_format: Format | None, stdin: TextIO
+) -> list[tuple[IO[str], str, Format]]:
+    """Opens every file up front, so that missing files are reported before validating any data"""
+
+    files: list[tuple[IO[str], str, Format]] = []
+
+    for path in paths:
+        path_format = _format_of(path, data_format)
+
+        if path == "-":
+            files.append((stdin, "<stdin>", path_format))
+        else:
+            # the files are closed with the stack
+            file = stack.enter_context(
+                open(  # pylint: disable=consider-using-with
+                    path, encoding="utf-8", newline=""
+                )
+            )
+            files.append((file, path, path_format))
+
+    return files
+
+
+def _record_chunks(records: Iterable[Record], size: int) -> Iterator[list[Record]]:
+    records = iter(records)
+
+    while chunk := list(itertools.islice(records, size)):
+        yield chunk
+
+
+def _percentile(latencies: list[int], fraction: float) -> float:
+    """The nearest-rank percentile of sorted latencies, in microseconds"""
+
+    if not latencies:
+        return 0.0
+
+    index = min(len(latencies) - 1, max(0, round(fraction * len(latencies)) - 1))
+
+    return latencies[index] / 1000
+
+
+def _validate_chunks(
+    schema: Zon, records: Iterable[Record], args: argparse.Namespace
+) -> Iterator[tuple[list[Record], tuple[list[int], dict[int, ZonError]]]]:
+    """Validates the records in chunks, yielding each chunk with its latencies and errors"""
+
+    def _data(chunk: list[Record]) -> list[Any]:
+        return [data for (_, data, error) in chunk if error is None]
+
+    # the chunks are needed again to locate the failures
+    (chunks, sent) = itertools.tee(_record_chunks(records, args.chunksize))
+
+    results = time_chunks(
+        schema,
+        (_data(chunk) for chunk in sent),
+        args.workers,
+        args.abort_early,
+        args.max_issues,
+    )
+
+    return zip(chunks, results)
+
+
+def validate_command(
+    schema: Zon,
+    records: Iterable[Record],
+    args: argparse.Namespace,
+    stdout: TextIO,
+    stderr: TextIO,
+) -> int:
+    """Runs `python -m zon validate`.
+
+    Args:
+        schema (Zon): the schema to validate with.
+        records (Iterable[Record]): the data to validate.
+        args (argparse.Namespace): the parsed arguments of the command.
+        stdout (TextIO): where to print the summary.
+        stderr (TextIO): where to print the failures.
+
+    Returns:
+        int: the exit code: 0 if all data is valid, 1 otherwise.
+    """
+
+    latencies: list[int] = []
+    (total, invalid, reported) = (0, 0, 0)
+
+    def _report(location: str, error: ZonError):
+        nonlocal reported
+
+        if reported >= args.report_failures:
+            return
+
+        reported += 1
+        for issue in error.issues:
+            path = ".".join(str(key) for key in issue.path)
+            print(
+                f"{location}: {path + ': ' if path else ''}{issue.message}",
+                file=stderr,
+            )
+
+    start = time.perf_counter()
+
+    for chunk, (chunk_latencies, errors) in _validate_chunks(schema, records, args):
+        latencies.extend(chunk_latencies)
+        index = 0
+
+        for location, _, error in chunk:
+            total += 1
+
+            if error is None:
+                error = errors.get(index)
+                index += 1
+
+            if error is not None:
+                invalid += 1
+                _report(location, error)
+
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    print(f"records:    {total}", file=stdout)
+    print(f"valid:      {total - invalid}", file=stdout)
+    print(f"invalid:    {invalid}", file=stdout)
+    print(f"elapsed:    {elapsed:.3f} s", file=stdout)
+    print(
+        f"throughput: {total / elapsed if elapsed > 0 else 0:,.0f} records/s",
+        file=stdout,
+    )
+    print(
+        f"latency:    p50 {_percentile(latencies, 0.5):.1f} µs,"
+        f" p99 {_percentile(latencies, 0.99):.1f} µs",
+        file=stdout,
+    )
+
+    return 1 if invalid else 0
+
+
+def _positive(value: str) -> int:
+    number = int(value)
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the parser of the zon command line"""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m zon", description="A Zod-like validation library for Python"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser(
+        "validate",
+        help="validate files of data against a schema",
+        description="Validates JSON, JSON lines or CSV data against a schema, "
+        "reporting the failures and the throughput.",
+    )
+    validate.add_argument(
+        "--schema",
+        required=True,
+        help="the schema to validate with, as 'module:NAME'",
+    )
+    validate.add_argument(
+        "files",
+        nargs="*",
+        default=["-"],
+        help="the files to validate, '-' for standard input (the default)",
+    )
+    validate.add_argument(
+        "--format",
+        choices=["json", "jsonl", "csv"],
+        help="the format of the files. By default, it is told by their extension, "
+        "and standard input is read as JSON lines",
+    )
+    validate.add_argument(
+        "--workers",
+        type=_positive,
+        help="how many worker processes to validate with",
+    )
+    validate.add_argument(
+        "--abort-early",
+        action="store_true",
+        help="stop validating each piece of data at its first issue",
+    )
+    validate.add_argument(
+        "--max-issues",
+        type=_positive,
+        help="how many issues to collect for each piece of data",
+    )
+    validate.add_argument(
+        "--report-failures",
+        type=int,
+        default=10,
+        help="how many failures to print (default: 10)",
+    )
+    validate.add_argument(
+        "--chunksize",
+        type=_positive,
+        default=1000,
+        help="how many pieces of data to validate at a time (default: 1000)",
+    )
+
+    return parser
+
+
+def main(
+    argv: list[str] | None = None,
+    *,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
+) -> int:
+    """Runs the zon command line.
+
+    Args:
+        argv (list[str], optional): the arguments. Defaults to `sys.argv[1:]`.
+        stdout (TextIO, optional): where to print the summary. Defaults to `sys.stdout`.
+        stderr (TextIO, optional): where to print the failures. Defaults to `sys.stderr`.
+
+    Returns:
+        int: the exit code: 0 if all data is valid, 1 otherwise and 2 if the schema or the files cannot be loaded.
+    """
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    with ExitStack() as stack:
+        try:
+            schema = load_schema(args.schema)
+            files = _open_files(stack, args.files, args.format, sys.stdin)
+        except (ValueError, ImportError, AttributeError, OSError) as e:
+            parser.exit(2, f"{parser.prog}: error: {e}\n")
+
+        records = (
+            record
+            for (file, name, file_format) in files
+            for record in read_records(file, name, file_format)
+        )
+
+        return validate_command(
+            schema, records, args, stdout or sys.stdout, stderr or sys.stderr
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
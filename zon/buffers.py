@@ -0,0 +1,133 @@
+"""Zero-copy views of typed buffers: anything that supports the buffer protocol,
+like `bytes`, `bytearray`, `array.array`, `memoryview`, `mmap.mmap` or NumPy arrays.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import struct
+import sys
+from typing import Any
+
+from .error import ZonIssue
+
+_FORMAT_KINDS = {
+    "i": "bhilqn",
+    "u": "BHILQN",
+    "f": "efd",
+}
+"""The struct format characters of signed and unsigned integers and of floats."""
+
+_BYTE_FORMATS = ("B", "b", "c")
+"""The formats of raw bytes, which can be viewed as elements of any other format."""
+
+_NATIVE_ORDERS = ("@", "=", "<" if sys.byteorder == "little" else ">")
+
+
+def _format_key(format_: str, itemsize: int) -> tuple[str, int] | None:
+    """What a struct format means: the kind of its elements and their size. `None` if it is not native."""
+
+    order = format_[0] if format_ and format_[0] in "@=<>!" else "@"
+
+    if order not in _NATIVE_ORDERS:
+        return None
+
+    char = format_.lstrip("@=<>!")
+    kind = next((kind for kind, chars in _FORMAT_KINDS.items() if char in chars), char)
+
+    return (kind, itemsize)
+
+
+def typed_view(data: Any, format_: str | None) -> memoryview | ZonIssue:
+    """Views the data as a flat buffer of elements of the given format, without copying it.
+
+    Buffers of raw bytes (like `bytes` or `mmap.mmap`) are cast to the format, if their size allows it.
+
+    Args:
+        data (Any): the data to view.
+        format_ (str, optional): the struct format of the elements. If not given, any format is allowed.
+
+    Returns:
+        memoryview | ZonIssue: the view, or the issue (without a path) if the data cannot be viewed so.
+    """
+
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return ZonIssue(value=data, code="not_a_buffer", path=[])
+
+    try:
+        if view.ndim != 1:
+            # multi-dimensional buffers are viewed by their elements, in order
+            view = view.cast("B").cast(view.format)
+    except TypeError:
+        return ZonIssue(value=data, code="not_a_buffer", path=[])
+
+    if format_ is None:
+        return view
+
+    expected = _format_key(format_, struct.calcsize(format_))
+
+    if expected == _format_key(view.format, view.itemsize):
+        return view
+
+    if view.format in _BYTE_FORMATS and expected is not None:
+        if view.nbytes % expected[1] != 0:
+            return ZonIssue(
+                value=data,
+                code="invalid_buffer_size",
+                params={"itemsize": expected[1], "size": view.nbytes},
+                path=[],
+            )
+
+        try:
+            return view.cast("B").cast(format_.lstrip("@=<>"))
+        except (TypeError, ValueError):
+            pass
+
+    return ZonIssue(
+        value=data,
+        code="invalid_buffer_format",
+        params={"expected": format_, "received": view.format},
+        path=[],
+    )
+
+
+class _Py_buffer(ctypes.Structure):  # pylint: disable=invalid-name
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+
+_PyBUF_RECORDS_RO = 0x1C
+"""Asks for a (possibly strided) read-only buffer, with its format."""
+
+_get_buffer = ctypes.pythonapi.PyObject_GetBuffer
+_get_buffer.argtypes = (ctypes.py_object, ctypes.POINTER(_Py_buffer), ctypes.c_int)
+_get_buffer.restype = ctypes.c_int
+
+_release_buffer = ctypes.pythonapi.PyBuffer_Release
+_release_buffer.argtypes = (ctypes.POINTER(_Py_buffer),)
+_release_buffer.restype = None
+
+
+def buffer_address(view: memoryview) -> int:
+    """The address of the first byte of a buffer, read-only or not"""
+
+    buffer = _Py_buffer()
+    _get_buffer(view, ctypes.byref(buffer), _PyBUF_RECORDS_RO)
+
+    try:
+        return buffer.buf or 0
+    finally:
+        _release_buffer(ctypes.byref(buffer))
@@ -0,0 +1,169 @@
+"""Caches used by Zons"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Event, Lock
+import time
+from typing import Any
+
+
+class LRUCache:
+    """A bounded mapping that evicts its least recently used entries when full.
+
+    Entries can optionally expire after some time.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "ttl",
+        "hits",
+        "misses",
+        "evictions",
+        "_entries",
+        "_pending",
+        "_lock",
+        "_timer",
+    )
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None = None,
+        *,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """Builds a new, empty, cache.
+
+        Args:
+            maxsize (int): the maximum number of entries the cache holds.
+            ttl (float, optional): how many seconds entries are kept for. By default, entries do not expire.
+            timer (Callable[[], float]): the clock used to expire entries.
+        """
+
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._pending: dict[Hashable, Event] = {}
+        self._lock = Lock()
+        self._timer = timer
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value cached for the given key, or `default` if there is none"""
+
+        with self._lock:
+            try:
+                (expires_at, value) = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            if expires_at is not None and expires_at <= self._timer():
+                del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """Caches the given value, evicting the least recently used entry if the cache is full"""
+
+        expires_at = None if self.ttl is None else self._timer() + self.ttl
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Returns the value cached for the given key, computing and caching it if there is none.
+
+        Concurrent calls for the same key compute the value once: the other threads wait for it.
+        Values are not cached if computing them raises an exception.
+
+        Args:
+            key (Hashable): the key of the value.
+            compute (Callable[[], Any]): computes the value on a miss.
+
+        Returns:
+            Any: the cached or computed value.
+        """
+
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+
+                if entry is not None:
+                    (expires_at, value) = entry
+
+                    if expires_at is None or expires_at > self._timer():
+                        self._entries.move_to_end(key)
+                        self.hits += 1
+
+                        return value
+
+                    del self._entries[key]
+
+                in_flight = self._pending.get(key)
+
+                if in_flight is None:
+                    in_flight = self._pending[key] = Event()
+                    self.misses += 1
+                    break
+
+            # another thread is computing the value, try again once it is done
+            in_flight.wait()
+
+        try:
+            value = compute()
+            self.put(key, value)
+        finally:
+            with self._lock:
+                del self._pending[key]
+
+            in_flight.set()
+
+        return value
+
+    def info(self) -> dict[str, int]:
+        """Returns the statistics of this cache: its size, hits, misses and evictions"""
+
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        """Removes every entry from the cache"""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __reduce__(self):
+        # cached values are not carried over
+        return (LRUCache, (self.maxsize, self.ttl))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
@@ -0,0 +1,673 @@
+"""
+Source code generation backend for Zons.
+
+Instead of chaining closures together like `Zon.compile` does, this module walks a schema once and
+emits the Python source of a single function that validates data against it, which is then compiled
+with `compile`/`exec`.
+
+Type checks for the basic types, record keys and simple validation rules are inlined in the generated
+code. Anything that can't be inlined (custom `Zon` subclasses, refinements, string formats, ...) is
+called through its `Zon.compile` counterpart, so the generated code always behaves like `safe_validate`.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from . import (
+    _AbortValidation,
+    _discarded_copy_strategy,
+    _has_length,
+    _has_max_length,
+    _has_min_length,
+    _is_float,
+    _is_gt,
+    _is_gte,
+    _is_int,
+    _is_lt,
+    _is_lte,
+    _is_nonempty,
+    _record_change,
+    _record_output,
+    AsyncValidationRule,
+    ValidationContext,
+    ValidationRule,
+    Zon,
+    ZonAnything,
+    ZonBoolean,
+    ZonEnum,
+    ZonIntersection,
+    ZonList,
+    ZonLiteral,
+    ZonNever,
+    ZonNumber,
+    ZonOptional,
+    ZonRecord,
+    ZonString,
+    ZonTuple,
+    ZonUnion,
+)
+from .error import ZonIssue
+
+__all__ = ["generate", "generate_source"]
+
+_FUNCTION_NAME = "validate"
+
+_NUMBER_COMPARISONS = {
+    _is_gt: ">",
+    _is_gte: ">=",
+    _is_lt: "<",
+    _is_lte: "<=",
+}
+"""The built-in rules of numbers that compare them to a bound, by rule function."""
+
+_LENGTH_COMPARISONS = {
+    _has_max_length: "<=",
+    _has_min_length: ">=",
+    _has_length: "==",
+}
+"""The built-in rules of containers that compare their length to a bound, by rule function."""
+
+
+class _Generator:
+    """Accumulates the lines and the namespace of the function being generated."""
+
+    def __init__(self):
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {
+            "ZonIssue": ZonIssue,
+            "NUMBER_TYPES": (int, float),
+            "AbortValidation": _AbortValidation,
+            "record_change": _record_change,
+            "record_output": _record_output,
+            "discarded_copy_strategy": _discarded_copy_strategy,
+        }
+        self._counter = itertools.count()
+
+    def name(self, prefix: str) -> str:
+        """Returns a fresh variable name"""
+        return f"{prefix}{next(self._counter)}"
+
+    def constant(self, value: Any, prefix: str = "k") -> str:
+        """Makes `value` available to the generated code and returns the name bound to it"""
+
+        name = self.name(prefix)
+        self.namespace[name] = value
+        return name
+
+    def emit(self, line: str, depth: int):
+        """Adds a line of code to the generated function"""
+        self.lines.append(f"{'    ' * depth}{line}")
+
+    def block(self, depth: int, start: int):
+        """Makes sure the block starting at `start` has at least one statement"""
+
+        if len(self.lines) == start:
+            self.emit("pass", depth)
+
+    def issue(self, value: str, code: str, depth: int, params: str | None = None):
+        """Emits the code that adds an issue to the validation context.
+
+        `params` is an expression that evaluates to the parameters of the issue's message, if any.
+        """
+
+        params = "" if params is None else f", params={params}"
+
+        self.emit(
+            f"ctx.add_issue(ZonIssue(value={value}, code={code!r}{params}, path=list(path)))",
+            depth,
+        )
+
+    # Zons
+
+    def zon(self, zon: Zon, source: str, depth: int) -> str:
+        """Emits the code that validates the value held by `source` against `zon`.
+
+        Returns:
+            str: the name of the variable that holds the validated value.
+        """
+
+        if type(zon) in _LEAVES:
+            leaf = _LEAVES[type(zon)]
+
+            return self._leaf(
+                zon,
+                source,
+                depth,
+                leaf.failure(self, zon, source),
+                leaf.issue(self, zon),
+            )
+
+        container = _CONTAINERS.get(type(zon))
+
+        if container is None:
+            # not something we know how to inline
+            target = self.name("v")
+            run = self.constant(zon._compile(), "zon")
+            self.emit(f"{target} = {run}({source}, ctx)", depth)
+
+            return target
+
+        if not zon.validators:
+            return container(self, zon, source, depth)
+
+        # rules need the validated data
+        build_output = self.name("b")
+        self.emit(f"{build_output} = ctx.build_output", depth)
+        self.emit("ctx.build_output = True", depth)
+
+        count = self.name("c")
+        self.emit(f"{count} = ctx.issue_count", depth)
+
+        target = self._writable(zon, container(self, zon, source, depth), depth)
+
+        self.emit(f"if ctx.issue_count == {count}:", depth)
+        self._rules(zon, target, depth + 1)
+
+        self.emit(f"ctx.build_output = {build_output}", depth)
+
+        return target
+
+    def _leaf(
+        self,
+        zon: Zon,
+        source: str,
+        depth: int,
+        failure: str | None,
+        issue: tuple[str, str | None],
+    ) -> str:
+        (code, params) = issue
+
+        if failure is None:
+            # always fails, rules never run
+            self.issue(source, code, depth, params)
+            return source
+
+        target = self._writable(zon, source, depth)
+
+        if failure == "False":
+            # never fails
+            self._rules(zon, target, depth)
+            return target
+
+        self.emit(f"if {failure}:", depth)
+        self.issue(source, code, depth + 1, params)
+
+        if zon.validators:
+            self.emit("else:", depth)
+            self._rules(zon, target, depth + 1)
+
+        return target
+
+    def _writable(self, zon: Zon, target: str, depth: int) -> str:
+        """Returns a variable that `zon`'s rules can assign to without clobbering `target`"""
+
+        if all(self._inline_rule(zon, rule, target) for rule in zon.validators):
+            return target
+
+        new_target = self.name("v")
+        self.emit(f"{new_target} = {target}", depth)
+
+        return new_target
+
+    def _rules(self, zon: Zon, target: str, depth: int):
+        for rule in zon.validators:
+            failure = self._inline_rule(zon, rule, target)
+
+            if failure is None:
+                check = self.constant(rule.check, "rule")
+                self.emit(f"{target} = {check}({target}, ctx)", depth)
+                continue
+
+            self.emit(f"if {failure}:", depth)
+            self.issue(target, "failed_rule", depth + 1, repr({"rule": rule.name}))
+
+    @staticmethod
+    def _inline_rule(zon: Zon, rule: ValidationRule, target: str) -> str | None:
+        """Returns an expression that is true when `rule` fails, if the rule can be inlined."""
+
+        if isinstance(rule, AsyncValidationRule):
+            return None
+
+        # rules are told apart by their function, as users choose their names
+        fn = rule.fn
+        (func, args) = (
+            (fn.func, fn.args)
+            if isinstance(fn, functools.partial) and not fn.keywords
+            else (fn, ())
+        )
+        value = args[0] if len(args) == 1 else None
+        numeric = type(value) in (int, float)
+
+        if isinstance(zon, ZonNumber):
+            if func in _NUMBER_COMPARISONS and numeric:
+                return f"not {target} {_NUMBER_COMPARISONS[func]} {_literal(value)}"
+
+            if func is _is_int:
+                return f"not isinstance({target}, int)"
+
+            if func is _is_float:
+                return f"not isinstance({target}, float)"
+
+        if type(zon) in (ZonString, ZonList):
+            if func in _LENGTH_COMPARISONS and numeric:
+                return (
+                    f"not len({target}) {_LENGTH_COMPARISONS[func]} {_literal(value)}"
+                )
+
+            if func is _is_nonempty:
+                return f"not len({target}) > 0"
+
+        return None
+
+    def record(self, zon: ZonRecord, source: str, depth: int) -> str:
+        """Emits the code for a `ZonRecord`, unrolling every key of its shape"""
+
+        target = self.name("r")
+
+        self.emit(f"if not isinstance({source}, dict):", depth)
+        self.issue(source, "not_an_object", depth + 1)
+        self.emit(f"{target} = {source}", depth + 1)
+        self.emit("else:", depth)
+
+        depth += 1
+
+        build_output = self.name("b")
+        self.emit(f"{build_output} = ctx.build_output", depth)
+
+        # changes are only applied (and the record copied) at the end, if there are any
+        changes = self.name("w")
+        self.emit(f"{changes} = None", depth)
+
+        extra_keys = None
+        if (
+            zon._catchall is not None
+            or zon.unknown_key_policy is not ZonRecord.UnknownKeyPolicy.PASSTHROUGH
+        ):
+            extra_keys = self.name("x")
+            shape_keys = self.constant(frozenset(zon.shape.keys()), "keys")
+            self.emit(f"{extra_keys} = {source}.keys() - {shape_keys}", depth)
+
+        for key, child in zon.shape.items():
+            if isinstance(key, str):
+                key = repr(key)
+            else:
+                key = self.constant(key, "key")
+
+            self._record_value(
+                child, source, key, depth, build_output=build_output, changes=changes
+            )
+
+        if zon._catchall is not None:
+            key = self.name("k")
+            self.emit(f"for {key} in {extra_keys}:", depth)
+            self._record_value(
+                zon._catchall,
+                source,
+                key,
+                depth + 1,
+                build_output=build_output,
+                changes=changes,
+            )
+        elif zon.unknown_key_policy is ZonRecord.UnknownKeyPolicy.STRIP:
+            key = self.name("k")
+            self.emit(f"if {build_output}:", depth)
+            self.emit(f"for {key} in {extra_keys}:", depth + 1)
+            self.emit(
+                f"{changes} = record_change({changes}, {source}, {key}, {source}[{key}], None)",
+                depth + 2,
+            )
+        elif zon.unknown_key_policy is ZonRecord.UnknownKeyPolicy.STRICT:
+            self.emit(f"if len({extra_keys}) > 0:", depth)
+            self.emit(
+                f"ctx.add_issue(ZonIssue(value={extra_keys}, "
+                f"code='unrecognized_keys', params={{'keys': {extra_keys}}}, path=list(path)))",
+                depth + 1,
+            )
+
+        self.emit(
+            f"{target} = record_output({source}, {changes}, ctx.copy_strategy)", depth
+        )
+
+        return target
+
+    def _record_value(
+        self,
+        zon: Zon,
+        source: str,
+        key: str,
+        depth: int,
+        *,
+        build_output: str,
+        changes: str,
+    ):
+        value = self.name("f")
+        count = self.name("c")
+
+        self.emit(f"{value} = {source}.get({key}, None)", depth)
+        self.emit(f"{count} = ctx.issue_count", depth)
+
+        self.emit(f"path.append({key})", depth)
+        validated = self.zon(zon, value, depth)
+        self.emit("path.pop()", depth)
+
+        self.emit(
+            f"if {build_output} and ctx.issue_count == {count} and "
+            f"({validated} is None or {validated} is not {value}):",
+            depth,
+        )
+        self.emit(
+            f"{changes} = record_change({changes}, {source}, {key}, {value}, {validated})",
+            depth + 1,
+        )
+
+    def discard(self, depth: int) -> str:
+        """Emits the code that stops the following children from changing data in place.
+
+        Must be paired with a call to `restore`.
+
+        Returns:
+            str: the name of the variable holding the copy strategy to be restored.
+        """
+
+        copy_strategy = self.name("s")
+
+        self.emit(f"{copy_strategy} = ctx.copy_strategy", depth)
+        self.emit(
+            f"ctx.copy_strategy = discarded_copy_strategy({copy_strategy})", depth
+        )
+
+        return copy_strategy
+
+    def restore(self, copy_strategy: str, depth: int):
+        """Emits the code that restores the copy strategy saved by `discard`"""
+
+        self.emit(f"ctx.copy_strategy = {copy_strategy}", depth)
+
+    def list(self, zon: ZonList, source: str, depth: int) -> str:
+        """Emits the code for a `ZonList`"""
+
+        index = self.name("i")
+        element = self.name("e")
+
+        self.emit(f"if not isinstance({source}, list):", depth)
+        self.issue(source, "not_a_list", depth + 1)
+        self.emit("else:", depth)
+
+        copy_strategy = self.discard(depth + 1)
+
+        if zon._batch_rules:
+            return self._batched_list(zon, source, depth + 1, copy_strategy)
+
+        self.emit(f"for {index}, {element} in enumerate({source}):", depth + 1)
+
+        self.emit(f"path.append({index})", depth + 2)
+        self.zon(zon.element, element, depth + 2)
+        self.emit("path.pop()", depth + 2)
+
+        self.restore(copy_strategy, depth + 1)
+
+        return source
+
+    def _batched_list(
+        self, zon: ZonList, source: str, depth: int, copy_strategy: str
+    ) -> str:
+        """Emits the loop of a `ZonList` with batch rules, which collects the valid elements for them"""
+
+        index = self.name("i")
+        element = self.name("e")
+        candidates = self.name("l")
+        count = self.name("c")
+        build_output = self.name("b")
+
+        # batch rules need the validated elements
+        self.emit(f"{build_output} = ctx.build_output", depth)
+        self.emit("ctx.build_output = True", depth)
+        self.emit(f"{candidates} = []", depth)
+        self.emit(f"for {index}, {element} in enumerate({source}):", depth)
+
+        self.emit(f"{count} = ctx.issue_count", depth + 1)
+        self.emit(f"path.append({index})", depth + 1)
+        validated = self.zon(zon.element, element, depth + 1)
+        self.emit("path.pop()", depth + 1)
+        self.emit(f"if ctx.issue_count == {count}:", depth + 1)
+        self.emit(f"{candidates}.append(({index}, {validated}))", depth + 2)
+
+        self.restore(copy_strategy, depth)
+        self.emit(f"ctx.build_output = {build_output}", depth)
+
+        for rule in zon._batch_rules:
+            check = self.constant(rule.check_batch, "rule")
+            self.emit(f"{check}({candidates}, ctx)", depth)
+
+        return source
+
+    def tuple(self, zon: ZonTuple, source: str, depth: int) -> str:
+        """Emits the code for a `ZonTuple`, unrolling every item"""
+
+        item_count = len(zon.items)
+
+        self.emit(f"if not isinstance({source}, tuple):", depth)
+        self.issue(source, "not_a_list", depth + 1)
+        self.emit(f"elif len({source}) < {item_count}:", depth)
+        self.issue(source, "too_few_elements", depth + 1)
+
+        if zon._rest is None:
+            self.emit(f"elif len({source}) > {item_count}:", depth)
+            self.issue(source, "too_many_elements", depth + 1)
+
+        self.emit("else:", depth)
+
+        copy_strategy = self.discard(depth + 1)
+
+        for i, item in enumerate(zon.items):
+            if item is None:
+                continue
+
+            value = self.name("t")
+            self.emit(f"{value} = {source}[{i}]", depth + 1)
+            self.emit(f"path.append({i})", depth + 1)
+            self.zon(item, value, depth + 1)
+            self.emit("path.pop()", depth + 1)
+
+        if zon._rest is not None:
+            index = self.name("i")
+            element = self.name("e")
+            self.emit(
+                f"for {index}, {element} in enumerate({source}[{item_count}:], {item_count}):",
+                depth + 1,
+            )
+
+            self.emit(f"path.append({index})", depth + 2)
+            self.zon(zon._rest, element, depth + 2)
+            self.emit("path.pop()", depth + 2)
+
+        self.restore(copy_strategy, depth + 1)
+
+        return source
+
+    def union(self, zon: ZonUnion, source: str, depth: int) -> str:
+        """Emits the code for a `ZonUnion`, trying each option in turn"""
+
+        if len(zon.options) == 0:
+            return source
+
+        error = self.name("err")
+        issues = self.name("i")
+        failed = self.name("u")
+        path_length = self.name("p")
+        build_output = self.name("b")
+
+        self.emit(f"{error} = ctx.error", depth)
+        self.emit(f"{issues} = []", depth)
+        self.emit(f"{failed} = True", depth)
+        self.emit(f"{path_length} = len(path)", depth)
+        self.emit(f"{build_output} = ctx.build_output", depth)
+
+        copy_strategy = self.discard(depth)
+
+        option_depth = depth
+        for option in zon.options:
+            # each option reports into a fresh error so that its issues can be discarded
+            self.emit("ctx.error = None", option_depth)
+            self.emit("try:", option_depth)
+
+            self.zon(option, source, option_depth + 1)
+            self.emit(f"{failed} = ctx.dirty", option_depth + 1)
+
+            self.emit("except AbortValidation:", option_depth)
+            # this option failed, try the next one
+            self.emit(f"del path[{path_length}:]", option_depth + 1)
+            self.emit(f"ctx.build_output = {build_output}", option_depth + 1)
+
+            self.emit(f"if {failed}:", option_depth)
+            self.emit("if ctx.error is not None:", option_depth + 1)
+            self.emit(f"{issues}.extend(ctx.error.issues)", option_depth + 2)
+            option_depth += 1
+
+        self.restore(copy_strategy, depth)
+        self.emit(f"ctx.error = {error}", depth)
+        self.emit(f"if {failed}:", depth)
+        self.emit(
+            f"{issues}.append(ZonIssue(value={source}, "
+            f"code='invalid_union', path=list(path)))",
+            depth + 1,
+        )
+        self.emit(f"ctx.add_issues({issues})", depth + 1)
+
+        return source
+
+    def intersection(self, zon: ZonIntersection, source: str, depth: int) -> str:
+        """Emits the code for a `ZonIntersection`"""
+
+        count = self.name("c")
+
+        copy_strategy = self.discard(depth)
+
+        self.emit(f"{count} = ctx.issue_count", depth)
+        self.zon(zon.zon1, source, depth)
+        self.emit(f"if ctx.issue_count == {count}:", depth)
+
+        start = len(self.lines)
+        self.zon(zon.zon2, source, depth + 1)
+        self.block(depth + 1, start)
+
+        self.restore(copy_strategy, depth)
+
+        return source
+
+    def optional(self, zon: ZonOptional, source: str, depth: int) -> str:
+        """Emits the code for a `ZonOptional`"""
+
+        self.emit(f"if {source}:", depth)
+
+        copy_strategy = self.discard(depth + 1)
+        self.zon(zon.unwrap(), source, depth + 1)
+        self.restore(copy_strategy, depth + 1)
+
+        return source
+
+
+def _literal(value: int | float) -> str:
+    """Returns a Python expression that evaluates to the given number"""
+
+    if isinstance(value, float) and not math.isfinite(value):
+        return f"float({str(value)!r})"
+
+    return repr(value)
+
+
+@dataclass(slots=True, frozen=True)
+class _Leaf:
+    """How the value held by a variable is checked against a leaf Zon"""
+
+    failure: Callable[[_Generator, Any, str], str | None]
+    """An expression that is true when the value fails validation."""
+    issue: Callable[[_Generator, Any], tuple[str, str | None]]
+    """The code and the parameters (as an expression) of the issue."""
+
+
+_LEAVES: dict[type[Zon], _Leaf] = {
+    ZonString: _Leaf(
+        lambda g, zon, v: f"not isinstance({v}, str)",
+        lambda g, zon: ("not_a_string", None),
+    ),
+    ZonNumber: _Leaf(
+        lambda g, zon, v: f"not isinstance({v}, NUMBER_TYPES)",
+        lambda g, zon: ("not_a_number", None),
+    ),
+    ZonBoolean: _Leaf(
+        lambda g, zon, v: f"not isinstance({v}, bool)",
+        lambda g, zon: ("not_a_boolean", None),
+    ),
+    ZonLiteral: _Leaf(
+        lambda g, zon, v: f"{v} != {g.constant(zon.value, 'literal')}",
+        lambda g, zon: (
+            "invalid_literal",
+            f"{{'expected': {g.constant(zon.value, 'literal')}}}",
+        ),
+    ),
+    ZonEnum: _Leaf(
+        lambda g, zon, v: f"{v} not in {g.constant(zon._options, 'enum')}",
+        lambda g, zon: (
+            "invalid_enum_value",
+            f"{{'options': {g.constant(zon._options, 'enum')}}}",
+        ),
+    ),
+    ZonNever: _Leaf(lambda g, zon, v: None, lambda g, zon: ("no_data_allowed", None)),
+    ZonAnything: _Leaf(lambda g, zon, v: "False", lambda g, zon: ("custom", None)),
+}
+
+_CONTAINERS: dict[type[Zon], Callable[[_Generator, Any, str, int], str]] = {
+    ZonRecord: _Generator.record,
+    ZonList: _Generator.list,
+    ZonTuple: _Generator.tuple,
+    ZonUnion: _Generator.union,
+    ZonIntersection: _Generator.intersection,
+    ZonOptional: _Generator.optional,
+}
+
+
+def generate_source(zon: Zon) -> tuple[str, dict[str, Any]]:
+    """Generates the source code of a function that validates data against `zon`.
+
+    The generated function has the same contract as `Zon._default_validate`.
+
+    Args:
+        zon (Zon): the Zon to generate the code for.
+
+    Returns:
+        (str, dict[str, Any]): the source code and the namespace it must be executed in.
+    """
+
+    generator = _Generator()
+
+    generator.emit(f"def {_FUNCTION_NAME}(data, ctx):", 0)
+    generator.emit("path = ctx.path", 1)
+    result = generator.zon(zon, "data", 1)
+    generator.emit(f"return {result}", 1)
+
+    return ("\n".join(generator.lines) + "\n", generator.namespace)
+
+
+def generate(zon: Zon) -> Callable[[Any, ValidationContext], Any]:
+    """Generates and compiles a function that validates data against `zon`.
+
+    Args:
+        zon (Zon): the Zon to generate the code for.
+
+    Returns:
+        Callable[[Any, ValidationContext], Any]: the generated function.
+    """
+
+    (source, namespace) = generate_source(zon)
+
+    code = compile(source, f"<zon codegen {type(zon).__name__}>", "exec")
+    exec(code, namespace)  # pylint: disable=exec-used
+
+    return namespace[_FUNCTION_NAME]
@@ -0,0 +1,458 @@
+"""Columnar validation of batches of records.
+
+Instead of validating every field of a record before moving on to the next record, the batch is
+transposed and each field is validated over its whole column in one loop. Leaf fields (numbers, booleans,
+enums and literals) are checked with a single pass over their column, vectorized with NumPy for numbers.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping, Sequence, Set
+from typing import TYPE_CHECKING, Any
+
+from .error import ZonError, ZonIssue
+
+if TYPE_CHECKING:
+    from . import Zon, ZonBatchResult, ZonNumber, ZonRecord
+
+Failures = list[tuple[int, str, dict[str, Any]]]
+"""The failures found in a column, as (row index, issue code, issue params), by row index."""
+
+
+def validate_columns(
+    zon: ZonRecord, data: Sequence[Any] | Mapping[str, Sequence[Any]]
+) -> ZonBatchResult:
+    """Validates a batch of records against `zon`, field by field.
+
+    Args:
+        zon (ZonRecord): the Zon to validate each record with.
+        data (Sequence[Any] | Mapping[str, Sequence[Any]]): the records, either as a sequence of rows
+        or as a mapping of columns of the same length.
+
+    Returns:
+        ZonBatchResult: the validated records and the errors of the invalid records, by row index.
+
+    Raises:
+        ValueError: if the columns are not all of the same length.
+    """
+
+    # pylint: disable-next=import-outside-toplevel
+    from . import ZonBatchResult
+
+    issues: dict[int, list[ZonIssue]] = {}
+    changes: dict[int, dict[str, Any]] = {}
+
+    if isinstance(data, Mapping):
+        rows = None
+        columns = dict(data)
+        count = _column_length(columns)
+    else:
+        rows = list(data)
+        count = len(rows)
+
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                issues[index] = [ZonIssue(value=row, code="not_an_object", path=[])]
+
+        # fields that a row does not have are validated as None, like in `ZonRecord`
+        columns = {
+            key: [row.get(key) if isinstance(row, dict) else None for row in rows]
+            for key in zon.shape
+        }
+
+    # rows that are not records have no fields to validate
+    skipped = set(issues)
+
+    for key, field in zon.shape.items():
+        column = columns.get(key)
+
+        if column is None:
+            column = [None] * count
+
+        _validate_field(key, field, column, issues, changes, skipped=skipped)
+
+    # records are built from plain values
+    columns = {
+        key: column.tolist() if _is_array(column) else column
+        for key, column in columns.items()
+    }
+
+    _validate_unknown_keys(
+        zon, rows, columns, count, skipped=skipped, issues=issues, changes=changes
+    )
+
+    result = ZonBatchResult([], {})
+
+    for index, record in enumerate(_records(zon, rows, columns, count, changes)):
+        if index in issues:
+            error = ZonError()
+            error.add_issues(issues[index])
+
+            result.values.append(None)
+            result.errors[index] = error
+            continue
+
+        (valid, record_or_error) = _check_rules(zon, record)
+
+        if valid:
+            result.values.append(record_or_error)
+        else:
+            result.values.append(None)
+            result.errors[index] = record_or_error
+
+    return result
+
+
+def _column_length(columns: Mapping[str, Sequence[Any]]) -> int:
+    lengths = {len(column) for column in columns.values()}
+
+    if len(lengths) > 1:
+        raise ValueError(
+            f"Expected columns of the same length, got lengths {sorted(lengths)}"
+        )
+
+    return lengths.pop() if lengths else 0
+
+
+def _validate_field(
+    key: str,
+    field: Zon,
+    column: Sequence[Any],
+    issues: dict[int, list[ZonIssue]],
+    changes: dict[int, dict[str, Any]] | None,
+    *,
+    skipped: Set[int] = frozenset(),
+):
+    """Validates the column of a field, adding the issues and changes of each row.
+
+    Changes are not recorded if `changes` is None, e.g. if the records are not built.
+    """
+
+    if _is_array(column) and column.dtype.kind == "O":
+        # arrays of objects are checked like lists
+        column = column.tolist()
+
+    failures = _leaf_failures(field, column)
+
+    if failures is None:
+        _validate_column(key, field, column, issues, changes, skipped=skipped)
+        return
+
+    for index, code, params in failures:
+        if index not in skipped:
+            value = column[index]
+            value = value.item() if hasattr(value, "item") else value
+
+            issues.setdefault(index, []).append(
+                ZonIssue(value=value, code=code, params=params, path=[key])
+            )
+
+    if (
+        changes is not None
+        and not _is_array(column)
+        and any(value is None for value in column)
+    ):
+        # None values are removed from the records, like in `ZonRecord`
+        for index, value in enumerate(column):
+            if value is None:
+                changes.setdefault(index, {})[key] = None
+
+
+def _validate_column(
+    key: str,
+    field: Zon,
+    column: Sequence[Any],
+    issues: dict[int, list[ZonIssue]],
+    changes: dict[int, dict[str, Any]] | None,
+    *,
+    skipped: Set[int] = frozenset(),
+):
+    """Validates a column value by value, with a single validation context"""
+
+    # pylint: disable-next=import-outside-toplevel
+    from . import ValidationContext
+
+    run = field._compile()
+    ctx = ValidationContext(path=[key])
+
+    if _is_array(column):
+        column = column.tolist()
+
+    for index, value in enumerate(column):
+        if skipped and index in skipped:
+            continue
+
+        validated = run(value, ctx)
+
+        if ctx.error is not None and ctx.error.issue_count > 0:
+            issues.setdefault(index, []).extend(ctx.error.issues)
+            ctx.error = None
+        elif changes is not None and (validated is None or validated is not value):
+            changes.setdefault(index, {})[key] = validated
+
+
+def _leaf_failures(field: Zon, column: Any) -> Failures | None:
+    """Checks a column of a leaf field in one pass, if the field allows it.
+
+    Returns:
+        Failures | None: the failures of the column, or `None` if it must be validated value by value.
+    """
+
+    # pylint: disable-next=import-outside-toplevel
+    from . import ZonBoolean, ZonEnum, ZonLiteral, ZonNumber, ZonOptional
+
+    if _is_array(column) and column.ndim != 1:
+        return None
+
+    optional = False
+    while isinstance(field, ZonOptional) and not field.validators:
+        (field, optional) = (field.unwrap(), True)
+
+    if isinstance(field, ZonNumber):
+        failures = _number_failures(field, column)
+    elif field.validators:
+        return None
+    elif isinstance(field, ZonBoolean):
+        failures = _boolean_failures(column)
+    elif isinstance(field, ZonEnum):
+        failures = _enum_failures(field._options, column)
+    elif isinstance(field, ZonLiteral):
+        failures = _literal_failures(field.value, column)
+    else:
+        return None
+
+    if failures and optional:
+        # optional fields do not validate falsy values
+        failures = [failure for failure in failures if column[failure[0]]]
+
+    return failures
+
+
+def _number_failures(field: ZonNumber, column: Any) -> Failures | None:
+    # pylint: disable-next=import-outside-toplevel
+    from .vectorized import _numpy_or_none, _vectorizes
+
+    np = _numpy_or_none()
+
+    # other rules, like refinements, are checked value by value to report what they raise
+    if np is None or not all(_vectorizes(rule) for rule in field.validators):
+        return None
+
+    if not _is_array(column):
+        array_types = {float: np.float64, int: np.int64, bool: np.bool_}
+        types = {type(value) for value in column}
+
+        # the rules are only evaluated the same way over homogeneous columns
+        if len(types) != 1 or not types <= array_types.keys():
+            return None
+
+        try:
+            column = np.array(column, dtype=array_types[types.pop()])
+        except OverflowError:
+            return None
+    elif column.dtype.kind not in "buif":
+        return None
+
+    failures = [
+        (index, "failed_rule", {"rule": rule})
+        for rule, failed in field.validate_array(column).failures.items()
+        for index in failed.tolist()
+    ]
+    # the rules of each value are in order, like in `ZonNumber`
+    failures.sort(key=lambda failure: failure[0])
+
+    return failures
+
+
+def _boolean_failures(column: Any) -> Failures | None:
+    code = ("not_a_boolean", {})
+
+    if _is_array(column):
+        return [] if column.dtype.kind == "b" else None
+
+    return [
+        (index, *code)
+        for index, value in enumerate(column)
+        if value is not True and value is not False
+    ]
+
+
+def _enum_failures(options: Any, column: Any) -> Failures | None:
+    code = ("invalid_enum_value", {"options": options})
+
+    if _is_array(column):
+        if column.dtype.kind != "U":
+            return None
+
+        np = sys.modules["numpy"]
+        mask = np.isin(
+            column, [option for option in options if isinstance(option, str)]
+        )
+
+        return [(index, *code) for index in np.flatnonzero(~mask).tolist()]
+
+    return [
+        (index, *code) for index, value in enumerate(column) if value not in options
+    ]
+
+
+def _literal_failures(expected: Any, column: Any) -> Failures | None:
+    code = ("invalid_literal", {"expected": expected})
+
+    if _is_array(column):
+        if column.dtype.kind != "U" or not isinstance(expected, str):
+            return None
+
+        np = sys.modules["numpy"]
+
+        return [(index, *code) for index in np.flatnonzero(column != expected).tolist()]
+
+    return [(index, *code) for index, value in enumerate(column) if value != expected]
+
+
+def _validate_unknown_keys(
+    zon: ZonRecord,
+    rows: list[Any] | None,
+    columns: Mapping[str, Sequence[Any]],
+    count: int,
+    *,
+    skipped: set[int],
+    issues: dict[int, list[ZonIssue]],
+    changes: dict[int, dict[str, Any]],
+):
+    """Checks the keys that are not in the shape, if they must be checked"""
+
+    # pylint: disable-next=import-outside-toplevel
+    from . import ZonRecord as _ZonRecord
+
+    catchall = zon._catchall
+    strict = zon.unknown_key_policy == _ZonRecord.UnknownKeyPolicy.STRICT
+
+    if catchall is None and not strict:
+        # extra keys are stripped or passed through when building the records
+        return
+
+    if rows is None:
+        extra = columns.keys() - zon.shape.keys()
+        extra_keys = ((index, extra) for index in range(count))
+    else:
+        extra_keys = (
+            (index, row.keys() - zon.shape.keys())
+            for (index, row) in enumerate(rows)
+            if index not in skipped
+        )
+
+    for index, keys in extra_keys:
+        if not keys:
+            continue
+
+        if catchall is None:
+            issues.setdefault(index, []).append(
+                ZonIssue(
+                    value=keys, code="unrecognized_keys", params={"keys": keys}, path=[]
+                )
+            )
+            continue
+
+        for key in keys:
+            value = columns[key][index] if rows is None else rows[index][key]
+            (valid, data_or_error) = catchall.safe_validate(value)
+
+            if not valid:
+                issues.setdefault(index, []).extend(
+                    issue.at([key]) for issue in data_or_error.issues
+                )
+            elif data_or_error is None or data_or_error is not value:
+                changes.setdefault(index, {})[key] = data_or_error
+
+
+def _records(
+    zon: ZonRecord,
+    rows: list[Any] | None,
+    columns: Mapping[str, Sequence[Any]],
+    count: int,
+    changes: dict[int, dict[str, Any]],
+):
+    """Builds the validated records, like `ZonRecord` does.
+
+    Rows are returned as they are if validation did not change them. Records of invalid rows are not used.
+    """
+
+    # pylint: disable-next=import-outside-toplevel
+    from . import ZonRecord as _ZonRecord, _record_change, _record_output
+
+    strip = (
+        zon._catchall is None
+        and zon.unknown_key_policy == _ZonRecord.UnknownKeyPolicy.STRIP
+    )
+    shape = zon.shape.keys()
+
+    if rows is None:
+        keys = [key for key in columns if not strip or key in shape]
+        # new records, so they can be changed in place
+        (copy_strategy, records) = (
+            "none",
+            (
+                (
+                    dict(zip(keys, values))
+                    for values in zip(*(columns[key] for key in keys))
+                )
+                if keys
+                else ({} for _ in range(count))
+            ),
+        )
+    else:
+        (copy_strategy, records) = ("on_write", rows)
+
+    for index, record in enumerate(records):
+        row_changes = changes.get(index)
+
+        if not isinstance(record, dict) or (
+            row_changes is None
+            and (rows is None or not strip or record.keys() <= shape)
+        ):
+            yield record
+            continue
+
+        record_changes = None
+
+        for key, validated in (row_changes or {}).items():
+            record_changes = _record_change(
+                record_changes, record, key, record.get(key), validated
+            )
+
+        if strip and rows is not None:
+            for key in record.keys() - shape:
+                record_changes = _record_change(
+                    record_changes, record, key, record[key], None
+                )
+
+        yield _record_output(record, record_changes, copy_strategy)
+
+
+def _check_rules(zon: ZonRecord, record: dict) -> tuple[bool, dict | ZonError]:
+    """Runs the validation rules of the record itself"""
+
+    if not zon.validators:
+        return (True, record)
+
+    # pylint: disable-next=import-outside-toplevel
+    from . import ValidationContext
+
+    ctx = ValidationContext()
+
+    for rule in zon.validators:
+        record = rule.check(record, ctx)
+
+    if ctx.dirty:
+        return (False, ctx.error)
+
+    return (True, record)
+
+
+def _is_array(column: Any) -> bool:
+    # NumPy is only looked for if it was imported: otherwise, there cannot be any arrays
+    np = sys.modules.get("numpy")
+
+    return np is not None and isinstance(column, np.ndarray)
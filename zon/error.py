@@ -1,7 +1,8 @@
 """Validation errors for Zons"""
 
+from __future__ import annotations
+
 from typing import Any
-from dataclasses import dataclass
 
 from typing_extensions import deprecated
 
@@ -35,38 +36,208 @@ class ValidationError(Exception):
         return f"ValidationError({self.message})"
 
 
-@dataclass(kw_only=True, frozen=True)
+ISSUE_MESSAGES: dict[str, str] = {
+    "not_a_string": "Not a string",
+    "not_a_number": "Not a valid number",
+    "not_a_boolean": "Not a valid boolean",
+    "not_an_object": "Not a valid object",
+    "not_a_list": "Not a valid list",
+    "invalid_literal": "Expected {expected}",
+    "invalid_enum_value": "Expected one of {options}",
+    "unrecognized_keys": "Unexpected keys: {keys}",
+    "invalid_union": "Not a valid union",
+    "too_few_elements": "Not enough elements",
+    "too_many_elements": "Too many elements",
+    "no_data_allowed": "No data allowed",
+    "invalid_json": "Not valid JSON: {error}",
+    "not_a_buffer": "Not a valid buffer",
+    "invalid_buffer_format": "Expected a buffer of '{expected}' elements, got '{received}'",
+    "invalid_buffer_size": "Expected a whole number of {itemsize}-byte elements, got {size} bytes",
+    "failed_rule": "Validation failed for type {rule}",
+    "failed_rule_with_exception": "Validation failed for type {rule}: {exception}",
+}
+"""Message templates of the issues raised by the built-in Zons, by issue code."""
+
+
 class ZonIssue:
-    """Some issue with validation"""
+    """Some issue with validation.
+
+    Issues are identified by a code and hold the parameters of their message,
+    which is only rendered when it is first read.
+    """
+
+    __slots__ = ("value", "path", "code", "params", "_message")
+
+    def __init__(
+        self,
+        *,
+        value: Any,
+        path: list[str | int],
+        code: str = "custom",
+        params: dict[str, Any] | None = None,
+        message: str | None = None,
+    ):
+        """Builds a new issue.
+
+        Args:
+            value (Any): the value that failed validation.
+            path (list[str | int]): the path to the value that failed validation.
+            code (str): the code that identifies the issue.
+            params (dict[str, Any], optional): the parameters of the issue's message.
+            message (str, optional): the message of the issue, if it is not to be rendered from its code.
+        """
+
+        self.value = value
+        self.path = path
+        self.code = code
+        self.params = params if params is not None else {}
+        self._message = message
+
+    def at(self, prefix: list[str | int]) -> "ZonIssue":
+        """Returns a copy of this issue whose path is nested under `prefix`"""
+
+        return ZonIssue(
+            value=self.value,
+            path=[*prefix, *self.path],
+            code=self.code,
+            params=self.params,
+            message=self._message,
+        )
+
+    @property
+    def message(self) -> str:
+        """The message of this issue"""
+
+        if self._message is None:
+            self._message = ISSUE_MESSAGES[self.code].format(**self.params)
+
+        return self._message
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ZonIssue):
+            return NotImplemented
+
+        return (
+            self.value == other.value
+            and self.message == other.message
+            and self.path == other.path
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ZonIssue(value={self.value!r}, message={self.message!r}, path={self.path!r})"
+
+
+class ZonIssueGroup:
+    """Issues that share a code (and, for failed validation rules, a rule name) and a path pattern.
+
+    Path patterns replace list and tuple indices with `"*"`, e.g. `["items", "*", "price"]`.
+    """
+
+    __slots__ = ("code", "path", "count", "samples")
 
-    value: Any
-    message: str
-    path: list[str]
+    MAX_SAMPLES = 3
+    """How many of the grouped issues are kept as samples."""
+
+    def __init__(self, code: str, path: list[str | int]):
+        """Builds a new, empty, issue group.
+
+        Args:
+            code (str): the code of the grouped issues.
+            path (list[str | int]): the path pattern of the grouped issues.
+        """
+
+        self.code = code
+        self.path = path
+        self.count = 0
+        self.samples: list[ZonIssue] = []
+
+    def add(self, issue: ZonIssue):
+        """Adds an issue to this group, keeping it as a sample if there is room for it"""
+
+        self.count += 1
+
+        if len(self.samples) < ZonIssueGroup.MAX_SAMPLES:
+            self.samples.append(issue)
+
+    @property
+    def message(self) -> str:
+        """The message of the first issue in this group"""
+
+        return self.samples[0].message
+
+    def __repr__(self) -> str:
+        return (
+            f"ZonIssueGroup(code={self.code!r}, message={self.message!r}, "
+            f"path={self.path!r}, count={self.count}, samples={self.samples!r})"
+        )
+
+
+def _group_key(issue: ZonIssue) -> tuple:
+    """The key of the group the given issue belongs to"""
+
+    return (
+        issue.code,
+        issue.params.get("rule"),
+        tuple("*" if isinstance(key, int) else key for key in issue.path),
+    )
 
 
 class ZonError(Exception):
     """Validation error thrown when a validation fails."""
 
     issues: list[ZonIssue]
+    truncated: bool
+    """Whether issues were left out of this error because too many were found."""
+    aggregate: bool
+    """Whether issues are grouped, in `groups`, instead of being kept one by one."""
+    groups: dict[tuple, ZonIssueGroup]
+    issue_count: int
+    """The number of issues added to this error."""
 
-    def __init__(self):
-        """Builds a new ValidationError with the supplied message.
+    def __init__(self, *, aggregate: bool = False):
+        """Builds a new ZonError.
 
         Args:
-            message (str): The message to be displayed when the exception is thrown.
+            aggregate (bool): whether to group the issues by code and path pattern.
+            If so, `issues` only holds the first issue of each group.
         """
         super()
         self.issues = []
+        self.truncated = False
+        self.aggregate = aggregate
+        self.groups = {}
+        self.issue_count = 0
 
     def add_issue(self, issue: ZonIssue):
         """Adds an existing issue to this validation error"""
 
-        self.issues.append(issue)
+        self.issue_count += 1
+
+        if not self.aggregate:
+            self.issues.append(issue)
+            return
+
+        key = _group_key(issue)
+        group = self.groups.get(key)
+
+        if group is None:
+            group = self.groups[key] = ZonIssueGroup(issue.code, list(key[2]))
+            self.issues.append(issue)
+
+        group.add(issue)
 
     def add_issues(self, issues: list[ZonIssue]):
         """Adds a batch of existing issues to this validation error"""
 
-        self.issues.extend(issues)
+        if not self.aggregate:
+            self.issue_count += len(issues)
+            self.issues.extend(issues)
+            return
+
+        for issue in issues:
+            self.add_issue(issue)
 
     def __str__(self):
         """Used to covert this exception into a string."""
@@ -76,6 +247,14 @@ class ZonError(Exception):
     def __repr__(self) -> str:
         """Used to covert this exception into a string."""
 
+        issues = list(self.groups.values()) if self.aggregate else self.issues
+
+        if self.truncated:
+            return f"""ZonError(
+        issues: {issues},
+        truncated: True)
+        """
+
         return f"""ZonError(
-        issues: {self.issues})
+        issues: {issues})
         """
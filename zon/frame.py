@@ -0,0 +1,231 @@
+"""Validation of pandas DataFrames and pyarrow Tables, column by column.
+
+pandas and pyarrow are optional dependencies: frames are recognized by the library they come from,
+which is never imported here.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .columnar import _check_rules, _records, _validate_field
+from .error import ZonError, ZonIssue
+from .vectorized import _numpy
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
+    from . import ZonRecord
+
+
+@dataclass(slots=True)
+class ZonFrameResult:
+    """The outcome of validating a pandas DataFrame or a pyarrow Table with `validate_frame`"""
+
+    mask: numpy.ndarray
+    """Whether each row of the frame is valid, by position."""
+    errors: dict[int, ZonError] = field(default_factory=dict)
+    """The errors of the invalid rows, by position."""
+    issues: list[ZonIssue] = field(default_factory=list)
+    """The issues of the frame as a whole, e.g. missing or unrecognized columns. If there are any, no row is valid."""
+
+    @property
+    def invalid(self) -> numpy.ndarray:
+        """The positions of the invalid rows"""
+
+        return _numpy().flatnonzero(~self.mask)
+
+    @property
+    def valid(self) -> bool:
+        """Whether the whole frame is valid"""
+        return not self.issues and bool(self.mask.all())
+
+    def table(self) -> pandas.DataFrame:
+        """Lists every issue as a row of a pandas DataFrame. Requires pandas.
+
+        Returns:
+            pandas.DataFrame: the issues, with `row`, `path`, `code`, `message` and `value` columns.
+            Issues of the frame as a whole have no row.
+        """
+
+        try:
+            import pandas  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "Issue tables require pandas, install it with `pip install zon[pandas]`"
+            ) from e
+
+        located = [(None, issue) for issue in self.issues] + [
+            (row, issue)
+            for row, error in sorted(self.errors.items())
+            for issue in error.issues
+        ]
+
+        return pandas.DataFrame(
+            {
+                "row": pandas.array([row for (row, _) in located], dtype="Int64"),
+                "path": [
+                    ".".join(str(key) for key in issue.path) for (_, issue) in located
+                ],
+                "code": [issue.code for (_, issue) in located],
+                "message": [issue.message for (_, issue) in located],
+                "value": pandas.array(
+                    [issue.value for (_, issue) in located], dtype=object
+                ),
+            }
+        )
+
+
+def validate_frame(zon: ZonRecord, frame: Any) -> ZonFrameResult:
+    """Validates every row of a pandas DataFrame or a pyarrow Table against `zon`, column by column.
+
+    Args:
+        zon (ZonRecord): the Zon to validate each row with.
+        frame (pandas.DataFrame | pyarrow.Table | pyarrow.RecordBatch): the frame to validate.
+
+    Returns:
+        ZonFrameResult: which rows are valid, their errors and the issues of the frame itself.
+
+    Raises:
+        TypeError: if the frame is neither a pandas DataFrame nor a pyarrow Table.
+    """
+
+    (names, count, column_of) = _frame_columns(frame)
+
+    result = ZonFrameResult(_numpy().ones(count, dtype=bool))
+    issues: dict[int, list[ZonIssue]] = {}
+    # None values are only removed from the rows if the rows are built
+    changes: dict[int, dict[str, Any]] | None = {} if zon.validators else None
+
+    result.issues.extend(_validate_columns(zon, names, column_of, issues, changes))
+
+    if result.issues:
+        result.mask[:] = False
+    elif zon.validators:
+        # the rules of the record need the validated rows, built one at a time
+        columns = {name: _plain(column_of(name)) for name in names}
+
+        for index, record in enumerate(_records(zon, None, columns, count, changes)):
+            if index in issues:
+                continue
+
+            (valid, record_or_error) = _check_rules(zon, record)
+
+            if not valid:
+                issues[index] = record_or_error.issues
+
+    for index, row_issues in sorted(issues.items()):
+        error = ZonError()
+        error.add_issues(row_issues)
+
+        result.errors[index] = error
+
+    result.mask[list(result.errors)] = False
+
+    return result
+
+
+def _validate_columns(
+    zon: ZonRecord,
+    names: list[str],
+    column_of: Callable[[str], Any],
+    issues: dict[int, list[ZonIssue]],
+    changes: dict[int, dict[str, Any]] | None,
+) -> list[ZonIssue]:
+    """Validates every column of a frame, adding the issues and changes of each row.
+
+    Returns:
+        list[ZonIssue]: the issues of the frame as a whole.
+    """
+
+    # pylint: disable-next=import-outside-toplevel
+    from . import ZonRecord as _ZonRecord
+
+    frame_issues: list[ZonIssue] = []
+    present = set(names)
+
+    for key, shape_field in zon.shape.items():
+        if key in present:
+            _validate_field(key, shape_field, column_of(key), issues, changes)
+            continue
+
+        # a missing column is validated once, as a missing key would be in every row
+        (valid, error) = shape_field.safe_validate(None)
+
+        if not valid:
+            frame_issues.extend(issue.at([key]) for issue in error.issues)
+
+    extra = [name for name in names if name not in zon.shape]
+    catchall = zon._catchall
+
+    if extra and catchall is not None:
+        for name in extra:
+            _validate_field(name, catchall, column_of(name), issues, changes)
+    elif extra and zon.unknown_key_policy == _ZonRecord.UnknownKeyPolicy.STRICT:
+        keys = set(extra)
+
+        frame_issues.append(
+            ZonIssue(
+                value=keys, code="unrecognized_keys", params={"keys": keys}, path=[]
+            )
+        )
+
+    return frame_issues
+
+
+def _frame_columns(frame: Any) -> tuple[list[str], int, Callable[[str], Any]]:
+    """The column names of a frame, its number of rows and how to get each of its columns"""
+
+    pa = sys.modules.get("pyarrow")
+    pd = sys.modules.get("pandas")
+
+    if pa is not None and isinstance(frame, (pa.Table, pa.RecordBatch)):
+        return (
+            list(frame.column_names),
+            frame.num_rows,
+            lambda name: _arrow_column(frame.column(name)),
+        )
+
+    if pd is not None and isinstance(frame, pd.DataFrame):
+        return (
+            list(frame.columns),
+            len(frame),
+            lambda name: _pandas_column(frame[name]),
+        )
+
+    raise TypeError(
+        f"Expected a pandas DataFrame or a pyarrow Table, got {type(frame).__name__}"
+    )
+
+
+def _pandas_column(series: Any) -> Any:
+    """The values of a pandas Series, as a NumPy array (without copying it, if possible) or a list"""
+
+    nulls = series.isna().to_numpy()
+
+    if nulls.any():
+        # missing values are validated as None, like missing keys
+        values = series.to_numpy(dtype=object)
+        values[nulls] = None
+
+        return values.tolist()
+
+    return series.to_numpy()
+
+
+def _arrow_column(column: Any) -> Any:
+    """The values of a pyarrow array, as a NumPy array (without copying it, if possible) or a list"""
+
+    if column.null_count:
+        # missing values are validated as None, like missing keys
+        return column.to_pylist()
+
+    return column.to_numpy(zero_copy_only=False)
+
+
+def _plain(column: Any) -> list[Any]:
+    return column if isinstance(column, list) else column.tolist()
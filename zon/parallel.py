@@ -0,0 +1,463 @@
+"""Parallel validation of batches of data, over a pool of worker processes"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import mmap
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .error import ZonError
+from .streams import json_error
+
+if TYPE_CHECKING:
+    from . import CopyStrategy, Zon, ZonBatchResult
+
+T = TypeVar("T")
+
+_worker_zon: Zon | None = None
+"""The Zon that worker processes validate data with, set once when they start."""
+
+
+def _init_worker(zon: Zon):
+    global _worker_zon  # pylint: disable=global-statement
+
+    _worker_zon = zon
+
+
+def _validate_chunk(
+    chunk: list[Any],
+    copy_strategy: CopyStrategy,
+    abort_early: bool,
+    max_issues: int | None,
+    max_failures: int | None,
+) -> ZonBatchResult:
+    return _worker_zon.safe_validate_many(
+        chunk,
+        copy=copy_strategy,
+        abort_early=abort_early,
+        max_issues=max_issues,
+        max_failures=max_failures,
+    )
+
+
+def _time_chunk(
+    chunk: list[Any], abort_early: bool, max_issues: int | None
+) -> tuple[list[int], dict[int, ZonError]]:
+    return time_records(_worker_zon, chunk, abort_early, max_issues)
+
+
+def time_records(
+    zon: Zon, data: Iterable[Any], abort_early: bool, max_issues: int | None
+) -> tuple[list[int], dict[int, ZonError]]:
+    """Validates each piece of data with `zon`, timing each validation.
+
+    Returns:
+        tuple[list[int], dict[int, ZonError]]: how long each validation took, in nanoseconds,
+        and the errors of the invalid data, by index.
+    """
+
+    from . import _shared_runner  # pylint: disable=import-outside-toplevel
+
+    validate = _shared_runner(zon._compile(), "none", abort_early, max_issues)
+    latencies = []
+    errors = {}
+
+    for index, item in enumerate(data):
+        start = time.perf_counter_ns()
+        (valid, data_or_error) = validate(item)
+        latencies.append(time.perf_counter_ns() - start)
+
+        if not valid:
+            errors[index] = data_or_error
+
+    return (latencies, errors)
+
+
+def time_chunks(
+    zon: Zon,
+    chunks: Iterable[list[Any]],
+    workers: int | None,
+    abort_early: bool,
+    max_issues: int | None,
+) -> Iterator[tuple[list[int], dict[int, ZonError]]]:
+    """Validates each chunk of data with `zon` like `time_records` does, yielding the results in order.
+
+    Args:
+        zon (Zon): the Zon to validate the data with. It must be picklable if `workers` is given.
+        chunks (Iterable[list[Any]]): the chunks of data.
+        workers (int, optional): how many worker processes to validate the chunks with.
+        By default, they are validated in the current process.
+        abort_early (bool): whether to stop validating each piece of data as soon as its first issue is found.
+        max_issues (int, optional): how many issues to collect for each piece of data.
+
+    Returns:
+        Iterator[tuple[list[int], dict[int, ZonError]]]: the latencies and the errors of each chunk.
+    """
+
+    if workers is None:
+        return (time_records(zon, chunk, abort_early, max_issues) for chunk in chunks)
+
+    return map_chunks(zon, _time_chunk, chunks, workers, abort_early, max_issues)
+
+
+def map_chunks(
+    zon: Zon, function: Callable[..., T], chunks: Iterable[Any], workers: int, *args
+) -> Iterator[T]:
+    """Calls `function(chunk, *args)` for each chunk in a pool of worker processes, yielding the results in order.
+
+    The Zon is sent to each worker once, as `_worker_zon`. Only a few chunks per worker are in flight at a time.
+    """
+
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    chunks = iter(chunks)
+    pending: deque[Future[T]] = deque()
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(zon,)
+    ) as executor:
+        for chunk in itertools.islice(chunks, workers * 2):
+            pending.append(executor.submit(function, chunk, *args))
+
+        while pending:
+            result = pending.popleft().result()
+
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(executor.submit(function, chunk, *args))
+
+            yield result
+
+
+def _chunks(data: Iterable[Any], chunksize: int) -> Iterator[list[Any]]:
+    iterator = iter(data)
+
+    while chunk := list(itertools.islice(iterator, chunksize)):
+        yield chunk
+
+
+def validate_many(
+    zon: Zon,
+    data: Iterable[Any],
+    *,
+    workers: int,
+    chunksize: int,
+    copy_strategy: CopyStrategy,
+    abort_early: bool,
+    max_issues: int | None,
+    max_failures: int | None,
+) -> ZonBatchResult:
+    """Validates a batch of data with `zon`, in chunks spread over a pool of worker processes.
+
+    The Zon is sent to each worker once. Only a few chunks per worker are in flight at a time,
+    so the batch is never fully materialized.
+
+    Returns:
+        ZonBatchResult: the validated data and the errors of the invalid data, in the order of the batch.
+    """
+
+    from . import ZonBatchResult  # pylint: disable=import-outside-toplevel
+
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+
+    result = ZonBatchResult([], {})
+    chunks = _chunks(data, chunksize)
+    pending: deque[Future[ZonBatchResult]] = deque()
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(zon,)
+    ) as executor:
+
+        def _submit() -> bool:
+            chunk = next(chunks, None)
+
+            if chunk is None:
+                return False
+
+            remaining_failures = (
+                None if max_failures is None else max_failures - len(result.errors)
+            )
+
+            pending.append(
+                executor.submit(
+                    _validate_chunk,
+                    chunk,
+                    copy_strategy,
+                    abort_early,
+                    max_issues,
+                    remaining_failures,
+                )
+            )
+
+            return True
+
+        for _ in range(workers * 2):
+            if not _submit():
+                break
+
+        while pending:
+            chunk_result = pending.popleft().result()
+
+            if _merge(result, chunk_result, max_failures):
+                for future in pending:
+                    future.cancel()
+
+                break
+
+            _submit()
+
+    return result
+
+
+def _merge(
+    result: ZonBatchResult, chunk_result: ZonBatchResult, max_failures: int | None
+) -> bool:
+    """Appends the result of a chunk to the result of the batch.
+
+    Returns:
+        bool: whether the batch must stop, because too many pieces of data were invalid.
+    """
+
+    offset = len(result.values)
+    values = chunk_result.values
+    errors = list(chunk_result.errors.items())
+
+    stopped = False
+    if max_failures is not None:
+        remaining_failures = max_failures - len(result.errors)
+
+        if len(errors) >= remaining_failures:
+            # chunks are validated ahead of time, so this one may have gone past the limit
+            errors = errors[:remaining_failures]
+            values = values[: errors[-1][0] + 1]
+            stopped = True
+
+    result.values.extend(values)
+    for index, error in errors:
+        result.errors[offset + index] = error
+
+    result.stopped = stopped
+
+    return stopped
+
+
+@dataclass(slots=True)
+class ZonJsonlReport:
+    """The outcome of validating a file of line-delimited JSON values with `validate_jsonl`"""
+
+    total: int = 0
+    """How many values (non-blank lines) were validated."""
+    valid: int = 0
+    """How many values were valid."""
+    invalid: int = 0
+    """How many values were invalid, including lines that are not valid JSON."""
+    failures: list[tuple[int, ZonError]] = field(default_factory=list)
+    """The first failures, as (line number, starting at 1, error) pairs, in file order."""
+    bytes: int = 0
+    """The size of the file."""
+    seconds: float = 0.0
+    """How long validation took."""
+
+    @property
+    def records_per_second(self) -> float:
+        """How many values were validated per second"""
+        return self.total / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """How many bytes were validated per second"""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass(slots=True)
+class _RangeReport:
+    lines: int = 0
+    total: int = 0
+    valid: int = 0
+    invalid: int = 0
+    failures: list[tuple[int, ZonError]] = field(default_factory=list)
+    """The first failures in the range, by line number relative to the start of the range, starting at 0."""
+
+
+def validate_jsonl(
+    path: str | os.PathLike,
+    zon: Zon,
+    workers: int | None = None,
+    *,
+    abort_early: bool = False,
+    max_issues: int | None = None,
+    report_failures: int = 10,
+) -> ZonJsonlReport:
+    """Validates every line of a file of line-delimited JSON values against `zon`.
+
+    The file is memory-mapped and split into byte ranges on line boundaries. Each worker process
+    maps the file on its own and decodes and validates its ranges in place, so no data goes through
+    the parent process. Blank lines are skipped.
+
+    Args:
+        path (str | os.PathLike): the path of the file.
+        zon (Zon): the Zon to validate each value with. It must be picklable if `workers` is given.
+        workers (int, optional): how many worker processes to validate the file with.
+        By default, the file is validated in the current process.
+        abort_early (bool): whether to stop validating each value as soon as its first issue is found.
+        max_issues (int, optional): how many issues to collect for each value.
+        report_failures (int): how many failures to report, in file order.
+
+    Returns:
+        ZonJsonlReport: how many values were valid and invalid, the first failures and the throughput.
+    """
+
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    start_time = time.perf_counter()
+
+    size = os.path.getsize(path)
+    options = {
+        "abort_early": abort_early,
+        "max_issues": max_issues,
+        "report_failures": report_failures,
+    }
+
+    if size == 0:
+        range_reports = []
+    elif workers is None:
+        range_reports = [_validate_range(zon, path, 0, size, **options)]
+    else:
+        # a few ranges per worker, so that uneven ranges are balanced out
+        ranges = _line_ranges(path, size, workers * 4)
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(zon,)
+        ) as executor:
+            futures = [
+                executor.submit(_validate_worker_range, path, start, end, **options)
+                for (start, end) in ranges
+            ]
+
+            range_reports = [future.result() for future in futures]
+
+    report = ZonJsonlReport(bytes=size)
+    line_offset = 0
+
+    for range_report in range_reports:
+        report.total += range_report.total
+        report.valid += range_report.valid
+        report.invalid += range_report.invalid
+
+        for line, error in range_report.failures:
+            if len(report.failures) < report_failures:
+                report.failures.append((line_offset + line + 1, error))
+
+        line_offset += range_report.lines
+
+    report.seconds = time.perf_counter() - start_time
+
+    return report
+
+
+def _line_ranges(
+    path: str | os.PathLike, size: int, count: int
+) -> list[tuple[int, int]]:
+    """Splits a file into (at most) `count` byte ranges that start and end on line boundaries"""
+
+    with (
+        open(path, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        ranges = []
+        start = 0
+
+        for i in range(1, count + 1):
+            if start >= size:
+                break
+
+            end = size if i == count else max(size * i // count, start)
+            newline = mapped.find(b"\n", end)
+            end = size if newline == -1 else newline + 1
+
+            ranges.append((start, end))
+            start = end
+
+        return ranges
+
+
+def _validate_worker_range(
+    path: str | os.PathLike,
+    start: int,
+    end: int,
+    **options,
+) -> _RangeReport:
+    return _validate_range(_worker_zon, path, start, end, **options)
+
+
+def _validate_range(
+    zon: Zon,
+    path: str | os.PathLike,
+    start: int,
+    end: int,
+    *,
+    abort_early: bool,
+    max_issues: int | None,
+    report_failures: int,
+) -> _RangeReport:
+    """Decodes and validates the lines of a file between the `start` and `end` byte offsets"""
+
+    from . import _shared_runner  # pylint: disable=import-outside-toplevel
+
+    # the decoded data is not shared with anyone, so it does not need to be copied
+    validate = _shared_runner(zon._compile(), "none", abort_early, max_issues)
+    report = _RangeReport()
+
+    with (
+        open(path, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        position = start
+
+        while position < end:
+            line_end = mapped.find(b"\n", position, end)
+            if line_end == -1:
+                line_end = end
+
+            line = mapped[position:line_end]
+            position = line_end + 1
+            report.lines += 1
+
+            if not line.strip():
+                continue
+
+            report.total += 1
+
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                (valid, data_or_error) = (
+                    False,
+                    json_error(line.decode(errors="replace"), e),
+                )
+            else:
+                (valid, data_or_error) = validate(data)
+
+            if valid:
+                report.valid += 1
+                continue
+
+            report.invalid += 1
+
+            if len(report.failures) < report_failures:
+                report.failures.append((report.lines - 1, data_or_error))
+
+    return report
@@ -0,0 +1,67 @@
+"""Adapters that turn common streaming formats into iterables of data to validate"""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Iterator
+from typing import IO, Any
+
+from .error import ZonError, ZonIssue
+
+
+def jsonl_rows(file: IO[str] | IO[bytes]) -> Iterator[Any]:
+    """Lazily decodes a file of line-delimited JSON values. Blank lines are skipped.
+
+    Lines that are not valid JSON do not stop the stream: a ZonError with an `invalid_json` issue
+    is yielded in their place, which `Zon.validate_iter` reports as invalid data.
+
+    Args:
+        file (IO): the file object to read from, opened in text or binary mode.
+
+    Yields:
+        Any | ZonError: the decoded values, or the errors of the malformed lines.
+    """
+
+    for line in file:
+        if not line.strip():
+            continue
+
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            text = line.decode(errors="replace") if isinstance(line, bytes) else line
+            yield json_error(text.rstrip(), e)
+
+
+def csv_rows(file: IO[str], **kwargs) -> Iterator[dict[str, str]]:
+    """Lazily reads the rows of a CSV file with a header, as dictionaries.
+
+    Args:
+        file (IO[str]): the file object to read from, opened with `newline=""`.
+        **kwargs: passed on to `csv.DictReader`.
+
+    Returns:
+        Iterator[dict[str, str]]: the rows of the file.
+    """
+
+    return iter(csv.DictReader(file, **kwargs))
+
+
+def json_error(text: str, exception: ValueError) -> ZonError:
+    """Builds the error of a piece of text that is not valid JSON.
+
+    Args:
+        text (str): the text that could not be decoded.
+        exception (ValueError): why it could not be decoded.
+
+    Returns:
+        ZonError: an error with a single `invalid_json` issue.
+    """
+
+    error = ZonError()
+    error.add_issue(
+        ZonIssue(value=text, code="invalid_json", params={"error": exception}, path=[])
+    )
+
+    return error
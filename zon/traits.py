@@ -13,6 +13,8 @@ class HasMax:
     Validation helper that indicates that the validation value has some attribute that must be upper-bound by some value
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def max(self, max_value: int | float) -> Self:
         """
@@ -30,6 +32,8 @@ class HasMin:
     Validation helper that indicates that the validation value has some attribute that must be lower-bound by some value
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def min(self, min_value: int | float) -> Self:
         """
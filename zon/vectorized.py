@@ -0,0 +1,341 @@
+"""Vectorized validation of NumPy arrays of numbers.
+
+NumPy is an optional dependency, only needed by `ZonNumber.validate_array` and `ZonList.validate_array`.
+"""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .error import ZonIssue
+
+if TYPE_CHECKING:
+    import numpy
+
+    from . import ValidationRule, ZonList, ZonNumber
+
+_NUMERIC_KINDS = "buif"
+"""The dtype kinds of arrays of numbers: booleans, integers and floats."""
+
+
+def _numpy():
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise ImportError(
+            "Validating arrays requires NumPy, install it with `pip install zon[numpy]`"
+        ) from e
+
+    return numpy
+
+
+@functools.cache
+def _numpy_or_none():
+    """NumPy, if it is installed: columns and buffers of numbers are validated with it if so"""
+
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    return numpy
+
+
+@dataclass(slots=True)
+class ZonArrayResult:
+    """The outcome of validating a NumPy array with `validate_array`"""
+
+    mask: numpy.ndarray
+    """Whether each element of the array is valid, with the shape of the array."""
+    failures: dict[str, numpy.ndarray] = field(default_factory=dict)
+    """The (flat) indices of the elements that failed each validation rule, by rule name."""
+    exceptions: dict[str, dict[int, Exception]] = field(default_factory=dict)
+    """The exceptions raised by the rules that failed with one, by rule name and (flat) index."""
+    issues: list[ZonIssue] = field(default_factory=list)
+    """The issues of the array as a whole, e.g. if it is too short for a `ZonList`."""
+
+    @property
+    def invalid(self) -> numpy.ndarray:
+        """The (flat) indices of the invalid elements"""
+        return _numpy().flatnonzero(~self.mask)
+
+    @property
+    def valid(self) -> bool:
+        """Whether the whole array is valid"""
+        return not self.issues and bool(self.mask.all())
+
+
+def _rule_mask(
+    np, rule: ValidationRule, array: numpy.ndarray, exceptions: dict[int, Exception]
+) -> numpy.ndarray:
+    """Evaluates a validation rule of a `ZonNumber` over a whole array.
+
+    The exceptions raised by the rule, if it is evaluated element by element, are added to `exceptions`.
+    """
+
+    # pylint: disable-next=import-outside-toplevel
+    from . import (
+        AsyncValidationRule,
+        _is_finite,
+        _is_float,
+        _is_gt,
+        _is_gte,
+        _is_int,
+        _is_lt,
+        _is_lte,
+        _is_multiple_of,
+    )
+
+    if isinstance(rule, AsyncValidationRule):
+        raise NotImplementedError(
+            f"Rule '{rule.name}' is async, and cannot validate arrays"
+        )
+
+    fn = rule.fn
+    (func, args) = (fn.func, fn.args) if isinstance(fn, functools.partial) else (fn, ())
+
+    comparisons = {
+        _is_gt: np.greater,
+        _is_gte: np.greater_equal,
+        _is_lt: np.less,
+        _is_lte: np.less_equal,
+    }
+
+    if func in comparisons:
+        return comparisons[func](array, *args)
+
+    # like `%`, a base of 0 raises for every element, which only the element-wise check reports
+    if func is _is_multiple_of and args[0] != 0:
+        return np.mod(array, *args) == 0
+
+    if func is _is_finite:
+        # like `math.isinf`, NaN is considered finite
+        return ~np.isinf(array)
+
+    # the elements of an array are all of the same type
+    if func is _is_int:
+        return np.full(array.shape, array.dtype.kind in "bui")
+
+    if func is _is_float:
+        return np.full(array.shape, array.dtype.kind == "f")
+
+    # not something we know how to vectorize, e.g. a refinement
+    return _elementwise_mask(np, rule, array, exceptions)
+
+
+def _elementwise_mask(
+    np, rule: ValidationRule, array: numpy.ndarray, exceptions: dict[int, Exception]
+) -> numpy.ndarray:
+    mask = np.ones(array.size, dtype=bool)
+
+    for index, value in enumerate(array.flat):
+        (valid, exception) = _check(rule, value.item())
+
+        if exception is not None:
+            exceptions[index] = exception
+
+        mask[index] = valid
+
+    return mask.reshape(array.shape)
+
+
+def _vectorizes(rule: ValidationRule) -> bool:
+    """Whether `_rule_mask` evaluates a rule with NumPy operations, instead of element by element"""
+
+    # pylint: disable-next=import-outside-toplevel
+    from . import (
+        _is_finite,
+        _is_float,
+        _is_gt,
+        _is_gte,
+        _is_int,
+        _is_lt,
+        _is_lte,
+        _is_multiple_of,
+    )
+
+    fn = rule.fn
+    (func, args) = (fn.func, fn.args) if isinstance(fn, functools.partial) else (fn, ())
+
+    if func is _is_multiple_of:
+        return args[0] != 0
+
+    return func in (
+        _is_gt,
+        _is_gte,
+        _is_lt,
+        _is_lte,
+        _is_finite,
+        _is_int,
+        _is_float,
+    )
+
+
+def _check(rule: ValidationRule, value: Any) -> tuple[bool, Exception | None]:
+    """Whether the value passes the rule, and the exception the rule raised if it did"""
+
+    try:
+        (_, valid) = rule.fn(value)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return (False, e)
+
+    return (bool(valid), None)
+
+
+def validate_number_array(zon: ZonNumber, array: Any) -> ZonArrayResult:
+    """Validates every element of a NumPy array of numbers against `zon`, with vectorized operations.
+
+    Args:
+        zon (ZonNumber): the Zon to validate each element with.
+        array (ArrayLike): the array to validate.
+
+    Returns:
+        ZonArrayResult: which elements are valid, and which rules the others failed.
+
+    Raises:
+        TypeError: if the array does not hold numbers.
+    """
+
+    np = _numpy()
+    array = np.asarray(array)
+
+    if array.dtype.kind not in _NUMERIC_KINDS:
+        raise TypeError(f"Expected an array of numbers, got dtype {array.dtype}")
+
+    mask = np.ones(array.shape, dtype=bool)
+    result = ZonArrayResult(mask)
+
+    for rule in zon.validators:
+        exceptions: dict[int, Exception] = {}
+        rule_mask = _rule_mask(np, rule, array, exceptions)
+
+        if exceptions:
+            result.exceptions.setdefault(rule.name, {}).update(exceptions)
+
+        if not rule_mask.all():
+            failed = np.flatnonzero(~rule_mask)
+
+            if rule.name in result.failures:
+                # e.g. two refinements with the same message
+                failed = np.union1d(result.failures[rule.name], failed)
+
+            result.failures[rule.name] = failed
+
+        mask &= rule_mask
+
+    return result
+
+
+def buffer_failures(zon: ZonNumber, view: memoryview) -> list[tuple[int, str]] | None:
+    """Evaluates the rules of `zon` over a buffer of numbers with NumPy, without copying it.
+
+    Returns:
+        list[tuple[int, str]] | None: the failures, as (index, rule name) pairs in order,
+        or `None` if NumPy is not installed or cannot evaluate the rules.
+    """
+
+    np = _numpy_or_none()
+
+    if np is None or not all(_vectorizes(rule) for rule in zon.validators):
+        return None
+
+    try:
+        array = np.asarray(view)
+    except (TypeError, ValueError):
+        return None
+
+    if array.dtype.kind not in _NUMERIC_KINDS:
+        return None
+
+    failures = [
+        (index, rule)
+        for rule, failed in validate_number_array(zon, array).failures.items()
+        for index in failed.tolist()
+    ]
+    # the rules of each element are in order, like in `ZonNumber`
+    failures.sort(key=lambda failure: failure[0])
+
+    return failures
+
+
+def validate_list_array(zon: ZonList, array: Any) -> ZonArrayResult:
+    """Validates a one-dimensional NumPy array against a `ZonList` of `ZonNumber`s, with vectorized operations.
+
+    The rules of the list itself (e.g. `min`, `max` or `nonempty`) are checked against the whole array.
+
+    Args:
+        zon (ZonList): the Zon to validate the array with.
+        array (ArrayLike): the array to validate.
+
+    Returns:
+        ZonArrayResult: which elements are valid, which rules the others failed and the issues of the array itself.
+
+    Raises:
+        TypeError: if the array does not hold numbers, or the elements of the list are not `ZonNumber`s.
+        ValueError: if the array is not one-dimensional.
+    """
+
+    from . import (  # pylint: disable=import-outside-toplevel
+        ValidationContext,
+        ZonNumber,
+    )
+
+    if not isinstance(zon.element, ZonNumber):
+        raise TypeError(
+            f"Only lists of numbers can validate arrays, got a list of {type(zon.element).__name__}"
+        )
+
+    np = _numpy()
+    array = np.asarray(array)
+
+    if array.ndim != 1:
+        raise ValueError(
+            f"Expected a one-dimensional array, got {array.ndim} dimensions"
+        )
+
+    result = validate_number_array(zon.element, array)
+
+    for rule in zon.validators:
+        (valid, exception) = _check(rule, array)
+
+        if exception is not None:
+            result.issues.append(
+                ZonIssue(
+                    value=array,
+                    code="failed_rule_with_exception",
+                    params={"rule": rule.name, "exception": exception},
+                    path=[],
+                )
+            )
+        elif not valid:
+            result.issues.append(
+                ZonIssue(
+                    value=array, code="failed_rule", params={"rule": rule.name}, path=[]
+                )
+            )
+
+    if zon._batch_rules:
+        ctx = ValidationContext()
+        candidates = [
+            (int(index), array[index].item()) for index in np.flatnonzero(result.mask)
+        ]
+
+        for rule in zon._batch_rules:
+            rule.check_batch(candidates, ctx)
+
+        for issue in ctx.error.issues if ctx.error is not None else ():
+            if not issue.path:
+                result.issues.append(issue)
+                continue
+
+            # elements that failed a batch rule are reported at their index
+            index = issue.path[0]
+            result.mask[index] = False
+            result.failures[issue.params["rule"]] = np.union1d(
+                result.failures.get(issue.params["rule"], np.empty(0, dtype=np.intp)),
+                [index],
+            )
+
+    return result